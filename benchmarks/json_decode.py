@@ -0,0 +1,83 @@
+"""Compare the stdlib JSON decode path with the single orjson decode.
+
+Before ``read_json``, every JSON response was decoded twice with the stdlib
+``json`` module (once in ``AuthedSession.request`` to validate it, once when
+``json_request`` read it). This measures both paths on page fixtures.
+
+Usage:
+    python benchmarks/json_decode.py [fixture.json ...] [--number N]
+
+Pass recorded API pages (raw response bodies) as fixtures. Without any, a
+synthetic OnlyFans posts page is used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+from typing import Any
+
+from ultima_scraper_api.helpers.json_helper import loads
+
+
+def synthetic_posts_page(count: int = 50) -> bytes:
+    media = {
+        "id": 1,
+        "type": "video",
+        "canView": True,
+        "createdAt": "2024-01-01T00:00:00+00:00",
+        "files": {
+            "full": {"url": "https://cdn.example.com/full.mp4", "width": 1920},
+            "thumb": {"url": "https://cdn.example.com/thumb.jpg", "width": 300},
+            "preview": {"url": "https://cdn.example.com/preview.jpg", "width": 960},
+        },
+        "videoSources": {"720": "https://cdn.example.com/720.mp4", "240": None},
+    }
+    posts: list[dict[str, Any]] = [
+        {
+            "id": post_id,
+            "responseType": "post",
+            "text": "Lorem ipsum dolor sit amet " * 8,
+            "rawText": "Lorem ipsum dolor sit amet " * 8,
+            "postedAt": "2024-01-01T00:00:00+00:00",
+            "postedAtPrecise": "1704067200.000000",
+            "price": 0,
+            "isPinned": False,
+            "mediaCount": 3,
+            "media": [{**media, "id": post_id * 10 + i} for i in range(3)],
+            "author": {"id": 1, "_view": "m"},
+        }
+        for post_id in range(count)
+    ]
+    return json.dumps({"list": posts, "hasMore": True, "tailMarker": "1"}).encode()
+
+
+def stdlib_twice(body: bytes) -> Any:
+    json.loads(body.decode("utf-8"))
+    return json.loads(body.decode("utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="*", type=Path)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    fixtures = {path.name: path.read_bytes() for path in args.fixtures}
+    if not fixtures:
+        fixtures = {"synthetic posts page": synthetic_posts_page()}
+
+    for name, body in fixtures.items():
+        assert stdlib_twice(body) == loads(body)
+        baseline = timeit.timeit(lambda: stdlib_twice(body), number=args.number)
+        single = timeit.timeit(lambda: loads(body), number=args.number)
+        print(f"{name} ({len(body) / 1024:.1f} KiB, {args.number} runs)")
+        print(f"  stdlib json, decoded twice: {baseline * 1000:8.1f} ms")
+        print(f"  orjson, decoded once:       {single * 1000:8.1f} ms")
+        print(f"  speedup: {baseline / single:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
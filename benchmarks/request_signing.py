@@ -0,0 +1,119 @@
+"""Compare signing every API request from scratch with ``RequestSigner``.
+
+Before ``RequestSigner``, every OnlyFans API request rebuilt the cookie string,
+re-hashed ``static_param`` and parsed the URL twice. This signs the same links
+both ways, checks the headers are identical and times them.
+
+Usage:
+    python benchmarks/request_signing.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+import timeit
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import urlparse
+
+from ultima_scraper_api.apis.onlyfans.authenticator import RequestSigner
+from ultima_scraper_api.apis.onlyfans.classes.extras import AuthDetails
+from ultima_scraper_api.apis.onlyfans.onlyfans import DynamicRulesModel
+
+RULES = {
+    "static_param": "Tw8iJ2c9yP3sR7uQmV0xKdLa5NbEhGfZ",
+    "format": "51524:{}:{:x}:66c8b3d2",
+    "checksum_indexes": [0, 4, 5, 8, 9, 12, 14, 17, 19, 21, 25, 27, 30, 33, 37, 39],
+    "checksum_constants": [],
+    "checksum_constant": 1371,
+    "app_token": "33d57ade8c02dbc5a333db99ff9ae26a",
+    "remove_headers": ["user_id"],
+}
+COOKIE = (
+    "auth_id=123456; sess=abcdef0123456789; auth_hash=; auth_uniq_=; "
+    "auth_uid_=; aws-waf-token=token"
+)
+LINKS = [
+    "https://onlyfans.com/api2/v2/users/me",
+    "https://onlyfans.com/api2/v2/users/123/posts?limit=50&order=publish_date_desc"
+    "&skip_users=all&counters=0&format=infinite&offset=100",
+    "https://onlyfans.com/api2/v2/chats/123/messages?limit=100&order=desc&id=999",
+]
+
+
+def legacy_headers(authenticator: Any, link: str, time_: int) -> dict[str, Any]:
+    dynamic_rules = authenticator.api.dynamic_rules
+    headers = authenticator.auth_session.headers.copy()
+    headers["app-token"] = dynamic_rules.app_token
+    # What CookieParser.convert() did on every call
+    cookie_parser = authenticator.auth_details.cookie
+    cookie = ""
+    for key, value in cookie_parser.__dict__.items():
+        key = key.replace("auth_uniq_", f"auth_uniq_{cookie_parser.auth_id}")
+        key = key.replace("auth_uid_", f"auth_uid_{cookie_parser.auth_id}")
+        key = key.replace("aws_waf_token", "aws-waf-token")
+        cookie += f"{key}={value}; "
+    headers["cookie"] = cookie.strip()
+    signed: dict[str, Any] = {}
+    final_time = str(int(round(time.time()))) if not time_ else str(time_)
+    path = urlparse(link).path
+    query = urlparse(link).query
+    auth_id = 0
+    if query:
+        auth_id = authenticator.auth_details.id
+        signed["user-id"] = str(auth_id)
+    path = path if not query else f"{path}?{query}"
+    message = "\n".join([dynamic_rules.static_param, final_time, path, str(auth_id)])
+    sha_1_sign = hashlib.sha1(message.encode("utf-8")).hexdigest()
+    sha_1_b = sha_1_sign.encode("ascii")
+    checksum = (
+        sum([sha_1_b[number] for number in dynamic_rules.checksum_indexes])
+        + dynamic_rules.checksum_constant
+    )
+    signed["sign"] = dynamic_rules.format.format(sha_1_sign, abs(checksum))
+    signed["time"] = final_time
+    headers |= signed
+    return headers
+
+
+def cached_headers(signer: RequestSigner, link: str, time_: int) -> dict[str, Any]:
+    headers = signer.api_headers()
+    headers |= signer.sign(link, 0, time_)
+    return headers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    authenticator: Any = SimpleNamespace(
+        api=SimpleNamespace(dynamic_rules=DynamicRulesModel(RULES)),
+        auth_details=AuthDetails(id=123456, cookie=COOKIE),
+        auth_session=SimpleNamespace(
+            headers={"user-agent": "Mozilla/5.0", "x-bc": "0" * 40}
+        ),
+    )
+    signer = RequestSigner(authenticator)
+    now = int(time.time())
+
+    for link in LINKS:
+        assert legacy_headers(authenticator, link, now) == cached_headers(
+            signer, link, now
+        )
+        baseline = timeit.timeit(
+            lambda: legacy_headers(authenticator, link, now), number=args.number
+        )
+        cached = timeit.timeit(
+            lambda: cached_headers(signer, link, now), number=args.number
+        )
+        print(f"{urlparse(link).path} ({args.number} requests)")
+        print(f"  signed from scratch: {baseline * 1000:8.1f} ms")
+        print(f"  RequestSigner:       {cached * 1000:8.1f} ms")
+        print(f"  speedup: {baseline / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
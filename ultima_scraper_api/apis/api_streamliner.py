@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import platform
 from typing import TYPE_CHECKING, TypeVar
 
@@ -8,6 +9,8 @@ from ultima_scraper_api.apis import api_helper
 from ultima_scraper_api.config import UltimaScraperAPIConfig
 
 if TYPE_CHECKING:
+    from ultima_scraper_api.managers.watermark_manager import WatermarkStore
+
     api_types = ultima_scraper_api.api_types
     auth_types = ultima_scraper_api.auth_types
 
@@ -65,10 +68,18 @@ class StreamlinedAPI:
 
         self.job_manager = JobManager()
         self.session_manager = SessionManager(
-            self.api, proxies=self.config.settings.network.proxies
+            self.api,
+            proxies=self.config.settings.network.proxies,
+            concurrency=self.config.settings.network.concurrency,
+            rate_limit=self.config.settings.network.rate_limit,
+            response_cache=self.config.settings.network.response_cache,
+            metrics=self.config.settings.network.metrics,
+            proxy_pool=self.config.settings.network.proxy_pool,
+            proxy_fallback=self.config.settings.network.proxy_fallback,
         )
         self.packages = Packages(self.api.site_name)
         self.system = platform.system()
+        self.watermark_store: WatermarkStore | None = None
 
     def add_auth(
         self,
@@ -86,6 +97,24 @@ class StreamlinedAPI:
     def get_global_settings(self):
         return self.config.settings
 
+    def get_watermark_store(self) -> WatermarkStore:
+        # Created on first use so Redis can be connected after the API is built
+        if not self.watermark_store:
+            from ultima_scraper_api.managers.watermark_manager import (
+                create_watermark_store,
+            )
+
+            self.watermark_store = create_watermark_store(
+                self.config.settings.watermarks, self.api.site_name
+            )
+        return self.watermark_store
+
     async def close_pools(self):
         for _identifier, auth in self.api.auths.items():
-            await auth.auth_session.active_session.close()  # type: ignore
+            await auth.auth_session.close()  # type: ignore
+        await self.session_manager.proxy_manager.close()
+        await self.session_manager.metrics.stop()
+        response_cache = self.session_manager.response_cache
+        if response_cache is not None:
+            self.session_manager.response_cache = None
+            await asyncio.to_thread(response_cache.close)
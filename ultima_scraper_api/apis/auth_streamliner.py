@@ -35,6 +35,7 @@ class Cache:
         self.mass_message_stats = CacheStats()
         self.mass_messages = CacheStats()
         self.subscriptions = CacheStats()
+        self.message_groups = CacheStats(600)
         user_data: dict[int | str, CacheStats] = {}
         self.data: dict[str, dict[int | str, CacheStats]] = {"users": user_data}
 
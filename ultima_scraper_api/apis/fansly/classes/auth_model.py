@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import product
 from typing import TYPE_CHECKING, Any, Dict
 
@@ -10,11 +10,19 @@ from dateutil.relativedelta import relativedelta
 from ultima_scraper_api.apis import api_helper
 from ultima_scraper_api.apis.auth_streamliner import StreamlinedAuth
 from ultima_scraper_api.apis.fansly import SubscriptionType
-from ultima_scraper_api.apis.fansly.classes.extras import endpoint_links
+from ultima_scraper_api.apis.fansly.classes.extras import (
+    AggregationIndex,
+    ErrorDetails,
+    endpoint_links,
+)
 from ultima_scraper_api.apis.fansly.classes.message_model import MessageModel
 from ultima_scraper_api.apis.fansly.classes.post_model import PostModel
 from ultima_scraper_api.apis.fansly.classes.subscription_model import SubscriptionModel
 from ultima_scraper_api.apis.fansly.classes.user_model import UserModel
+from ultima_scraper_api.managers.registry_manager import (
+    BoundedRegistry,
+    create_registry,
+)
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.fansly.authenticator import FanslyAuthenticator
@@ -22,6 +30,9 @@ if TYPE_CHECKING:
     from ultima_scraper_api.apis.fansly.fansly import FanslyAPI
     from ultima_scraper_api.apis.onlyfans.classes.only_drm import OnlyDRM
 
+# A user missing from the cached message groups refetches them, at most this often
+MESSAGE_GROUPS_MIN_AGE = timedelta(seconds=30)
+
 
 class FanslyAuthModel(
     StreamlinedAuth["FanslyAuthenticator", "FanslyAPI", "AuthDetails"]
@@ -31,7 +42,10 @@ class FanslyAuthModel(
         authenticator: FanslyAuthenticator,
     ) -> None:
         self.api = authenticator.api
-        self.users: dict[int, UserModel] = {}
+        registry_settings = self.api.config.settings.registry
+        self.users: BoundedRegistry[int, UserModel] = create_registry(
+            registry_settings, registry_settings.max_users
+        )
         super().__init__(authenticator)
         self.user = authenticator.create_user(self)
         self.id = self.user.id
@@ -44,6 +58,9 @@ class FanslyAuthModel(
         self.mass_messages = []
         self.paid_content: list[MessageModel | PostModel] = []
         self.extras: dict[str, Any] = {}
+        # User id -> id of the message group shared with them
+        self.message_groups: dict[int, int] = {}
+        self.message_groups_lock = asyncio.Lock()
         self.blacklist: list[str] = []
         self.guest = self.authenticator.guest
         self.drm: OnlyDRM | None = None
@@ -271,19 +288,15 @@ class FanslyAuthModel(
             )
             final_results = api_helper.merge_dictionaries([final_results, results2])
         if depth == 1:
-            aggregationData = final_results["aggregationData"]
+            index = AggregationIndex(final_results["aggregationData"])
             for result in final_results["data"]:
-                for account in aggregationData["accounts"]:
-                    if result["partnerAccountId"] == account["id"]:
-                        result["withUser"] = UserModel(account, self)
-                for group in aggregationData["groups"]:
-                    found_user = [
-                        x
-                        for x in group["users"]
-                        if x["userId"] == result["partnerAccountId"]
-                    ]
+                partner_id = result["partnerAccountId"]
+                account = index.accounts.get(partner_id)
+                if account:
+                    result["withUser"] = UserModel(account, self)
+                for group in index.groups_by_user.get(partner_id, []):
                     last_message = group.get("lastMessage")
-                    if found_user and last_message:
+                    if last_message:
                         result["lastMessage"] = MessageModel(
                             last_message, result["withUser"]
                         )
@@ -292,6 +305,32 @@ class FanslyAuthModel(
         self.chats = final_results
         return final_results
 
+    async def get_message_group_id(self, user_id: int) -> int | None:
+        """Return the id of the message group shared with a user.
+
+        One groups request maps every user to their group, the mapping is
+        reused until ``cache.message_groups`` expires. A user missing from it
+        may have started a conversation since, so a miss refetches the groups
+        unless they're less than ``MESSAGE_GROUPS_MIN_AGE`` old.
+        """
+        async with self.message_groups_lock:
+            cache = self.cache.message_groups
+            refresh = cache.is_released()
+            if not refresh and user_id not in self.message_groups:
+                assert cache.processed_at
+                refresh = datetime.now() - cache.processed_at >= MESSAGE_GROUPS_MIN_AGE
+            if refresh:
+                groups = await self.user.get_groups()
+                if isinstance(groups, ErrorDetails):
+                    return None
+                self.message_groups = {
+                    int(user["userId"]): int(user["groupId"])
+                    for group in groups["groups"]
+                    for user in group["users"]
+                }
+                cache.activate()
+        return self.message_groups.get(user_id)
+
     async def get_paid_content(
         self,
         performer_id: int | str | None = None,
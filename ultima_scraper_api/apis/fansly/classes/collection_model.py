@@ -4,7 +4,10 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from ultima_scraper_api.apis.fansly import SiteContent
-from ultima_scraper_api.apis.fansly.classes.extras import endpoint_links
+from ultima_scraper_api.apis.fansly.classes.extras import (
+    AggregationIndex,
+    endpoint_links,
+)
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.fansly.classes.user_model import UserModel
@@ -48,46 +51,37 @@ class CollectionModel(SiteContent):
         self.linkedUsers: list = option.get("linkedUsers")
         self.linkedPosts: list = option.get("linkedPosts")
         self.previews: list[dict[str, Any]] = option.get("previews", [])
-        self.attachments: list[dict[str, Any]] = extra.get("albumContent", {})
         self.created_at: datetime = datetime.fromtimestamp(option["createdAt"] / 1000)
         self.postedAtPrecise: str = option.get("postedAtPrecise")
         self.expiredAt: Any = option.get("expiredAt")
         # Custom
-        final_media_ids: list[Any] = []
-        for attachment in self.attachments:
-            attachment_content_id = attachment["mediaOfferId"]
-            match attachment["mediaOfferType"]:
-                case 1:
-                    final_media_ids.append(attachment_content_id)
-                case 2:
-                    for bundle in extra["aggregationData"]["accountMediaBundles"]:
-                        if bundle["id"] == attachment_content_id:
-                            final_media_ids.extend(bundle["accountMediaIds"])
-                case 32001:
-                    pass
-                case _:
-                    pass
-        final_media: list[Any] = []
-        if final_media_ids:
-            for final_media_id in final_media_ids:
-                for account_media in extra["aggregationData"]["accountMedia"]:
-                    if account_media["id"] == final_media_id:
-                        temp_media = None
-                        if "preview" in account_media:
-                            temp_media = account_media["preview"]
-                            self.previews.append(temp_media)
-                        if (
-                            account_media["media"]["locations"]
-                            or account_media["media"]["variants"]
-                        ):
-                            temp_media = account_media["media"]
-                        if temp_media:
-                            final_media.append(temp_media)
-        self.media: list[Any] = final_media
+        self.attachments: list[dict[str, Any]] = []
+        self.media: list[Any] = []
+        self.add_content(extra)
         self.canViewMedia: bool = option.get("canViewMedia")
         self.preview: list[int] = option.get("preview", [])
         self.canPurchase: bool = option.get("canPurchase")
 
+    def add_content(self, page: dict[str, Any]) -> None:
+        """Add a page of album content, resolving its media."""
+        attachments: list[dict[str, Any]] = page.get("albumContent", [])
+        self.attachments.extend(attachments)
+        index = AggregationIndex.of(page.get("aggregationData", {}))
+        for account_media in index.attachment_media(
+            attachments, "mediaOfferId", "mediaOfferType"
+        ):
+            temp_media = None
+            if "preview" in account_media:
+                temp_media = account_media["preview"]
+                self.previews.append(temp_media)
+            if (
+                account_media["media"]["locations"]
+                or account_media["media"]["variants"]
+            ):
+                temp_media = account_media["media"]
+            if temp_media:
+                self.media.append(temp_media)
+
     def get_author(self):
         return self.author
 
@@ -24,6 +24,56 @@ class ErrorDetails:
         return self
 
 
+class AggregationIndex:
+    """Id lookups over the aggregated objects of a response page.
+
+    Fansly responses list the accounts, media, bundles and groups their items
+    reference next to them. Models join through this index, built once per
+    page, instead of scanning those lists for every reference.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.accounts = self._index(data.get("accounts"))
+        self.account_media = self._index(data.get("accountMedia"))
+        self.bundles = self._index(data.get("accountMediaBundles"))
+        self.groups_by_user: dict[Any, list[dict[str, Any]]] = {}
+        for group in data.get("groups") or []:
+            for user in group.get("users", []):
+                self.groups_by_user.setdefault(user["userId"], []).append(group)
+
+    @staticmethod
+    def _index(items: list[dict[str, Any]] | None) -> dict[Any, dict[str, Any]]:
+        return {item["id"]: item for item in items or []}
+
+    @classmethod
+    def of(cls, extra: "dict[str, Any] | AggregationIndex") -> "AggregationIndex":
+        return extra if isinstance(extra, AggregationIndex) else cls(extra)
+
+    def attachment_media(
+        self,
+        attachments: list[dict[str, Any]],
+        id_key: str = "contentId",
+        type_key: str = "contentType",
+    ) -> list[dict[str, Any]]:
+        """Return the account media of attachments, bundles expanded in order."""
+        media_ids: list[Any] = []
+        for attachment in attachments:
+            match attachment[type_key]:
+                case 1:
+                    media_ids.append(attachment[id_key])
+                case 2:
+                    bundle = self.bundles.get(attachment[id_key])
+                    if bundle:
+                        media_ids.extend(bundle["accountMediaIds"])
+                case _:
+                    pass
+        return [
+            self.account_media[media_id]
+            for media_id in media_ids
+            if media_id in self.account_media
+        ]
+
+
 class CookieParser:
     def __init__(self, options: str) -> None:
         new_dict: dict[str, Any] = {}
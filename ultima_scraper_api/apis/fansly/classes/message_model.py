@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from ultima_scraper_api.apis.fansly import SiteContent
+from ultima_scraper_api.apis.fansly.classes.extras import AggregationIndex
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.fansly.classes.user_model import UserModel
@@ -11,7 +12,10 @@ if TYPE_CHECKING:
 
 class MessageModel(SiteContent):
     def __init__(
-        self, option: dict[str, Any], user: UserModel, extra: dict[Any, Any] = {}
+        self,
+        option: dict[str, Any],
+        user: UserModel,
+        extra: dict[Any, Any] | AggregationIndex = {},
     ) -> None:
         author = user.get_authed().resolve_user(option["senderId"])
         self.user = user
@@ -43,36 +47,22 @@ class MessageModel(SiteContent):
         self.canReport: Optional[bool] = option.get("canReport")
         self.attachments: list[dict[str, Any]] = option.get("attachments", {})
         # Custom
-        final_media_ids: list[Any] = []
-        for attachment in self.attachments:
-            attachment_content_id = attachment["contentId"]
-            match attachment["contentType"]:
-                case 1:
-                    final_media_ids.append(attachment_content_id)
-                case 2:
-                    for bundle in extra.get("accountMediaBundles", []):
-                        if bundle["id"] == attachment_content_id:
-                            final_media_ids.extend(bundle["accountMediaIds"])
-                case 32001:
-                    pass
-                case _:
-                    pass
         final_media: list[Any] = []
-        if final_media_ids and extra:
-            for final_media_id in final_media_ids:
-                for account_media in extra.get("accountMedia", []):
-                    if account_media["id"] == final_media_id:
-                        temp_media = None
-                        if "preview" in account_media:
-                            temp_media = account_media["preview"]
-                            self.previews.append(temp_media)
-                        if (
-                            account_media["media"]["locations"]
-                            or account_media["media"]["variants"]
-                        ):
-                            temp_media = account_media["media"]
-                        if temp_media:
-                            final_media.append(temp_media)
+        if extra:
+            for account_media in AggregationIndex.of(extra).attachment_media(
+                self.attachments
+            ):
+                temp_media = None
+                if "preview" in account_media:
+                    temp_media = account_media["preview"]
+                    self.previews.append(temp_media)
+                if (
+                    account_media["media"]["locations"]
+                    or account_media["media"]["variants"]
+                ):
+                    temp_media = account_media["media"]
+                if temp_media:
+                    final_media.append(temp_media)
         self.media = final_media
         self.user = user
 
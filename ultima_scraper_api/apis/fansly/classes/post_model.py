@@ -5,7 +5,10 @@ from typing import TYPE_CHECKING, Any
 
 from ultima_scraper_api.apis.fansly import SiteContent
 from ultima_scraper_api.apis.fansly.classes.comment_model import CommentModel
-from ultima_scraper_api.apis.fansly.classes.extras import endpoint_links
+from ultima_scraper_api.apis.fansly.classes.extras import (
+    AggregationIndex,
+    endpoint_links,
+)
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.fansly.classes.user_model import UserModel
@@ -16,7 +19,7 @@ class PostModel(SiteContent):
         self,
         option: dict[str, Any],
         user: UserModel,
-        extra: dict[str, Any],
+        extra: dict[str, Any] | AggregationIndex,
     ) -> None:
         SiteContent.__init__(self, option, user)
         self.responseType: str = option.get("responseType")
@@ -57,35 +60,20 @@ class PostModel(SiteContent):
         self.expiredAt: Any = option.get("expiredAt")
 
         # Custom
-        final_media_ids: list[Any] = []
-        for attachment in self.attachments:
-            attachment_content_id = attachment["contentId"]
-            match attachment["contentType"]:
-                case 1:
-                    final_media_ids.append(attachment_content_id)
-                case 2:
-                    for bundle in extra["accountMediaBundles"]:
-                        if bundle["id"] == attachment_content_id:
-                            final_media_ids.extend(bundle["accountMediaIds"])
-                case 32001:
-                    pass
-                case _:
-                    pass
         final_media: list[Any] = []
-        if final_media_ids:
-            for final_media_id in final_media_ids:
-                for account_media in extra["accountMedia"]:
-                    if account_media["id"] == final_media_id:
-                        temp_media = None
-                        if "preview" in account_media:
-                            temp_media = account_media["preview"]
-                            if not account_media["access"]:
-                                self.previews.append(int(account_media["previewId"]))
-                                self.previews.append(temp_media)
-                        if account_media["media"]["locations"]:
-                            temp_media = account_media["media"]
-                        if temp_media:
-                            final_media.append(temp_media)
+        for account_media in AggregationIndex.of(extra).attachment_media(
+            self.attachments
+        ):
+            temp_media = None
+            if "preview" in account_media:
+                temp_media = account_media["preview"]
+                if not account_media["access"]:
+                    self.previews.append(int(account_media["previewId"]))
+                    self.previews.append(temp_media)
+            if account_media["media"]["locations"]:
+                temp_media = account_media["media"]
+            if temp_media:
+                final_media.append(temp_media)
         self.media: list[Any] = final_media
         self.canViewMedia: bool = option.get("canViewMedia")
         self.preview: list[int] = option.get("preview", [])
@@ -95,23 +83,7 @@ class PostModel(SiteContent):
         return self.author
 
     async def get_comments(self):
-        if not self.commentsCount:
-            return
-        epl = endpoint_links("post", self.id)
-        link = epl.list_comments_api
-        result: list[dict[str, Any]] = await self.author.scrape_manager.scrape(link)
-        response: dict[str, Any] = result["response"]
-        authed = self.author.get_authed()
-        final_results = [
-            CommentModel(
-                x,
-                await authed.resolve_user(
-                    [y for y in response["accounts"] if y["id"] == x["accountId"]][0]
-                ),
-            )
-            for x in response["posts"]
-        ]
-        self.comments = final_results
+        await self.author.load_comments([self])
         return self.comments
 
     async def favorite(self):
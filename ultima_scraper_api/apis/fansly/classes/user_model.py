@@ -1,23 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import math
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
 from typing import TYPE_CHECKING, Any, Optional, Union
 from urllib import parse
 
 import ultima_scraper_api.apis.fansly.classes.message_model as message_model
 from ultima_scraper_api.apis import api_helper
-from ultima_scraper_api.apis.fansly.classes import collection_model, post_model
-from ultima_scraper_api.apis.fansly.classes.extras import ErrorDetails, endpoint_links
+from ultima_scraper_api.apis.fansly.classes import (
+    collection_model,
+    comment_model,
+    post_model,
+)
+from ultima_scraper_api.apis.fansly.classes.extras import (
+    AggregationIndex,
+    ErrorDetails,
+    endpoint_links,
+)
 from ultima_scraper_api.apis.fansly.classes.hightlight_model import HighlightModel
 from ultima_scraper_api.apis.fansly.classes.story_model import StoryModel
 from ultima_scraper_api.apis.user_streamliner import StreamlinedUser
-from ultima_scraper_api.managers.scrape_manager import ScrapeManager
+from ultima_scraper_api.managers.scrape_manager import (
+    ScrapeFailure,
+    ScrapeManager,
+    ScrapeReport,
+)
 
 if TYPE_CHECKING:
     from ultima_scraper_api import FanslyAPI
     from ultima_scraper_api.apis.fansly.classes.auth_model import FanslyAuthModel
     from ultima_scraper_api.apis.fansly.classes.post_model import PostModel
 
+logger = logging.getLogger(__name__)
+
 
 class UserModel(StreamlinedUser["FanslyAuthModel", "FanslyAPI"]):
     def __init__(
@@ -293,26 +311,34 @@ class UserModel(StreamlinedUser["FanslyAuthModel", "FanslyAPI"]):
         offset: int = 0,
         refresh: bool = True,
     ) -> list[PostModel]:
-        temp_results: list[Any] = []
+        final_results: list[PostModel] = []
+        async for posts in self.iter_posts(offset):
+            final_results.extend(posts)
+        if final_results:
+            await self.load_comments(final_results)
+            self.scrape_manager.scraped.Posts = final_results
+        return final_results
+
+    async def iter_posts(self, offset: int = 0) -> AsyncIterator[list[PostModel]]:
+        """
+        Streams the user's timeline, one page of models at a time.
+
+        Each page's media and bundles are only indexed until its posts are built,
+        so memory is bounded by a page rather than the whole timeline.
+
+        Yields:
+            list[PostModel]: Posts of the next page.
+        """
         while True:
             link = endpoint_links(identifier=self.id, global_offset=offset).post_api
             response = await self.get_requester().json_request(link)
             data = response["response"]
-            temp_posts = data.get("posts")
-            if not temp_posts:
+            posts = data.get("posts")
+            if not posts:
                 break
-            offset = temp_posts[-1]["id"]
-            temp_results.append(data)
-        results = api_helper.merge_dictionaries(temp_results)
-        final_results = []
-        if results:
-            final_results = [
-                post_model.PostModel(x, self, results) for x in results["posts"]
-            ]
-            for result in final_results:
-                await result.get_comments()
-            self.scrape_manager.scraped.Posts = final_results
-        return final_results
+            offset = posts[-1]["id"]
+            index = AggregationIndex(data)
+            yield [post_model.PostModel(x, self, index) for x in posts]
 
     async def get_post(
         self, identifier: Optional[int | str] = None, limit: int = 10, offset: int = 0
@@ -329,6 +355,77 @@ class UserModel(StreamlinedUser["FanslyAuthModel", "FanslyAPI"]):
             return final_result
         return result
 
+    async def load_comments(
+        self,
+        posts: Iterable[PostModel],
+        window: int | None = None,
+        report: ScrapeReport | None = None,
+    ) -> list[PostModel]:
+        """
+        Fetches the comments of many posts at once.
+
+        Posts without comments are skipped. The comment requests of every post
+        share one bounded scrape window, and each comment author is resolved once.
+        A post whose request failed keeps its previous comments.
+
+        Args:
+            posts: Posts to load the comments of.
+            window: Maximum requests in flight (defaults to the session's max_threads).
+            report: Optional report filled with request counts and failed requests.
+
+        Returns:
+            list[PostModel]: Posts whose comments were loaded.
+        """
+        report = report if report is not None else ScrapeReport()
+        post_links: dict[str, PostModel] = {}
+        for post in posts:
+            if post.commentsCount:
+                link = endpoint_links("post", post.id).list_comments_api
+                post_links[link] = post
+        loaded: dict[PostModel, list[dict[str, Any]]] = {}
+        accounts: dict[Any, dict[str, Any]] = {}
+        async with aclosing(
+            self.scrape_manager.iter_scrape(
+                list(post_links), window=window, report=report
+            )
+        ) as pages:
+            async for url, page_result in pages:
+                if not isinstance(page_result, dict) or "response" not in page_result:
+                    if page_result is not None:
+                        report.failures.append(
+                            ScrapeFailure(
+                                url=url,
+                                status=None,
+                                attempts=1,
+                                error="Comments response has no 'response'",
+                            )
+                        )
+                    continue
+                response = page_result["response"]
+                accounts.update(AggregationIndex(response).accounts)
+                loaded[post_links[url]] = response["posts"]
+
+        authed = self.get_authed()
+        authors = {
+            account_id: authed.resolve_user(account)
+            for account_id, account in accounts.items()
+        }
+        for post, comments in loaded.items():
+            post.comments = []
+            for x in comments:
+                account_id = x["accountId"]
+                author = authors.get(account_id) or authed.find_user(int(account_id))
+                if not author:
+                    logger.warning(
+                        "Skipping comment %s on post %s, author %s is unknown",
+                        x.get("id"),
+                        post.id,
+                        account_id,
+                    )
+                    continue
+                post.comments.append(comment_model.CommentModel(x, author))
+        return list(loaded)
+
     async def get_groups(self) -> ErrorDetails | dict[str, Any]:
         link = endpoint_links().groups_api
         response: ErrorDetails | dict[str, Any] = (
@@ -341,58 +438,99 @@ class UserModel(StreamlinedUser["FanslyAuthModel", "FanslyAPI"]):
 
     async def get_messages(
         self,
-        links: Optional[list[str]] = None,
         limit: int = 100000,
         before: str = "",
-        cutoff_id: int | None = None,
-        refresh: bool = True,
-        inside_loop: bool = False,
+        cutoff_id: int | str | None = None,
+        report: ScrapeReport | None = None,
     ):
-        groups = await self.get_groups()
-        if isinstance(groups, ErrorDetails):
-            return []
-        found_id: Optional[int] = None
-        for group in groups["groups"]:
-            for user in group["users"]:
-                if self.id == int(user["userId"]):
-                    found_id = int(user["groupId"])
-                    break
+        """
+        Retrieves the message history with the user, newest first.
+
+        Args:
+            limit: Messages per page
+            before: Start below this message id, empty for the newest
+            cutoff_id: Stop after the page containing this message id
+            report: Optional report filled with the failed request, if any
+
+        Returns:
+            list[MessageModel]: The messages.
+        """
         final_results: list[message_model.MessageModel] = []
-        if found_id:
-            if links is None:
-                links = []
+        async with aclosing(self.iter_messages(limit, before, report=report)) as pages:
+            async for messages in pages:
+                final_results.extend(messages)
+                if cutoff_id is not None and any(
+                    str(x.id) == str(cutoff_id) for x in messages
+                ):
+                    break
+        self.scrape_manager.scraped.Messages = final_results
+        return final_results
 
-            link = endpoint_links(
-                identifier=found_id, global_limit=limit, before_id=before
+    async def iter_messages(
+        self,
+        limit: int = 100000,
+        before: str = "",
+        prefetch: bool = True,
+        report: ScrapeReport | None = None,
+    ) -> AsyncIterator[list[message_model.MessageModel]]:
+        """
+        Streams the message history with the user, newest first, one page of
+        models at a time.
+
+        Args:
+            limit: Messages per page
+            before: Start below this message id, empty for the newest
+            prefetch: Request the next page while the current one is consumed
+            report: Optional report filled with the failed request, if any. The
+                walk stops at the first failed page.
+
+        Yields:
+            list[MessageModel]: Messages of the next page.
+        """
+        group_id = await self.get_authed().get_message_group_id(self.id)
+        if not group_id:
+            return
+        requester = self.get_requester()
+        report = report if report is not None else ScrapeReport()
+
+        def message_link(before: str) -> str:
+            return endpoint_links(
+                identifier=group_id, global_limit=limit, before_id=before
             ).message_api
-            links.append(link)
-
-            results = await self.get_requester().bulk_requests(links)
-            results = [await x.json() for x in results if x]
-            results = await api_helper.remove_errors(results)
-            results = api_helper.merge_dictionaries(results)
-            if not results:
-                return []
-            extras = results["response"]
-            final_results = extras["messages"]
-
-            if final_results:
-                lastId = final_results[-1]["id"]
-                results2 = await self.get_messages(
-                    links=[links[-1]],
-                    limit=limit,
-                    before=lastId,
-                    inside_loop=True,
-                )
-                final_results.extend(results2)
-            if not inside_loop:
-                final_results = [
-                    message_model.MessageModel(x, self, extras)
-                    for x in final_results
-                    if x
+
+        def fetch(before: str) -> asyncio.Future[dict[str, Any]]:
+            return asyncio.ensure_future(requester.json_request(message_link(before)))
+
+        pending = fetch(before)
+        try:
+            while True:
+                response = await pending
+                if "error" in response:
+                    report.failures.append(
+                        ScrapeFailure(
+                            url=message_link(before),
+                            status=None,
+                            attempts=1,
+                            error=str(response["error"]),
+                        )
+                    )
+                    break
+                page = response["response"]
+                messages = page.get("messages")
+                if not messages:
+                    break
+                before = messages[-1]["id"]
+                if prefetch:
+                    # The cursor is known, fetch the next page while this one is used
+                    pending = fetch(before)
+                index = AggregationIndex(page)
+                yield [
+                    message_model.MessageModel(x, self, index) for x in messages if x
                 ]
-            self.scrape_manager.scraped.Messages = final_results
-        return final_results
+                if not prefetch:
+                    pending = fetch(before)
+        finally:
+            pending.cancel()
 
     async def get_message_by_id(
         self, user_id=None, message_id=None, refresh=True, limit=10, offset=0
@@ -568,7 +706,7 @@ class UserModel(StreamlinedUser["FanslyAuthModel", "FanslyAPI"]):
         return results["response"]
 
     async def get_collection_content(self, collection: dict[str, Any], offset: int = 0):
-        temp_responses: list[dict[str, Any]] = []
+        final_result = collection_model.CollectionModel(collection, self, {})
         while True:
             link = endpoint_links(
                 identifier=collection["id"], global_limit=25, global_offset=offset
@@ -579,9 +717,8 @@ class UserModel(StreamlinedUser["FanslyAuthModel", "FanslyAPI"]):
             if not album_content:
                 break
             offset = int(album_content[-1]["id"])
-            temp_responses.append(response)
-        responses = api_helper.merge_dictionaries(temp_responses)
-        final_result = collection_model.CollectionModel(collection, self, responses)
+            # Pages carry the aggregation data of their own content
+            final_result.add_content(response)
         return final_result
 
     async def get_avatar(self):
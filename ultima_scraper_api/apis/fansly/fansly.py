@@ -7,7 +7,11 @@ from ultima_scraper_api.apis.fansly.classes.extras import AuthDetails, endpoint_
 from ultima_scraper_api.apis.fansly.classes.message_model import MessageModel
 from ultima_scraper_api.apis.fansly.classes.post_model import PostModel
 from ultima_scraper_api.apis.fansly.classes.story_model import StoryModel
-from ultima_scraper_api.config import UltimaScraperAPIConfig
+from ultima_scraper_api.config import Registry, UltimaScraperAPIConfig
+from ultima_scraper_api.managers.registry_manager import (
+    BoundedRegistry,
+    create_registry,
+)
 from ultima_scraper_api.managers.websocket_manager import WebSocketManager
 
 if TYPE_CHECKING:
@@ -94,7 +98,7 @@ class FanslyAPI(StreamlinedAPI):
                 await self.remove_auth(auth)
 
     async def remove_auth(self, auth: "FanslyAuthModel"):
-        await auth.get_requester().active_session.close()
+        await auth.get_requester().close()
         del self.auths[auth.id]
 
     def create_auth_details(self, auth_json: dict[str, Any] = {}) -> AuthDetails:
@@ -160,11 +164,19 @@ class FanslyAPI(StreamlinedAPI):
             return final_value
 
     class CategorizedContent:
-        def __init__(self) -> None:
-            self.Stories: dict[int, StoryModel] = {}
-            self.Chats: dict[int, Any] = {}
-            self.Messages: dict[int, MessageModel] = {}
-            self.Posts: dict[int, PostModel] = {}
+        def __init__(self, settings: Registry = Registry()) -> None:
+            self.Stories: BoundedRegistry[int, StoryModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Chats: BoundedRegistry[int, Any] = create_registry(
+                settings, settings.max_content
+            )
+            self.Messages: BoundedRegistry[int, MessageModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Posts: BoundedRegistry[int, PostModel] = create_registry(
+                settings, settings.max_content
+            )
 
         def __iter__(self):
             for attr, value in self.__dict__.items():
@@ -27,9 +27,7 @@ class LoyalFansAuthenticator:
                 proxy_info = ProxyInfo(
                     *python_socks.parse_proxy_url(self.auth_details.proxy_url)
                 )
-                self.auth_session.active_session = (
-                    self.auth_session.create_client_session(False, proxy_info)
-                )
+                self.auth_session.use_proxy(proxy_info)
             except Exception:
                 pass
         self.auth_attempt = 0
@@ -46,7 +44,7 @@ class LoyalFansAuthenticator:
         await self.close()
 
     async def close(self):
-        await self.auth_session.active_session.close()
+        await self.auth_session.close()
 
     def create_auth(self):
         return LoyalFansAuthModel(self)
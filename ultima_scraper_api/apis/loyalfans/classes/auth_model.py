@@ -4,6 +4,10 @@ from ultima_scraper_api.apis.auth_streamliner import StreamlinedAuth
 from ultima_scraper_api.apis.loyalfans.classes import subscription_model
 from ultima_scraper_api.apis.loyalfans.classes.extras import endpoint_links
 from ultima_scraper_api.apis.loyalfans.classes.user_model import UserModel
+from ultima_scraper_api.managers.registry_manager import (
+    BoundedRegistry,
+    create_registry,
+)
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.loyalfans.authenticator import (
@@ -21,7 +25,10 @@ class LoyalFansAuthModel(
         authenticator: "LoyalFansAuthenticator",
     ) -> None:
         self.api = authenticator.api
-        self.users: dict[int, UserModel] = {}
+        registry_settings = self.api.config.settings.registry
+        self.users: BoundedRegistry[int, UserModel] = create_registry(
+            registry_settings, registry_settings.max_users
+        )
         super().__init__(authenticator)
         self.user = authenticator.create_user(self)
         self.id = self.user.id
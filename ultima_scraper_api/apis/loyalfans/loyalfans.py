@@ -6,7 +6,11 @@ from ultima_scraper_api.apis.api_streamliner import StreamlinedAPI
 from ultima_scraper_api.apis.loyalfans.classes.extras import AuthDetails
 from ultima_scraper_api.apis.loyalfans.classes.message_model import MessageModel
 from ultima_scraper_api.apis.loyalfans.classes.post_model import PostModel
-from ultima_scraper_api.config import UltimaScraperAPIConfig
+from ultima_scraper_api.config import Registry, UltimaScraperAPIConfig
+from ultima_scraper_api.managers.registry_manager import (
+    BoundedRegistry,
+    create_registry,
+)
 from ultima_scraper_api.managers.websocket_manager import WebSocketManager
 
 if TYPE_CHECKING:
@@ -158,7 +162,7 @@ class LoyalFansAPI(StreamlinedAPI):
                 await self.remove_auth(auth)
 
     async def remove_auth(self, auth: "LoyalFansAuthModel"):
-        await auth.get_requester().active_session.close()
+        await auth.get_requester().close()
         del self.auths[auth.id]
 
     def create_auth_details(self, auth_json: dict[str, Any] = {}):
@@ -215,9 +219,13 @@ class LoyalFansAPI(StreamlinedAPI):
             return final_value
 
     class CategorizedContent:
-        def __init__(self) -> None:
-            self.Messages: dict[int, MessageModel] = {}
-            self.Posts: dict[int, PostModel] = {}
+        def __init__(self, settings: Registry = Registry()) -> None:
+            self.Messages: BoundedRegistry[int, MessageModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Posts: BoundedRegistry[int, PostModel] = create_registry(
+                settings, settings.max_content
+            )
 
         def __iter__(self):
             for attr, value in self.__dict__.items():
@@ -4,6 +4,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 from urllib.parse import ParseResult, urlparse
 
+from ultima_scraper_api.helpers.lazy_fields import init_lazy
+
 
 class SubscriptionTypeEnum(str, Enum):
     ALL = "all"
@@ -89,10 +91,23 @@ def preview_url_picker(media_item: "MediaModel"):
 
 
 class SiteContent:
+    # Subclasses that declare __slots__ too are lazy views over __raw__, see
+    # ultima_scraper_api.helpers.lazy_fields. __dict__ is only created for
+    # attributes callers add themselves.
+    __slots__ = (
+        "id",
+        "author",
+        "__raw__",
+        "__values__",
+        "_proxy",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self, option: dict[str, Any], user: UserModel) -> None:
         self.id: int = option["id"]
         self.author = user
-        self.__raw__ = option
+        init_lazy(self, option)
         self._proxy: str | None = None
 
     def url_picker(self, media_item: "MediaModel", video_quality: str = ""):
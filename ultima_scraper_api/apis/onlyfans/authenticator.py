@@ -63,6 +63,84 @@ def extract_auth_details_from_curl(credentials: str) -> AuthDetails:
     )
 
 
+class RequestSigner:
+    """Builds signed API headers for an authenticator.
+
+    Everything that doesn't change between requests is prepared once: the
+    SHA-1 state after ``static_param``, the checksum rules and the base API
+    headers (session headers, app-token and cookie). It's rebuilt when the
+    dynamic rules are reloaded, the cookie changes or the session headers are
+    replaced, so signatures stay identical to signing from scratch.
+    """
+
+    def __init__(self, authenticator: "OnlyFansAuthenticator") -> None:
+        self.authenticator = authenticator
+        self._rules_key: tuple[Any, ...] | None = None
+        self._prefix = hashlib.sha1()
+        self._checksum_indexes: tuple[int, ...] = ()
+        self._checksum_constant = 0
+        self._format = ""
+        self._headers_key: tuple[Any, ...] | None = None
+        self._api_headers: dict[str, Any] = {}
+
+    def _load_rules(self) -> None:
+        dynamic_rules = self.authenticator.api.dynamic_rules
+        cached = self._rules_key
+        if (
+            cached is not None
+            and cached[0] is dynamic_rules
+            and cached[1] == dynamic_rules.version
+        ):
+            return
+        # Holds the rules object itself, so a new one can't reuse its id
+        self._rules_key = (dynamic_rules, dynamic_rules.version)
+        self._prefix = hashlib.sha1(f"{dynamic_rules.static_param}\n".encode("utf-8"))
+        self._checksum_indexes = tuple(dynamic_rules.checksum_indexes)
+        self._checksum_constant = dynamic_rules.checksum_constant
+        self._format = dynamic_rules.format
+        self._headers_key = None
+
+    def api_headers(self) -> dict[str, Any]:
+        """Returns a copy of the unsigned headers for an API request."""
+        self._load_rules()
+        authenticator = self.authenticator
+        session_headers = authenticator.auth_session.headers
+        cookie = authenticator.auth_details.cookie.convert()
+        key = self._headers_key
+        if key is None or key[0] is not session_headers or key[1] != cookie:
+            headers = session_headers.copy()
+            headers["app-token"] = authenticator.api.dynamic_rules.app_token
+            headers["cookie"] = cookie
+            self._api_headers = headers
+            self._headers_key = (session_headers, cookie)
+        return self._api_headers.copy()
+
+    def sign(
+        self, link: str, auth_id: int = 0, time_: int | None = None
+    ) -> dict[str, Any]:
+        self._load_rules()
+        headers: dict[str, Any] = {}
+        final_time = str(int(round(time.time()))) if not time_ else str(time_)
+        parsed = urlparse(link)
+        path = parsed.path
+        if parsed.query:
+            auth_details = self.authenticator.auth_details
+            auth_id = auth_details.id if auth_details.id else auth_id
+            headers["user-id"] = str(auth_id)
+            path = f"{path}?{parsed.query}"
+        hash_object = self._prefix.copy()
+        hash_object.update(f"{final_time}\n{path}\n{auth_id}".encode("utf-8"))
+        sha_1_sign = hash_object.hexdigest()
+        sha_1_b = sha_1_sign.encode("ascii")
+        checksum = (
+            sum(map(sha_1_b.__getitem__, self._checksum_indexes))
+            + self._checksum_constant
+        )
+        headers["sign"] = self._format.format(sha_1_sign, abs(checksum))
+        headers["time"] = final_time
+        return headers
+
+
 class OnlyFansAuthenticator:
     def __init__(
         self,
@@ -78,9 +156,7 @@ class OnlyFansAuthenticator:
                 proxy_info = ProxyInfo(
                     *python_socks.parse_proxy_url(self.auth_details.proxy_url)
                 )
-                self.auth_session.active_session = (
-                    self.auth_session.create_client_session(False, proxy_info)
-                )
+                self.auth_session.use_proxy(proxy_info)
             except Exception:
                 pass
         self.auth_attempt = 0
@@ -89,6 +165,7 @@ class OnlyFansAuthenticator:
         self.active = False
         self.guest = guest
         self.__raw__: dict[str, Any] | None = None
+        self.request_signer = RequestSigner(self)
 
     async def __aenter__(self):
         return await self.login(self.guest)
@@ -97,7 +174,7 @@ class OnlyFansAuthenticator:
         await self.close()
 
     async def close(self):
-        await self.auth_session.active_session.close()
+        await self.auth_session.close()
 
     def create_auth(self):
         auth = OnlyFansAuthModel(self)
@@ -120,8 +197,6 @@ class OnlyFansAuthenticator:
 
     async def login(self, guest: bool = False) -> OnlyFansAuthModel | None:
         """Authenticate with OnlyFans API, optionally as guest."""
-        asyncio.create_task(self.auth_session.session_manager.check_rate_limit())
-
         # Setup authentication headers
         url = APIRoutes().me()
         auth_id = str(self.auth_details.cookie.auth_id)
@@ -270,24 +345,20 @@ class OnlyFansAuthenticator:
         custom_cookies: str = "",
         extra_headers: dict[str, str] | None = None,
     ):
-        session_manager = self.auth_session.session_manager
-        dynamic_rules = self.api.dynamic_rules
-        headers = self.auth_session.headers.copy()
         if "https://onlyfans.com/api2/v2/" in link:
-            headers["app-token"] = dynamic_rules.app_token
-            headers["cookie"] = self.auth_details.cookie.convert()
-
+            headers = self.request_signer.api_headers()
             if self.guest:
                 headers["x-bc"] = "".join(
                     random.choice(string.digits + string.ascii_lowercase)
                     for _ in range(40)
                 )
             headers |= self.create_signed_headers(link)
-            session_manager.time2sleep = 5
-        elif ".mpd" in link:
-            headers["cookie"] = custom_cookies
         else:
-            headers["cookie"] = self.auth_details.cookie.convert() + custom_cookies
+            headers = self.auth_session.headers.copy()
+            if ".mpd" in link:
+                headers["cookie"] = custom_cookies
+            else:
+                headers["cookie"] = self.auth_details.cookie.convert() + custom_cookies
         if extra_headers:
             headers.update(extra_headers)
         return headers
@@ -296,25 +367,4 @@ class OnlyFansAuthenticator:
         self, link: str, auth_id: int = 0, time_: int | None = None
     ):
         # Users: 300000 | Creators: 301000
-        headers: dict[str, Any] = {}
-        final_time = str(int(round(time.time()))) if not time_ else str(time_)
-        path = urlparse(link).path
-        query = urlparse(link).query
-        if query:
-            auth_id = self.auth_details.id if self.auth_details.id else auth_id
-            headers["user-id"] = str(auth_id)
-        path = path if not query else f"{path}?{query}"
-        dynamic_rules = self.api.dynamic_rules
-        a = [dynamic_rules.static_param, final_time, path, str(auth_id)]
-        msg = "\n".join(a)
-        message = msg.encode("utf-8")
-        hash_object = hashlib.sha1(message)
-        sha_1_sign = hash_object.hexdigest()
-        sha_1_b = sha_1_sign.encode("ascii")
-        checksum = (
-            sum([sha_1_b[number] for number in dynamic_rules.checksum_indexes])
-            + dynamic_rules.checksum_constant
-        )
-        headers["sign"] = dynamic_rules.format.format(sha_1_sign, abs(checksum))
-        headers["time"] = final_time
-        return headers
+        return self.request_signer.sign(link, auth_id, time_)
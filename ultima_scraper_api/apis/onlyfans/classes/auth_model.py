@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from itertools import chain, product
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
+from itertools import takewhile
 from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from ultima_scraper_api.apis import api_helper
 from ultima_scraper_api.apis.auth_streamliner import StreamlinedAuth
 from ultima_scraper_api.apis.onlyfans import (
     SubscriptionType,
@@ -25,10 +26,21 @@ from ultima_scraper_api.apis.onlyfans.classes.subscription_count_model import (
 from ultima_scraper_api.apis.onlyfans.classes.subscription_model import (
     SubscriptionModel,
 )
-from ultima_scraper_api.apis.onlyfans.classes.user_model import UserModel, recursion
+from ultima_scraper_api.apis.onlyfans.classes.user_model import (
+    UserModel,
+    create_paginator,
+    paginate,
+)
 from ultima_scraper_api.apis.onlyfans.classes.vault import VaultListModel
 from ultima_scraper_api.apis.onlyfans.urls import APIRoutes
+from ultima_scraper_api.helpers.json_helper import read_json
+from ultima_scraper_api.managers.pagination_manager import OffsetPaginator
 from ultima_scraper_api.managers.redis import with_hooks
+from ultima_scraper_api.managers.registry_manager import (
+    BoundedRegistry,
+    create_registry,
+)
+from ultima_scraper_api.managers.user_index_manager import UserIndex
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.onlyfans.authenticator import OnlyFansAuthenticator
@@ -111,7 +123,11 @@ class OnlyFansAuthModel(
         authenticator: OnlyFansAuthenticator,
     ) -> None:
         self.api = authenticator.api
-        self.users: dict[int, UserModel] = {}
+        registry_settings = self.api.config.settings.registry
+        self.user_index = UserIndex()
+        self.users: BoundedRegistry[int, UserModel] = create_registry(
+            registry_settings, registry_settings.max_users, self.forget_user
+        )
         super().__init__(authenticator)
         self.user = authenticator.create_user(self)
         self.id = self.user.id
@@ -209,13 +225,14 @@ class OnlyFansAuthModel(
 
     def find_user(self, identifier: int | str):
         if isinstance(identifier, int):
-            user = self.users.get(identifier)
-        else:
-            for user in self.users.values():
-                if user.username.lower() == identifier.lower():
-                    break
-            else:
-                user = None
+            return self.users.get(identifier)
+        user_id = self.user_index.get(identifier)
+        if user_id is None:
+            return None
+        user = self.users.get(user_id)
+        if not user:
+            # Evicted from the registry
+            self.user_index.remove(user_id)
         return user
 
     def resolve_user(self, user_dict: dict[str, Any]):
@@ -228,6 +245,21 @@ class OnlyFansAuthModel(
 
     def add_user(self, user: UserModel):
         self.users[user.id] = user
+        self.index_user(user)
+
+    def index_user(self, user: UserModel):
+        """(Re)index a user under its current username and aliases."""
+        names = [user.username, *user.aliases]
+        self.user_index.add(user.id, names)
+        self.api.user_index.add(user.id, names)
+        auths = self.api.user_auths.setdefault(user.id, [])
+        if self not in auths:
+            auths.append(self)
+
+    def forget_user(self, user_id: int):
+        """Drop a user that left self.users from this auth's and the API's indexes."""
+        self.user_index.remove(user_id)
+        self.api.forget_user(user_id, self)
 
     def get_pool(self):
         return self.api.pool
@@ -276,7 +308,7 @@ class OnlyFansAuthModel(
         self, list_id: int | None = None, limit: int = 100, offset: int = 0
     ):
         max_pagination_limit = 100  # maximum number of results per request
-        json_resp = await recursion(
+        json_resp = await paginate(
             category="list_vault_media",
             requester=self.get_requester(),
             max_items=limit,
@@ -399,7 +431,7 @@ class OnlyFansAuthModel(
 
         # Create new user model from API response
         fresh_user = self.resolve_user(response)
-        self.users[fresh_user.id] = fresh_user
+        self.add_user(fresh_user)
 
         self.cache.users(identifier).activate()
         return fresh_user
@@ -424,42 +456,114 @@ class OnlyFansAuthModel(
             results.extend(results2)  # type: ignore
         return results
 
+    async def get_users(
+        self, identifiers: Iterable[int], window: int | None = None
+    ) -> dict[int, UserModel]:
+        """
+        Resolves several users at once, fetching each distinct user once with at most `window` requests in flight.
+
+        Args:
+            identifiers (Iterable[int]): User ids, duplicates are fetched once.
+            window (int | None, optional): Maximum user requests in flight (defaults to the session's max_threads).
+
+        Returns:
+            dict[int, UserModel]: Users by id, ids that couldn't be resolved are left out.
+        """
+        if window is None:
+            window = self.auth_session.get_session_manager().max_threads
+        semaphore = asyncio.Semaphore(max(1, window))
+
+        async def resolve(identifier: int):
+            async with semaphore:
+                return identifier, await self.get_user(identifier)
+
+        results = await asyncio.gather(*map(resolve, set(identifiers)))
+        return {identifier: user for identifier, user in results if user}
+
     async def assign_user_to_sub(self, subscription_model: SubscriptionModel):
-        _user = await self.get_user(subscription_model.user.id)
+        user = await self.get_user(subscription_model.user.id)
+        if user:
+            subscription_model.user = user
         return subscription_model
 
+    async def hydrate_subscriptions(
+        self, subscriptions: list[SubscriptionModel], window: int | None = None
+    ) -> AsyncIterator[SubscriptionModel]:
+        """
+        Refreshes the users of subscriptions, yielding each subscription as soon as its user is ready.
+
+        Users whose cache entry is still fresh are yielded first without a request,
+        the others are refreshed with at most `window` requests in flight.
+
+        Args:
+            subscriptions (list[SubscriptionModel]): Subscriptions to hydrate.
+            window (int | None, optional): Maximum user requests in flight (defaults to the session's max_threads).
+
+        Yields:
+            SubscriptionModel: The next subscription whose user is up to date.
+        """
+        if window is None:
+            window = self.auth_session.get_session_manager().max_threads
+        window = max(1, window)
+        stale: list[SubscriptionModel] = []
+        for subscription in subscriptions:
+            user_id = subscription.user.id
+            if self.find_user(user_id) and not self.cache.users(user_id).is_released():
+                yield subscription
+            else:
+                stale.append(subscription)
+
+        pending = iter(stale)
+        in_flight: set[asyncio.Task[SubscriptionModel]] = set()
+
+        def fill_window() -> None:
+            while len(in_flight) < window:
+                subscription = next(pending, None)
+                if subscription is None:
+                    return
+                in_flight.add(
+                    asyncio.create_task(self.assign_user_to_sub(subscription))
+                )
+
+        fill_window()
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                in_flight.difference_update(done)
+                fill_window()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
     async def get_subscription_count(self) -> SubscriptionCountModel:
 
         url = endpoint_links().subscription_count()
         result = await self.auth_session.json_request(url)
         return SubscriptionCountModel(result)
 
-    @with_hooks
-    async def get_subscriptions(
+    async def list_raw_subscriptions(
         self,
         identifiers: list[int | str] = [],
         limit: int | None = None,
         sub_type: SubscriptionType = SubscriptionTypeEnum.ALL,
         filter_by: str = "",
-        job_id: str | None = None,
-    ):
+    ) -> list[dict[str, Any]]:
         """
-        Retrieves the subscriptions based on the given parameters.
-        5000 offset is the maximum allowed by the API, which means anything above that will be ignored.
+        Lists raw subscriptions without fetching their users.
 
         Args:
-            identifiers (list[int | str], optional): List of subscription identifiers. Defaults to [].
-            limit (int, optional): Maximum number of subscriptions to retrieve. Defaults to 100.
-           sub_type (SubscriptionType, optional): Type of subscriptions to retrieve. Defaults to "all".
-             filter_by (str, optional): Filter subscriptions by a specific value. Defaults to "".
-            job_id (str, optional): Job ID for progress event publishing. Defaults to None.
+            identifiers (list[int | str], optional): Only keep subscriptions matching these ids or usernames. Defaults to [].
+            limit (int, optional): Maximum number of subscriptions to retrieve. Defaults to every subscription of sub_type.
+            sub_type (SubscriptionType, optional): Type of subscriptions to retrieve. Defaults to "all".
+            filter_by (str, optional): Filter subscriptions by a specific value. Defaults to "".
 
         Returns:
-            list[SubscriptionModel]: List of SubscriptionModel objects representing the subscriptions.
+            list[dict[str, Any]]: Raw subscriptions, in API order.
         """
-
-        if not self.cache.subscriptions.is_released():
-            return self.subscriptions
         max_pagination_limit = 100  # maximum number of results per request
 
         subscriptions_count = await self.get_subscription_count()
@@ -498,9 +602,9 @@ class OnlyFansAuthModel(
             for raw_subscription in temp_raw_subscriptions["list"]
         ]
 
-        # If we want find more subscriptions than the paginated requests returned, use recursion to get the rest
+        # If we want find more subscriptions than the paginated requests returned, paginate the rest
 
-        raw_recursion = await recursion(
+        raw_remaining = await paginate(
             "list_subscriptions",
             self.get_requester(),
             max_items=limit,
@@ -509,69 +613,95 @@ class OnlyFansAuthModel(
             offset=len(raw_subscriptions),
             item_count=len(raw_subscriptions),
         )
-        raw_subscriptions += raw_recursion
+        raw_subscriptions += raw_remaining
         raw_subscriptions = raw_subscriptions[:limit]
 
-        subscriptions: list[SubscriptionModel] = []
         if identifiers:
+            by_identifier: dict[int | str, dict[str, Any]] = {}
+            for raw_subscription in reversed(raw_subscriptions):
+                # Reversed so the first match wins, like a scan would
+                by_identifier[raw_subscription["id"]] = raw_subscription
+                by_identifier[raw_subscription["username"].lower()] = raw_subscription
             found_raw_subscriptions: list[dict[str, Any]] = []
             for identifier in identifiers:
-                for raw_subscription in raw_subscriptions:
-                    if (
-                        identifier == raw_subscription["id"]
-                        or identifier == raw_subscription["username"]
-                    ):
-                        found_raw_subscriptions.append(raw_subscription)
-                        break
+                key = identifier.lower() if isinstance(identifier, str) else identifier
+                if key in by_identifier:
+                    found_raw_subscriptions.append(by_identifier[key])
             raw_subscriptions = found_raw_subscriptions
+        return raw_subscriptions
+
+    @with_hooks
+    async def get_subscriptions(
+        self,
+        identifiers: list[int | str] = [],
+        limit: int | None = None,
+        sub_type: SubscriptionType = SubscriptionTypeEnum.ALL,
+        filter_by: str = "",
+        job_id: str | None = None,
+        window: int | None = None,
+    ):
+        """
+        Retrieves the subscriptions based on the given parameters.
+        5000 offset is the maximum allowed by the API, which means anything above that will be ignored.
+
+        Args:
+            identifiers (list[int | str], optional): List of subscription identifiers. Defaults to [].
+            limit (int, optional): Maximum number of subscriptions to retrieve. Defaults to 100.
+           sub_type (SubscriptionType, optional): Type of subscriptions to retrieve. Defaults to "all".
+             filter_by (str, optional): Filter subscriptions by a specific value. Defaults to "".
+            job_id (str, optional): Job ID for progress event publishing. Defaults to None.
+            window (int, optional): Maximum user requests in flight while hydrating. Defaults to the session's max_threads.
+
+        Returns:
+            list[SubscriptionModel]: List of SubscriptionModel objects representing the subscriptions.
+        """
+
+        if not self.cache.subscriptions.is_released():
+            return self.subscriptions
+
+        raw_subscriptions = await self.list_raw_subscriptions(
+            identifiers, limit, sub_type, filter_by
+        )
 
         # Publish subscription processing progress to Redis
         total_subs = len(raw_subscriptions)
 
-        # Import Redis manager for progress publishing
+        # Progress events are queued for the Redis hook publisher
         from datetime import datetime, timezone
 
-        from ultima_scraper_api.managers.redis import get_redis
-
-        redis = get_redis()
+        from ultima_scraper_api.managers.redis import publish_custom_event
 
         # Use provided job_id or fall back to "api" for standalone usage
         effective_job_id = job_id or "api"
 
         # Publish initial progress event
-        if redis and redis.is_connected:
-            await redis.publish_hook(
-                {
-                    "event": "subscription_processing",
-                    "event_type": "started",
-                    "job_id": effective_job_id,
-                    "auth_id": self.id,
-                    "username": self.username,
-                    "total": total_subs,
-                    "current": 0,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            )
+        await publish_custom_event(
+            {
+                "event": "subscription_processing",
+                "event_type": "started",
+                "job_id": effective_job_id,
+                "auth_id": self.id,
+                "username": self.username,
+                "total": total_subs,
+                "current": 0,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        )
 
         subscriptions = [
             SubscriptionModel(x, self.resolve_user(x), self) for x in raw_subscriptions
         ]
-        with self.get_pool() as pool:
-            tasks = pool.starmap(self.assign_user_to_sub, product(subscriptions))
-
-            # Process with progress updates
-            processed = 0
-            for completed_task in asyncio.as_completed(tasks):
-                subscription = await completed_task
+        # Process with progress updates
+        processed = 0
+        async with aclosing(
+            self.hydrate_subscriptions(subscriptions, window)
+        ) as hydrated:
+            async for subscription in hydrated:
                 processed += 1
 
                 # Publish progress every 10 subscriptions or at completion
-                if (
-                    redis
-                    and redis.is_connected
-                    and (processed % 10 == 0 or processed == total_subs)
-                ):
-                    await redis.publish_hook(
+                if processed % 10 == 0 or processed == total_subs:
+                    await publish_custom_event(
                         {
                             "event": "subscription_processing",
                             "event_type": "progress",
@@ -590,23 +720,66 @@ class OnlyFansAuthModel(
                     )
 
         # Publish completion event
-        if redis and redis.is_connected:
-            await redis.publish_hook(
-                {
-                    "event": "subscription_processing",
-                    "event_type": "finished",
-                    "job_id": effective_job_id,
-                    "auth_id": self.id,
-                    "username": self.username,
-                    "total": total_subs,
-                    "current": total_subs,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-        for subscription in subscriptions:
-            self.add_subscription(subscription)
+        await publish_custom_event(
+            {
+                "event": "subscription_processing",
+                "event_type": "finished",
+                "job_id": effective_job_id,
+                "auth_id": self.id,
+                "username": self.username,
+                "total": total_subs,
+                "current": total_subs,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        self.add_subscriptions(subscriptions)
         return subscriptions
 
+    async def iter_subscriptions(
+        self,
+        identifiers: list[int | str] = [],
+        limit: int | None = None,
+        sub_type: SubscriptionType = SubscriptionTypeEnum.ALL,
+        filter_by: str = "",
+        window: int | None = None,
+    ) -> AsyncIterator[SubscriptionModel]:
+        """
+        Streams subscriptions as soon as their users are ready, instead of waiting for every user like get_subscriptions.
+
+        Every subscription is also added to self.subscriptions. Order follows
+        completion, subscriptions with fresh cached users come first.
+
+        Args:
+            identifiers (list[int | str], optional): List of subscription identifiers. Defaults to [].
+            limit (int, optional): Maximum number of subscriptions to retrieve. Defaults to every subscription.
+            sub_type (SubscriptionType, optional): Type of subscriptions to retrieve. Defaults to "all".
+            filter_by (str, optional): Filter subscriptions by a specific value. Defaults to "".
+            window (int, optional): Maximum user requests in flight. Defaults to the session's max_threads.
+
+        Yields:
+            SubscriptionModel: The next subscription whose user is up to date.
+        """
+        if not self.cache.subscriptions.is_released():
+            for subscription in list(self.subscriptions):
+                yield subscription
+            return
+
+        raw_subscriptions = await self.list_raw_subscriptions(
+            identifiers, limit, sub_type, filter_by
+        )
+        subscriptions = [
+            SubscriptionModel(x, self.resolve_user(x), self) for x in raw_subscriptions
+        ]
+        known_user_ids = {x.user.id for x in self.subscriptions}
+        async with aclosing(
+            self.hydrate_subscriptions(subscriptions, window)
+        ) as hydrated:
+            async for subscription in hydrated:
+                if subscription.user.id not in known_user_ids:
+                    known_user_ids.add(subscription.user.id)
+                    self.subscriptions.append(subscription)
+                yield subscription
+
     async def get_chats(
         self,
         limit: int = 100,
@@ -615,35 +788,21 @@ class OnlyFansAuthModel(
         if not self.cache.chats.is_released():
             return self.chats
 
-        async def mass_recursive(
-            limit: int, offset: int, multiplier: int, depth: int = 1
-        ):
-            link = endpoint_links(global_limit=limit, global_offset=offset).list_chats
-
-            unpredictable_links, new_offset = api_helper.calculate_the_unpredictable(
-                link, offset, limit, multiplier, depth
-            )
-            links = unpredictable_links
-            results = await self.auth_session.bulk_json_requests(links)
-            items = [x["list"] for x in results]
-            if not items:
-                return items
-            if results[-1]["hasMore"]:
-                results2 = await mass_recursive(
-                    limit=limit,
-                    offset=limit + new_offset,
-                    multiplier=multiplier,
-                    depth=depth + 1,
-                )
-                items.extend(results2)
-            else:
-                self.cache.chats.activate()
-
-            return items
-
         multiplier = self.auth_session.get_session_manager().max_threads
-        recursive_results = await mass_recursive(limit, offset, multiplier)
-        results = list(chain.from_iterable(recursive_results))
+        paginator = OffsetPaginator(
+            self.auth_session.json_request,
+            lambda x: endpoint_links(global_limit=limit, global_offset=x).list_chats,
+            limit,
+            offset=offset,
+            workers=multiplier,
+        )
+        results: list[dict[str, Any]] = []
+        async with aclosing(paginator.pages()) as pages:
+            async for page in pages:
+                page.raise_for_error()
+                results.extend(page.items)
+                if not page.has_more:
+                    self.cache.chats.activate()
         temp_chats: set[ChatModel] = set()
         for result in results:
             temp_chats.add(ChatModel(result, self))
@@ -653,7 +812,7 @@ class OnlyFansAuthModel(
         return self.chats
 
     async def search_chats(self, query: str, limit: int = 100, offset: int = 0):
-        items = await recursion(
+        items = await paginate(
             category="search_chats",
             requester=self.get_requester(),
             max_items=limit,
@@ -673,37 +832,28 @@ class OnlyFansAuthModel(
         if not self.cache.mass_message_stats.is_released():
             return self.mass_message_stats
 
-        async def recursive(
-            resume: list[dict[str, Any]] | None, limit: int, offset: int
-        ):
-            link = endpoint_links(
-                global_limit=limit, global_offset=offset
-            ).mass_messages_stats
-            results = await self.auth_session.json_request(link)
-            items = results.get("list", [])
-            if not items:
-                return items
-            if resume:
-                for item in items:
-                    if any(x["id"] == item["id"] for x in resume):
-                        resume.sort(key=lambda x: x["id"], reverse=True)
-                        return resume
-                    else:
-                        resume.append(item)
-
-            if results["hasMore"]:
-                results2 = await recursive(
-                    resume=resume, limit=limit, offset=limit + offset
+        paginator = OffsetPaginator(
+            self.auth_session.json_request,
+            lambda x: endpoint_links(
+                global_limit=limit, global_offset=x
+            ).mass_messages_stats,
+            limit,
+            offset=offset,
+        )
+        # Resuming stops at the first stat we already have
+        known_ids = {x["id"] for x in resume} if resume else set()
+        items: list[dict[str, Any]] = resume if resume else []
+        async with aclosing(paginator.pages()) as pages:
+            async for page in pages:
+                page.raise_for_error()
+                new_items = list(
+                    takewhile(lambda x: x["id"] not in known_ids, page.items)
                 )
-                items.extend(results2)
-            else:
-                self.cache.mass_message_stats.activate()
-            if resume:
-                items = resume
-
-            return items
-
-        items: list[dict[str, Any]] = await recursive(resume, limit, offset)
+                items.extend(new_items)
+                if len(new_items) < len(page.items):
+                    break
+                if page.items and not page.has_more:
+                    self.cache.mass_message_stats.activate()
         items.sort(key=lambda x: x["id"], reverse=True)
         self.mass_message_stats = [MassMessageStatModel(x, self.user) for x in items]
         return self.mass_message_stats
@@ -713,39 +863,94 @@ class OnlyFansAuthModel(
         performer_id: int | None = None,
         limit: int | None = None,
         offset: int = 0,
+        workers: int | None = None,
     ):
-        max_pagination_limit = 50  # maximum number of results per request
         if not self.cache.paid_content.is_released():
             return self.paid_content
 
-        items = await recursion(
+        async with aclosing(
+            self.iter_paid_content(
+                performer_id=performer_id, limit=limit, offset=offset, workers=workers
+            )
+        ) as pages:
+            async for _contents in pages:
+                pass
+        return self.paid_content
+
+    async def iter_paid_content(
+        self,
+        performer_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        workers: int | None = None,
+    ) -> AsyncIterator[list[PostModel | MessageModel]]:
+        """
+        Streams purchased content, one page of models at a time.
+
+        Every model is also added to self.paid_content. The cache is only
+        activated once every page has been consumed.
+
+        Args:
+            performer_id (int | None, optional): Only keep content from this performer.
+            limit (int | None, optional): Maximum number of items to fetch (None = everything).
+            offset (int, optional): Offset to start from. Defaults to 0.
+            workers (int | None, optional): Pages requested concurrently past the current one, and
+                senders resolved concurrently (defaults to the session's max_threads).
+
+        Yields:
+            list[PostModel | MessageModel]: Content of the next page.
+
+        Raises:
+            PaginationError: A page failed, the content is incomplete.
+        """
+        max_pagination_limit = 50  # maximum number of results per request
+        if not self.cache.paid_content.is_released():
+            yield self.paid_content
+            return
+
+        if workers is None:
+            workers = self.auth_session.get_session_manager().max_threads
+        paginator = create_paginator(
             category="list_paid_content",
             requester=self.auth_session,
             max_items=limit,
             identifier=performer_id,
             limit=max_pagination_limit,
             offset=offset,
+            workers=workers,
         )
-        for item in items:
-            content = None
-            if item["responseType"] == "message":
-                user = await self.get_user(item["fromUser"]["id"])
-                if not user:
-                    user = self.resolve_user(item["fromUser"])
-                content = MessageModel(item, user)
-            elif item["responseType"] == "post":
-                user = self.resolve_user(item["author"])
-                content = PostModel(item, user)
-            if content:
-                author = content.get_author()
-                if performer_id:
-                    if performer_id == author.id:
-                        self.paid_content.append(content)
-                else:
-                    self.paid_content.append(content)
-                if not performer_id:
-                    self.cache.paid_content.activate()
-        return self.paid_content
+        async with aclosing(paginator.pages()) as pages:
+            async for page in pages:
+                page.raise_for_error()
+                # Every sender of the page is fetched once, concurrently
+                senders = await self.get_users(
+                    (
+                        item["fromUser"]["id"]
+                        for item in page.items
+                        if item["responseType"] == "message"
+                    ),
+                    window=workers,
+                )
+                contents: list[PostModel | MessageModel] = []
+                for item in page.items:
+                    content = None
+                    if item["responseType"] == "message":
+                        user = senders.get(item["fromUser"]["id"])
+                        if not user:
+                            user = self.resolve_user(item["fromUser"])
+                        content = MessageModel(item, user)
+                    elif item["responseType"] == "post":
+                        user = self.resolve_user(item["author"])
+                        content = PostModel(item, user)
+                    if content:
+                        author = content.get_author()
+                        if performer_id and performer_id != author.id:
+                            continue
+                        contents.append(content)
+                self.paid_content.extend(contents)
+                yield contents
+        if self.paid_content and not performer_id:
+            self.cache.paid_content.activate()
 
     async def get_scrapable_users(self):
         subscription_users = [x.user for x in self.subscriptions]
@@ -756,42 +961,63 @@ class OnlyFansAuthModel(
         response = await self.auth_session.json_request(url, method="POST")
         return response
 
-    async def get_transactions(self, limit: int = 100, offset: int = 0):
+    async def get_transactions(
+        self, limit: int = 100, offset: int = 0, workers: int | None = None
+    ):
         max_pagination_limit = 100  # maximum number of results per request
-        items = await recursion(
+        if workers is None:
+            workers = self.auth_session.get_session_manager().max_threads
+        items = await paginate(
             category="list_transactions",
             requester=self.auth_session,
             max_items=limit,
             limit=max_pagination_limit,
             offset=offset,
+            workers=workers,
         )
         return items
 
-    async def blocked_users(self, limit: int = 100, offset: int = 0):
+    async def blocked_users(
+        self, limit: int = 100, offset: int = 0, workers: int | None = None
+    ):
         max_pagination_limit = 100  # maximum number of results per request
-        items = await recursion(
+        if workers is None:
+            workers = self.auth_session.get_session_manager().max_threads
+        items = await paginate(
             category="list_blocked_users",
             requester=self.auth_session,
             max_items=limit,
             limit=max_pagination_limit,
             offset=offset,
+            workers=workers,
         )
         return items
 
-    async def restricted_users(self, limit: int = 100, offset: int = 0):
+    async def restricted_users(
+        self, limit: int = 100, offset: int = 0, workers: int | None = None
+    ):
         max_pagination_limit = 100  # maximum number of results per request
-        items = await recursion(
+        if workers is None:
+            workers = self.auth_session.get_session_manager().max_threads
+        items = await paginate(
             category="list_restricted_users",
             requester=self.auth_session,
             max_items=limit,
             limit=max_pagination_limit,
             offset=offset,
+            workers=workers,
         )
         return items
 
     def add_subscription(self, subscription: SubscriptionModel):
-        if subscription.user.id not in [x.user.id for x in self.subscriptions]:
-            self.subscriptions.append(subscription)
+        self.add_subscriptions([subscription])
+
+    def add_subscriptions(self, subscriptions: list[SubscriptionModel]):
+        known_user_ids = {x.user.id for x in self.subscriptions}
+        for subscription in subscriptions:
+            if subscription.user.id not in known_user_ids:
+                known_user_ids.add(subscription.user.id)
+                self.subscriptions.append(subscription)
 
     async def needs_age_verification(self):
         user = await self.get_authed_user()
@@ -830,7 +1056,7 @@ class OnlyFansAuthModel(
             ondato_sessions_url, method="POST", json=payload2
         )
         assert response2, "Failed to create session with Ondato sessions API"
-        result2: dict[str, Any] = await response2.json()
+        result2: dict[str, Any] = await read_json(response2)
         authorization_bearer = result2.get("accessToken")
         assert (
             authorization_bearer
@@ -848,7 +1074,7 @@ class OnlyFansAuthModel(
             custom_headers=headers,
         )
         assert response3, "Failed to retrieve omnichannel URL from Ondato API"
-        result3: dict[str, Any] = await response3.json()
+        result3: dict[str, Any] = await read_json(response3)
         short_url = result3.get("shortUrl")
         return short_url
 
@@ -891,4 +1117,4 @@ class OnlyFansAuthModel(
                 important_subscription_notifications
             )
         assert response, "Failed to update notification settings"
-        return await response.json()
+        return await read_json(response)
@@ -47,7 +47,12 @@ class ErrorDetails:
 
 
 class CookieParser:
+    # The converted cookie string is cached outside __dict__ so format() and
+    # convert() keep iterating the cookie fields only
+    __slots__ = ("__dict__", "_converted")
+
     def __init__(self, options: str) -> None:
+        self._converted: str | None = None
         new_dict: dict[str, Any] = {}
         for crumble in options.strip().split(";"):
             if crumble:
@@ -62,6 +67,11 @@ class CookieParser:
         self.auth_uid_ = new_dict.get("auth_uid_", "")
         self.aws_waf_token = new_dict.get("aws-waf-token", "")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_converted":
+            object.__setattr__(self, "_converted", None)
+
     def format(self):
         """
         Typically used for adding cookies to requests
@@ -72,6 +82,8 @@ class CookieParser:
         return final_dict
 
     def convert(self):
+        if self._converted is not None:
+            return self._converted
         new_dict = ""
         for key, value in self.__dict__.items():
             key = key.replace("auth_uniq_", f"auth_uniq_{self.auth_id}")
@@ -79,6 +91,7 @@ class CookieParser:
             key = key.replace("aws_waf_token", f"aws-waf-token")
             new_dict += f"{key}={value}; "
         new_dict = new_dict.strip()
+        self._converted = new_dict
         return new_dict
 
 
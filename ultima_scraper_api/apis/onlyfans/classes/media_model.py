@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any
 
 from inflection import singularize
 
 from ultima_scraper_api.apis.onlyfans.classes.only_drm import DRMMedia
 from ultima_scraper_api.helpers import media_types
+from ultima_scraper_api.helpers.lazy_fields import RawField, init_lazy, lazy_attribute
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.onlyfans.classes import content_types
@@ -24,14 +26,25 @@ class MediaFileSource:
 
 
 class DRM:
+    __slots__ = ("__raw__", "__values__", "__media__", "__dict__")
+
     def __init__(self, option: dict[str, Any], media: MediaModel) -> None:
-        self.dash: DRMManifest = DRMManifest(
-            option["manifest"]["dash"], option["signature"]["dash"], media
+        init_lazy(self, option)
+        self.__media__ = media
+
+    @lazy_attribute
+    def dash(self) -> DRMManifest:
+        option = self.__raw__
+        return DRMManifest(
+            option["manifest"]["dash"], option["signature"]["dash"], self.__media__
         )
-        self.hls: DRMManifest = DRMManifest(
-            option["manifest"]["hls"], option["signature"]["hls"], media
+
+    @lazy_attribute
+    def hls(self) -> DRMManifest:
+        option = self.__raw__
+        return DRMManifest(
+            option["manifest"]["hls"], option["signature"]["hls"], self.__media__
         )
-        self.__media__ = media
 
     def get_mpd_url(self) -> str:
         authed_drm = self.__media__.content.author.get_authed().drm
@@ -71,67 +84,88 @@ class DRMManifest:
         self.__media__ = media
 
 
+def _file_source(option: Any) -> MediaFileSource | None:
+    return MediaFileSource(option) if isinstance(option, dict) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _media_type(api_type: str) -> str:
+    from ultima_scraper_api import MediaType
+
+    if (media_type_value := MediaType.from_api_type(api_type)) is None:
+        raise ValueError(f"Unknown media type: {api_type}")
+    return singularize(media_type_value)
+
+
 class MediaFiles:
     """Container for different media file versions (full, thumb, preview, etc.)."""
 
+    __slots__ = ("__raw__", "__values__", "__media__", "__dict__")
+
+    thumb: RawField[MediaFileSource | None] = RawField(
+        default=None, convert=_file_source
+    )
+    preview: RawField[MediaFileSource | None] = RawField(
+        default=None, convert=_file_source
+    )
+    squarePreview: RawField[MediaFileSource | None] = RawField(
+        default=None, convert=_file_source
+    )
+
     def __init__(self, option: dict[str, Any], media: MediaModel) -> None:
-        full_opt: dict[str, Any] | None = option.get("full") or option.get("source")
-        thumb_opt: dict[str, Any] | None = option.get("thumb")
-        preview_opt: dict[str, Any] | None = option.get("preview")
-        square_opt: dict[str, Any] | None = option.get("squarePreview")
+        init_lazy(self, option)
+        self.__media__ = media
 
-        self.full: MediaFileSource | None = (
-            MediaFileSource(full_opt) if isinstance(full_opt, dict) else None
-        )
-        self.thumb: MediaFileSource | None = (
-            MediaFileSource(thumb_opt) if isinstance(thumb_opt, dict) else None
-        )
-        self.preview: MediaFileSource | None = (
-            MediaFileSource(preview_opt) if isinstance(preview_opt, dict) else None
-        )
-        self.squarePreview: MediaFileSource | None = (
-            MediaFileSource(square_opt) if isinstance(square_opt, dict) else None
-        )
-        self.drm: DRM | None = DRM(option["drm"], media) if "drm" in option else None
+    @lazy_attribute
+    def full(self) -> MediaFileSource | None:
+        return _file_source(self.__raw__.get("full") or self.__raw__.get("source"))
+
+    @lazy_attribute
+    def drm(self) -> DRM | None:
+        option = self.__raw__
+        return DRM(option["drm"], self.__media__) if "drm" in option else None
 
 
 class MediaModel:
-    """Model for OnlyFans media items (photos, videos, etc.)."""
+    """Model for OnlyFans media items (photos, videos, etc.).
 
-    def __init__(self, option: dict[str, Any], content: content_types) -> None:
-        from ultima_scraper_api import MediaType
+    A lazy view over the raw API dict, the file and DRM wrappers are built on
+    first access.
+    """
+
+    __slots__ = ("id", "content", "type", "__raw__", "__values__", "__dict__")
+
+    convertedToVideo: RawField[bool] = RawField(default=False)
+    canView: RawField[bool] = RawField(default=False)
+    hasError: RawField[bool] = RawField(default=False)
+    created_at: RawField[str | None] = RawField("createdAt", default=None)
+    isReady: RawField[bool] = RawField(default=False)
+    duration: RawField[int] = RawField(default=0)
+    hasCustomPreview: RawField[bool] = RawField(default=False)
+    # Video quality sources
+    videoSources: RawField[dict[str, str | None]] = RawField(factory=dict)
 
+    def __init__(self, option: dict[str, Any], content: content_types) -> None:
         self.id: int = option["id"]
         self.content: content_types = content
-        if (media_type_value := MediaType.from_api_type(option["type"])) is None:
-            raise ValueError(f"Unknown media type: {option['type']}")
-        self.type: str = singularize(media_type_value)
-        self.convertedToVideo: bool = option.get("convertedToVideo", False)
-        self.canView: bool = option.get("canView", False)
-        self.hasError: bool = option.get("hasError", False)
-        self.created_at: str | None = option.get("createdAt")
-        self.isReady: bool = option.get("isReady", False)
-        self.duration: int = option.get("duration", 0)
-        self.hasCustomPreview: bool = option.get("hasCustomPreview", False)
+        # Unknown types are rejected up front, the conversion is cached per type
+        self.type: str = _media_type(option["type"])
+        # Store raw dict for backward compatibility
+        init_lazy(self, option)
 
+    @lazy_attribute
+    def files(self) -> MediaFiles | None:
         # Parse nested files structure
-        files_data = option.get("files", {})
-        self.files: MediaFiles | None = (
-            MediaFiles(files_data, self) if files_data else None
-        )
+        files_data = self.__raw__.get("files", {})
+        return MediaFiles(files_data, self) if files_data else None
 
+    @lazy_attribute
+    def source(self) -> dict[str, Any]:
         # Handle legacy "source" format (for backward compatibility)
-        if "source" in option and not self.files:
+        if "source" in self.__raw__ and not self.files:
             # Legacy format uses "source" dict directly
-            self.source: dict[str, Any] = option["source"]
-        else:
-            self.source: dict[str, Any] = {}
-
-        # Video quality sources
-        self.videoSources: dict[str, str | None] = option.get("videoSources", {})
-
-        # Store raw dict for backward compatibility
-        self.__raw__ = option
+            return self.__raw__["source"]
+        return {}
 
     def to_dict(self) -> dict[str, Any]:
         """Convert back to dict format for backward compatibility."""
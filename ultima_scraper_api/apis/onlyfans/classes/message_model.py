@@ -8,47 +8,61 @@ from ultima_scraper_api.apis.onlyfans.classes.extras import endpoint_links
 from ultima_scraper_api.apis.onlyfans.classes.mass_message_model import MassMessageModel
 from ultima_scraper_api.apis.onlyfans.classes.media_model import MediaModel
 from ultima_scraper_api.apis.onlyfans.urls import APIRoutes
+from ultima_scraper_api.helpers.json_helper import read_json
+from ultima_scraper_api.helpers.lazy_fields import RawField, lazy_attribute
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.onlyfans.classes.user_model import UserModel
 
 
 class MessageModel(SiteContent):
+    """Message, a lazy view over the raw API dict.
+
+    Fields are read on first access, media is built on first access too.
+    """
+
+    __slots__ = ("user",)
+
+    responseType: RawField[str] = RawField(default="message")
+    text: RawField[str] = RawField(default="")
+    lockedText: RawField[Optional[bool]] = RawField(default=None)
+    isFree: RawField[Optional[bool]] = RawField(default=None)
+    price: RawField[int | None] = RawField(default=None)
+    isMediaReady: RawField[Optional[bool]] = RawField(default=None)
+    media_count: RawField[Optional[int]] = RawField("mediaCount", default=None)
+    previews: RawField[list[int]] = RawField(factory=list)
+    isTip: RawField[Optional[bool]] = RawField(default=None)
+    isReportedByMe: RawField[Optional[bool]] = RawField(default=None)
+    is_from_queue: RawField[bool | None] = RawField("isFromQueue", default=None)
+    queue_id: RawField[Optional[int]] = RawField("queueId", default=None)
+    canUnsendQueue: RawField[Optional[bool]] = RawField(default=None)
+    unsendSecondsQueue: RawField[Optional[int]] = RawField(default=None)
+    isOpened: RawField[Optional[bool]] = RawField(default=None)
+    isNew: RawField[Optional[bool]] = RawField(default=None)
+    cancelSeconds: RawField[Optional[int]] = RawField(default=None)
+    isLiked: RawField[Optional[bool]] = RawField(default=None)
+    canPurchase: RawField[Optional[bool]] = RawField(default=None)
+    canPurchaseReason: RawField[Optional[str]] = RawField(default=None)
+    canReport: RawField[Optional[bool]] = RawField(default=None)
+    expiredAt: RawField[Any] = RawField(default=None)
+    created_at: RawField[datetime] = RawField(
+        "createdAt", convert=datetime.fromisoformat
+    )
+    changedAt: RawField[Optional[str]] = RawField(default=None)
+
     def __init__(self, option: dict[str, Any], user: UserModel) -> None:
         author = user.get_authed().resolve_user(option["fromUser"])
         assert author, "Author not found"
         SiteContent.__init__(self, option, author)
         self.user = user
-        self.responseType: str = option.get("responseType", "message")
-        self.text: str = option.get("text", "")
-        self.lockedText: Optional[bool] = option.get("lockedText")
-        self.isFree: Optional[bool] = option.get("isFree")
-        self.price: int | None = option.get("price")
-        self.isMediaReady: Optional[bool] = option.get("isMediaReady")
-        self.media_count: Optional[int] = option.get("mediaCount")
-        media_data: list[dict[str, Any]] = option.get("media", [])
-        self.media: list[MediaModel] = [MediaModel(m, self) for m in media_data]
-        self.previews: list[int] = option.get("previews", [])
-        self.isTip: Optional[bool] = option.get("isTip")
-        self.isReportedByMe: Optional[bool] = option.get("isReportedByMe")
-        self.is_from_queue: bool | None = option.get("isFromQueue")
-        self.queue_id: Optional[int] = option.get("queueId")
-        self.canUnsendQueue: Optional[bool] = option.get("canUnsendQueue")
-        self.unsendSecondsQueue: Optional[int] = option.get("unsendSecondsQueue")
-        self.isOpened: Optional[bool] = option.get("isOpened")
-        self.isNew: Optional[bool] = option.get("isNew")
-        self.cancelSeconds: Optional[int] = option.get("cancelSeconds")
-        self.isLiked: Optional[bool] = option.get("isLiked")
-        self.canPurchase: Optional[bool] = option.get("canPurchase")
-        self.canPurchaseReason: Optional[str] = option.get("canPurchaseReason")
-        self.canReport: Optional[bool] = option.get("canReport")
-        self.expiredAt: Any = option.get("expiredAt")
-        self.created_at: datetime = datetime.fromisoformat(option["createdAt"])
-        self.changedAt: Optional[str] = option.get("changedAt")
         author.scrape_manager.scraped.Messages[self.id] = self
         if self.is_mass_message():
             MassMessageModel(option, self.author)
 
+    @lazy_attribute
+    def media(self) -> list[MediaModel]:
+        return [MediaModel(m, self) for m in self.__raw__.get("media", [])]
+
     def get_author(self):
         return self.author
 
@@ -106,7 +120,7 @@ class MessageModel(SiteContent):
             await self.get_author().get_requester().request(link, method="POST", json=x)
         )
         assert response is not None, "No response from buy_message request"
-        result = await response.json()
+        result = await read_json(response)
         return result
 
     def get_scrape_job_params(self) -> dict[str, Any]:
@@ -147,7 +161,7 @@ class MessageModel(SiteContent):
             .request(url, method=method, json={"withUserId": self.user.id})
         )
         assert response is not None, "No response from like_message request"
-        result = await response.json()
+        result = await read_json(response)
         # Update local state based on toggle
         if "error" not in result:
             self.isLiked = not self.isLiked
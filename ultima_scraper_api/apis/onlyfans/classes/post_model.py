@@ -7,6 +7,7 @@ from ultima_scraper_api.apis.onlyfans import SiteContent
 from ultima_scraper_api.apis.onlyfans.classes.comment_model import CommentModel
 from ultima_scraper_api.apis.onlyfans.classes.extras import endpoint_links
 from ultima_scraper_api.apis.onlyfans.classes.media_model import MediaModel
+from ultima_scraper_api.helpers.lazy_fields import RawField, lazy_attribute
 
 if TYPE_CHECKING:
     from ultima_scraper_api.apis.onlyfans.classes.user_model import UserModel
@@ -28,68 +29,88 @@ class PromotionContentModel:
         )
 
 
+def _text(value: Any) -> str:
+    return str(value or "")
+
+
 class PostModel(SiteContent):
+    """Post, a lazy view over the raw API dict.
+
+    Fields are read on first access, media, linked users and linked posts are
+    built on first access too.
+    """
+
+    __slots__ = ()
+
+    responseType: RawField[str] = RawField()
+    text: RawField[str] = RawField(default="", convert=_text)
+    rawText: RawField[str] = RawField(default="", convert=_text)
+    lockedText: RawField[bool] = RawField(default=False)
+    isFavorite: RawField[bool] = RawField(default=False)
+    isReportedByMe: RawField[bool] = RawField(default=False)
+    canReport: RawField[bool] = RawField(default=False)
+    canDelete: RawField[bool] = RawField(default=False)
+    canComment: RawField[bool] = RawField(default=False)
+    canEdit: RawField[bool] = RawField(default=False)
+    isPinned: RawField[bool] = RawField(default=False)
+    favoritesCount: RawField[int] = RawField(default=0)
+    media_count: RawField[int] = RawField("mediaCount", default=0)
+    isMediaReady: RawField[bool] = RawField(default=False)
+    voting: RawField[dict[str, Any]] = RawField(factory=dict)
+    isOpened: RawField[bool] = RawField(default=False)
+    canToggleFavorite: RawField[bool] = RawField(default=False)
+    streamId: RawField[int | None] = RawField(default=None)
+    stream_duration: RawField[int | None] = RawField("streamDuration", default=None)
+    price: RawField[float | None] = RawField(default=None)
+    hasVoting: RawField[bool] = RawField(default=False)
+    isAddedToBookmarks: RawField[bool] = RawField(default=False)
+    isArchived: RawField[bool] = RawField(default=False)
+    isDeleted: RawField[bool] = RawField(default=False)
+    hasUrl: RawField[bool] = RawField(default=False)
+    commentsCount: RawField[int] = RawField(default=0)
+    mentionedUsers: RawField[list[dict[str, Any]]] = RawField(factory=list)
+    canViewMedia: RawField[bool] = RawField(default=False)
+    previews: RawField[list[int]] = RawField("preview", factory=list)
+    canPurchase: RawField[bool] = RawField(default=False)
+    fund_raising: RawField[dict[str, Any] | None] = RawField(
+        "fundRaising", default=None
+    )
+    created_at: RawField[datetime] = RawField(
+        "postedAt", convert=datetime.fromisoformat
+    )
+    postedAtPrecise: RawField[str] = RawField()
+    expiredAt: RawField[Any] = RawField(default=None)
+
     def __init__(self, option: dict[str, Any], user: UserModel) -> None:
         SiteContent.__init__(self, option, user)
-        self.responseType: str = option["responseType"]
-        text: str = option.get("text", "")
-        self.text = str(text or "")
-        raw_text: str = option.get("rawText", "")
-        self.rawText = str(raw_text or "")
-        self.lockedText: bool = option.get("lockedText", False)
-        self.isFavorite: bool = option.get("isFavorite", False)
-        self.isReportedByMe: bool = option.get("isReportedByMe", False)
-        self.canReport: bool = option.get("canReport", False)
-        self.canDelete: bool = option.get("canDelete", False)
-        self.canComment: bool = option.get("canComment", False)
-        self.canEdit: bool = option.get("canEdit", False)
-        self.isPinned: bool = option.get("isPinned", False)
-        media_data: list[dict[str, Any]] = option.get("media", [])
-        self.media: list[MediaModel] = [MediaModel(m, self) for m in media_data]
-        self.favoritesCount: int = option.get("favoritesCount", 0)
-        self.media_count: int = option.get("mediaCount", 0)
-        self.isMediaReady: bool = option.get("isMediaReady", False)
-        self.voting: dict[str, Any] = option.get("voting", {})
-        self.isOpened: bool = option.get("isOpened", False)
-        self.canToggleFavorite: bool = option.get("canToggleFavorite", False)
-        self.streamId: int | None = option.get("streamId")
-        self.stream_duration: int | None = option.get("streamDuration")
-        self.price: float | None = option.get("price")
-        self.hasVoting: bool = option.get("hasVoting", False)
-        self.isAddedToBookmarks: bool = option.get("isAddedToBookmarks", False)
-        self.isArchived: bool = option.get("isArchived", False)
-        self.isDeleted: bool = option.get("isDeleted", False)
-        self.hasUrl: bool = option.get("hasUrl", False)
-        self.commentsCount: int = option.get("commentsCount", 0)
-        self.mentionedUsers: list[dict[str, Any]] = option.get("mentionedUsers", [])
-        self.linkedUsers: list[UserModel] = [
-            self.get_author().get_authed().resolve_user(x)
-            for x in option.get("linkedUsers", [])
-        ]
+        user.scrape_manager.scraped.Posts[self.id] = self
+
+    @lazy_attribute
+    def media(self) -> list[MediaModel]:
+        return [MediaModel(m, self) for m in self.__raw__.get("media", [])]
 
-        self.linkedPosts: list[PostModel] = [
-            PostModel(p, self.get_author().get_authed().resolve_user(p["author"]))
-            for p in option.get("linkedPosts", [])
+    @lazy_attribute
+    def linkedUsers(self) -> list[UserModel]:
+        authed = self.get_author().get_authed()
+        return [authed.resolve_user(x) for x in self.__raw__.get("linkedUsers", [])]
+
+    @lazy_attribute
+    def linkedPosts(self) -> list[PostModel]:
+        authed = self.get_author().get_authed()
+        return [
+            PostModel(p, authed.resolve_user(p["author"]))
+            for p in self.__raw__.get("linkedPosts", [])
         ]
-        self.promotionContent: list[PromotionContentModel] = [
-            PromotionContentModel(p) for p in option.get("promotionContent", [])
+
+    @lazy_attribute
+    def promotionContent(self) -> list[PromotionContentModel]:
+        return [
+            PromotionContentModel(p) for p in self.__raw__.get("promotionContent", [])
         ]
-        if self.linkedUsers:
-            pass
-        if self.linkedUsers and not self.promotionContent:
-            pass
-        if self.linkedPosts and not self.promotionContent:
-            pass
-
-        self.canViewMedia: bool = option.get("canViewMedia", False)
-        self.previews: list[int] = option.get("preview", [])
-        self.canPurchase: bool = option.get("canPurchase", False)
-        self.comments: list[CommentModel] = []
-        self.fund_raising: dict[str, Any] | None = option.get("fundRaising")
-        self.created_at: datetime = datetime.fromisoformat(option["postedAt"])
-        self.postedAtPrecise: str = option["postedAtPrecise"]
-        self.expiredAt: Any = option.get("expiredAt")
-        user.scrape_manager.scraped.Posts[self.id] = self
+
+    @lazy_attribute
+    def comments(self) -> list[CommentModel]:
+        return []
 
     def get_author(self):
         return self.author
@@ -123,18 +144,7 @@ class PostModel(SiteContent):
         return result
 
     async def get_comments(self):
-        epl = endpoint_links()
-        link = epl.list_comments(self.responseType, self.id)
-        links = epl.create_links(link, self.commentsCount)
-        if links:
-            results: list[dict[str, Any]] = (
-                await self.author.scrape_manager.bulk_scrape(links)
-            )
-            authed = self.author.get_authed()
-            final_results = [
-                CommentModel(x, authed.resolve_user(x["author"])) for x in results
-            ]
-            self.comments = final_results
+        await self.author.load_comments([self])
         return self.comments
 
     async def favorite(self):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import sys
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 from urllib import parse
@@ -8,17 +9,26 @@ from urllib import parse
 import ultima_scraper_api.apis.onlyfans.classes.message_model as message_model
 from ultima_scraper_api.apis.onlyfans import SubscriptionType, SubscriptionTypeEnum
 from ultima_scraper_api.apis.onlyfans.classes import post_model
+from ultima_scraper_api.apis.onlyfans.classes.comment_model import CommentModel
 from ultima_scraper_api.apis.onlyfans.classes.extras import ErrorDetails, endpoint_links
 from ultima_scraper_api.apis.onlyfans.classes.hightlight_model import HighlightModel
 from ultima_scraper_api.apis.onlyfans.classes.mass_message_model import MassMessageModel
 from ultima_scraper_api.apis.onlyfans.classes.story_model import StoryModel
 from ultima_scraper_api.apis.onlyfans.urls import APIRoutes
 from ultima_scraper_api.apis.user_streamliner import StreamlinedUser
+from ultima_scraper_api.managers.pagination_manager import (
+    CursorPaginator,
+    OffsetPaginator,
+    collect_items,
+)
 from ultima_scraper_api.managers.redis import with_hooks
 from ultima_scraper_api.managers.scrape_manager import (
+    ScrapeFailure,
     ScrapeManager,
     ScrapeProgressCallback,
+    ScrapeReport,
 )
+from ultima_scraper_api.managers.watermark_manager import Watermark
 
 if TYPE_CHECKING:
     from ultima_scraper_api import OnlyFansAPI
@@ -26,20 +36,25 @@ if TYPE_CHECKING:
     from ultima_scraper_api.apis.onlyfans.classes.post_model import PostModel
     from ultima_scraper_api.managers.session_manager import AuthedSession
 
-DEFAULT_RECURSION_LIMIT = sys.getrecursionlimit()
 
+def _post_timestamp(post: dict[str, Any]) -> float:
+    return float(post.get("postedAtPrecise") or 0)
+
+
+PaginatedCategory = Literal[
+    "list_posts",
+    "list_vault_media",
+    "list_subscriptions",
+    "list_paid_content",
+    "list_blocked_users",
+    "list_restricted_users",
+    "list_transactions",
+    "search_chats",
+]
 
-async def recursion(
-    category: Literal[
-        "list_posts",
-        "list_vault_media",
-        "list_subscriptions",
-        "list_paid_content",
-        "list_blocked_users",
-        "list_restricted_users",
-        "list_transactions",
-        "search_chats",
-    ],
+
+def create_paginator(
+    category: PaginatedCategory,
     requester: AuthedSession,
     max_items: int | None,
     identifier: int | str | None = None,
@@ -49,72 +64,123 @@ async def recursion(
     before_date: datetime | float | None = None,
     after_date: datetime | float | None = None,
     item_count: int = 0,
-) -> list[dict[str, Any]]:
-    if max_items is None:
-        max_items = sys.maxsize
-    if item_count >= max_items:
-        return []
-    sys.setrecursionlimit(1500)
-    match category:
-        case "list_posts":
-            assert identifier
-            link = endpoint_links().list_posts(
-                identifier=identifier,
-                limit=limit,
-                before_date=before_date,
-                after_date=after_date,
-            )
-        case "list_vault_media":
-            assert identifier
-            link = endpoint_links().list_vault_media(
-                list_id=identifier, limit=limit, offset=offset
-            )
-        case "list_subscriptions":
-            link = endpoint_links().list_subscriptions(
-                limit=limit, offset=offset, sub_type=SubscriptionTypeEnum(query_type)
-            )
-        case "list_paid_content":
-            link = APIRoutes().list_paid_content(
-                limit=limit, offset=offset, performer_id=identifier
-            )
-        case "list_blocked_users":
-            link = APIRoutes().blocked_users(limit=limit, offset=offset)
-        case "list_restricted_users":
-            link = APIRoutes().restricted_users(limit=limit, offset=offset)
-        case "list_transactions":
-            link = APIRoutes().transaction_history(limit=limit, offset=offset)
-        case "search_chats":
-            assert isinstance(identifier, str)
-            link = APIRoutes().search_chats(
-                query=identifier, limit=limit, offset=offset
+    workers: int = 1,
+) -> OffsetPaginator | CursorPaginator:
+    """
+    Creates the paginator that walks a list endpoint.
+
+    Posts filtered by date follow the ``tailMarker`` cursor, everything else is
+    offset based and can keep ``workers`` pages in flight.
+
+    Args:
+        category: Endpoint to paginate.
+        requester: Session used to fetch the pages.
+        max_items: Maximum number of items to return (None = everything).
+        item_count: Items the caller already has, subtracted from max_items.
+        workers: Offset pages requested concurrently.
+
+    Returns:
+        OffsetPaginator | CursorPaginator: Paginator yielding raw pages.
+    """
+    if max_items is not None:
+        max_items = max(0, max_items - item_count)
+    fetch = requester.json_request
+    if category == "list_posts" and (before_date or after_date):
+        assert identifier
+
+        def posts_link(marker: float | None) -> str:
+            epl = endpoint_links()
+            if before_date:
+                return epl.list_posts(
+                    identifier, limit=limit, before_date=marker or before_date
+                )
+            return epl.list_posts(
+                identifier, limit=limit, after_date=marker or after_date
             )
 
-    results = await requester.json_request(link)
-    if isinstance(results, list):
-        if not results:
-            sys.setrecursionlimit(DEFAULT_RECURSION_LIMIT)
-            return results
-    items: list[dict[str, Any]] = results.get("list", [])
-    after_date = results.get("tailMarker")
-    if len(items) + item_count >= max_items:
-        items = items[:max_items]
-        sys.setrecursionlimit(DEFAULT_RECURSION_LIMIT)
-        return items
-    if results["hasMore"]:
-        results2 = await recursion(
-            category,
-            requester,
+        return CursorPaginator(
+            fetch,
+            posts_link,
+            lambda response, _items: response.get("tailMarker"),
             max_items=max_items,
-            identifier=identifier,
-            query_type=query_type,
-            limit=limit,
-            offset=offset + limit,
-            before_date=before_date,
-            after_date=after_date,
-            item_count=item_count + len(items),
         )
-        items.extend(results2)
-    return items
+
+    def offset_link(offset: int) -> str:
+        match category:
+            case "list_posts":
+                assert identifier
+                link = endpoint_links().list_posts(
+                    identifier, limit=limit, offset=offset
+                )
+            case "list_vault_media":
+                assert identifier
+                link = endpoint_links().list_vault_media(
+                    list_id=identifier, limit=limit, offset=offset
+                )
+            case "list_subscriptions":
+                link = endpoint_links().list_subscriptions(
+                    limit=limit,
+                    offset=offset,
+                    sub_type=SubscriptionTypeEnum(query_type),
+                )
+            case "list_paid_content":
+                link = APIRoutes().list_paid_content(
+                    limit=limit, offset=offset, performer_id=identifier
+                )
+            case "list_blocked_users":
+                link = APIRoutes().blocked_users(limit=limit, offset=offset)
+            case "list_restricted_users":
+                link = APIRoutes().restricted_users(limit=limit, offset=offset)
+            case "list_transactions":
+                link = APIRoutes().transaction_history(limit=limit, offset=offset)
+            case "search_chats":
+                assert isinstance(identifier, str)
+                link = APIRoutes().search_chats(
+                    query=identifier, limit=limit, offset=offset
+                )
+        return link
+
+    return OffsetPaginator(
+        fetch,
+        offset_link,
+        limit,
+        offset=offset,
+        max_items=max_items,
+        workers=workers,
+    )
+
+
+async def paginate(
+    category: PaginatedCategory,
+    requester: AuthedSession,
+    max_items: int | None,
+    identifier: int | str | None = None,
+    query_type: str | None = None,
+    limit: int = 10,
+    offset: int = 0,
+    before_date: datetime | float | None = None,
+    after_date: datetime | float | None = None,
+    item_count: int = 0,
+    workers: int = 1,
+) -> list[dict[str, Any]]:
+    paginator = create_paginator(
+        category,
+        requester,
+        max_items,
+        identifier=identifier,
+        query_type=query_type,
+        limit=limit,
+        offset=offset,
+        before_date=before_date,
+        after_date=after_date,
+        item_count=item_count,
+        workers=workers,
+    )
+    return await collect_items(paginator)
+
+
+# Kept for callers importing the old recursive helper
+recursion = paginate
 
 
 class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
@@ -382,8 +448,6 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
         self.ws_auth_token: str | None = option.get("wsAuthToken")
         # Custom
         found_user = authed.find_user(self.id)
-        if not found_user:
-            authed.add_user(self)
         self.username = self.get_username()
         self.download_info: dict[str, Any] = {}
         self.duplicate_media: list[Any] = []
@@ -393,6 +457,9 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
         self.__raw__ = option
         self.__db_user__: Any = None
         super().__init__(authed)
+        if not found_user:
+            # Registered once aliases exist, they're indexed with the username
+            authed.add_user(self)
 
     def update_from_dict(self, option: dict[str, Any]) -> None:
         """Update the user's properties with fresh data from API response.
@@ -406,6 +473,7 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
             "download_info": self.download_info,
             "duplicate_media": self.duplicate_media,
             "__db_user__": self.__db_user__,
+            "aliases": self.aliases,
         }
 
         # Re-run the initialization logic with new data
@@ -415,6 +483,12 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
         # Restore preserved data
         for key, value in preserved_data.items():
             setattr(self, key, value)
+        # The username may have changed
+        self.get_authed().index_user(self)
+
+    def add_aliases(self, aliases: list[str]):
+        super().add_aliases(aliases)
+        self.get_authed().index_user(self)
 
     def get_username(self):
         if not self.username:
@@ -520,6 +594,7 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
         after_date: datetime | float | None = None,
         on_progress: ScrapeProgressCallback | None = None,
         job_id: str | None = None,
+        incremental: bool = False,
     ) -> list[PostModel]:
         """
         Retrieves posts from the user's profile.
@@ -531,10 +606,50 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
             after_date (datetime | float | None, optional): Retrieve posts after this date. Defaults to None.
             on_progress: Optional callback for progress updates (completed_pages, total_pages, items_so_far).
             job_id: Optional job ID to use for progress events. If not provided, uses "api".
+            incremental: Only fetch posts newer than the previous incremental run.
 
         Returns:
             list[create_post]: List of scraped posts.
         """
+        final_results: list[PostModel] = []
+        async with aclosing(
+            self.iter_posts(
+                label=label,
+                limit=limit,
+                before_date=before_date,
+                after_date=after_date,
+                on_progress=on_progress,
+                job_id=job_id,
+                incremental=incremental,
+            )
+        ) as pages:
+            async for posts in pages:
+                final_results.extend(posts)
+        return final_results
+
+    async def iter_posts(
+        self,
+        label: Literal["archived", "private_archived"] | str = "",
+        limit: int | None = None,
+        before_date: datetime | float | None = None,
+        after_date: datetime | float | None = None,
+        on_progress: ScrapeProgressCallback | None = None,
+        job_id: str | None = None,
+        incremental: bool = False,
+    ) -> AsyncIterator[list[PostModel]]:
+        """
+        Streams posts from the user's profile, one page of models at a time.
+
+        Takes the same arguments as get_posts. Pages are yielded in order as soon
+        as they arrive, so only the page being processed is held in memory.
+
+        With incremental, the walk stops at the newest post seen by the previous
+        incremental run. The watermark only advances once every page has been
+        consumed without failures.
+
+        Yields:
+            list[PostModel]: Posts of the next page.
+        """
         from ultima_scraper_api.managers.redis import publish_custom_event
 
         # Use provided job_id or fall back to "api" for standalone usage
@@ -547,56 +662,113 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
             api_count = self.archived_posts_count
         elif label == "private_archived":
             if not self.is_authed_user():
-                return []
+                return
             api_count = self.private_archived_posts_count
         limit = limit if limit else api_count
 
-        # Create internal progress callback that publishes events with user context
-        async def _emit_progress(
-            completed_pages: int, total_pages: int, items_so_far: int
-        ) -> None:
-            await publish_custom_event(
-                {
-                    "event": "scrape_progress",
-                    "job_id": effective_job_id,
-                    "username": self.username,
-                    "user_id": self.id,
-                    "content_type": "Posts",
-                    "status": "progress",
-                    "items_scraped": items_so_far,
-                    "items_saved": 0,
-                    "total_items": limit,  # Expected total items from API count
-                    "page": completed_pages,
-                    "total_pages": total_pages,
-                    "has_more": completed_pages < total_pages,
-                }
-            )
-            # Also call external callback if provided
-            if on_progress:
-                await on_progress(completed_pages, total_pages, items_so_far)
-
-        if after_date is None and before_date is None:
-            link = epl.list_posts(self.id, label=label)
-            links = epl.create_links(
-                link,
-                limit,
-                pagination_limit=max_pagination_limit,
-            )
-            results = await self.scrape_manager.bulk_scrape(
-                links, on_progress=_emit_progress
-            )
-        else:
-            results = await recursion(
-                category="list_posts",
-                requester=self.get_requester(),
-                max_items=limit,
-                identifier=self.id,
-                limit=max_pagination_limit,
-                before_date=before_date,
-                after_date=after_date,
-            )
-        final_results = self.finalize_content_set(results)
-        return final_results
+        authed = self.get_authed()
+        content_type = f"Posts:{label}" if label else "Posts"
+        watermark_store = self.get_api().get_watermark_store() if incremental else None
+        since = None
+        if watermark_store:
+            watermark = await watermark_store.get(authed.id, self.id, content_type)
+            since = watermark.timestamp if watermark else None
+        newest = Watermark()
+        report = ScrapeReport()
+
+        async def walk_pages() -> AsyncIterator[list[dict[str, Any]]]:
+            if after_date is None and before_date is None:
+                link = epl.list_posts(self.id, label=label)
+                links = epl.create_links(
+                    link,
+                    limit,
+                    pagination_limit=max_pagination_limit,
+                )
+                if since is not None:
+                    # An incremental walk usually ends within the first pages, so
+                    # request them one by one and stop at the watermark
+                    for link in links:
+                        async with aclosing(
+                            self.scrape_manager.iter_scrape([link], report=report)
+                        ) as pages:
+                            async for _url, result in pages:
+                                yield result if isinstance(result, list) else []
+                    return
+                async with aclosing(
+                    self.scrape_manager.iter_scrape(links, report=report)
+                ) as pages:
+                    async for _url, result in pages:
+                        yield result if isinstance(result, list) else []
+            else:
+                paginator = create_paginator(
+                    category="list_posts",
+                    requester=self.get_requester(),
+                    max_items=limit,
+                    identifier=self.id,
+                    limit=max_pagination_limit,
+                    before_date=before_date,
+                    after_date=after_date,
+                )
+                async with aclosing(paginator.pages()) as pages:
+                    async for page in pages:
+                        if page.error is not None:
+                            report.failures.append(
+                                ScrapeFailure(
+                                    url=page.url or "",
+                                    status=None,
+                                    attempts=1,
+                                    error=str(page.error),
+                                )
+                            )
+                        yield page.items
+
+        total_pages = -(-limit // max_pagination_limit) if limit else 0
+        completed_pages = 0
+        items_so_far = 0
+        async with aclosing(walk_pages()) as pages:
+            async for items in pages:
+                posts = [x for x in items if isinstance(x, dict)]
+                reached_watermark = False
+                if since is not None:
+                    # Pinned posts lead the first page whatever their age
+                    reached_watermark = any(
+                        _post_timestamp(x) <= since
+                        for x in posts
+                        if not x.get("isPinned")
+                    )
+                    posts = [x for x in posts if _post_timestamp(x) > since]
+                if posts:
+                    newest = newest.merge(
+                        Watermark(timestamp=max(map(_post_timestamp, posts)))
+                    )
+                items = posts
+                completed_pages += 1
+                items_so_far += len(items)
+                total_pages = max(total_pages, completed_pages)
+                await publish_custom_event(
+                    {
+                        "event": "scrape_progress",
+                        "job_id": effective_job_id,
+                        "username": self.username,
+                        "user_id": self.id,
+                        "content_type": "Posts",
+                        "status": "progress",
+                        "items_scraped": items_so_far,
+                        "items_saved": 0,
+                        "total_items": limit,  # Expected total items from API count
+                        "page": completed_pages,
+                        "total_pages": total_pages,
+                        "has_more": completed_pages < total_pages,
+                    }
+                )
+                # Also call external callback if provided
+                if on_progress:
+                    await on_progress(completed_pages, total_pages, items_so_far)
+                yield self.finalize_content_set(items)
+                if reached_watermark:
+                    break
+        if watermark_store and not report.failures:
+            await watermark_store.advance(authed.id, self.id, content_type, newest)
 
     async def get_post(
         self, identifier: int | str | None = None, limit: int = 10, offset: int = 0
@@ -615,6 +787,75 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
             pass
         return final_result
 
+    async def load_comments(
+        self,
+        posts: Iterable[PostModel],
+        window: int | None = None,
+        report: ScrapeReport | None = None,
+    ) -> list[PostModel]:
+        """
+        Fetches the comments of many posts at once.
+
+        Posts without comments are skipped. The comment pages of every post share
+        one bounded scrape window, and each comment author is resolved once. A
+        post with a failed comment page keeps its previous comments.
+
+        Args:
+            posts: Posts to load the comments of.
+            window: Maximum pages in flight (defaults to the session's max_threads).
+            report: Optional report filled with page counts and failed pages.
+
+        Returns:
+            list[PostModel]: Posts whose comments were loaded.
+        """
+        report = report if report is not None else ScrapeReport()
+        epl = endpoint_links()
+        post_links: dict[str, PostModel] = {}
+        loaded: dict[PostModel, list[dict[str, Any]]] = {}
+        for post in posts:
+            if not post.commentsCount or post in loaded:
+                continue
+            loaded[post] = []
+            link = epl.list_comments(post.responseType, post.id)
+            for page_link in epl.create_links(link, post.commentsCount):
+                post_links[page_link] = post
+        async with aclosing(
+            self.scrape_manager.iter_scrape(
+                list(post_links), window=window, report=report
+            )
+        ) as pages:
+            async for url, page_result in pages:
+                post = post_links[url]
+                if isinstance(page_result, list):
+                    if post in loaded:
+                        loaded[post].extend(page_result)
+                    continue
+                if page_result is not None:
+                    report.failures.append(
+                        ScrapeFailure(
+                            url=url,
+                            status=None,
+                            attempts=1,
+                            error="Comments page isn't a list",
+                        )
+                    )
+                loaded.pop(post, None)
+
+        authed = self.get_authed()
+        authors: dict[Any, UserModel] = {}
+        for post, comments in loaded.items():
+            final_comments: list[CommentModel] = []
+            for comment in comments:
+                author_id = comment["author"].get("id")
+                author = authors.get(author_id) if author_id else None
+                if author is None:
+                    author = authed.resolve_user(comment["author"])
+                    if author_id:
+                        authors[author_id] = author
+                final_comments.append(CommentModel(comment, author))
+            post.comments = final_comments
+        return list(loaded)
+
     @with_hooks
     async def get_messages(
         self,
@@ -623,6 +864,7 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
         cutoff_id: int | None = None,
         on_progress: ScrapeProgressCallback | None = None,
         job_id: str | None = None,
+        incremental: bool = False,
     ):
         """
         Retrieves messages for the user.
@@ -634,74 +876,129 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
             on_progress: Optional callback for progress updates (completed_pages, total_pages, items_so_far).
                          Note: total_pages is estimated and may increase as more pages are discovered.
             job_id: Optional job ID to use for progress events. If not provided, uses "api".
+            incremental: Only fetch messages newer than the previous incremental run.
 
         Returns:
             list[message_model.create_message]: A list of message objects.
         """
-        from ultima_scraper_api.managers.redis import publish_custom_event
-
-        # Use provided job_id or fall back to "api" for standalone usage
-        effective_job_id = job_id or "api"
-
         if not self.cache.messages.is_released() or self.is_deleted:
             return list(self.scrape_manager.scraped.Messages.values())
         final_results: list[message_model.MessageModel] = []
-        if self.is_authed_user() or self.is_deleted:
-            return final_results
+        async with aclosing(
+            self.iter_messages(
+                limit=limit,
+                offset_id=offset_id,
+                cutoff_id=cutoff_id,
+                on_progress=on_progress,
+                job_id=job_id,
+                incremental=incremental,
+            )
+        ) as pages:
+            async for messages in pages:
+                final_results.extend(messages)
+        if final_results:
+            self.cache.messages.activate()
+        return final_results
 
-        pages_completed = 0
-        total_items = 0
+    async def iter_messages(
+        self,
+        limit: int = 20,
+        offset_id: int | None = None,
+        cutoff_id: int | None = None,
+        on_progress: ScrapeProgressCallback | None = None,
+        job_id: str | None = None,
+        incremental: bool = False,
+    ) -> AsyncIterator[list[message_model.MessageModel]]:
+        """
+        Streams messages for the user, newest first, one page of models at a time.
 
-        async def recursive(
-            limit: int = limit, offset_id: int | str | None = offset_id
-        ):
-            nonlocal pages_completed, total_items
-            link = endpoint_links().list_messages(
-                self.id, global_limit=limit, global_offset=offset_id
-            )
-            results = await self.get_requester().json_request(link)
+        Takes the same arguments as get_messages. The page containing cutoff_id
+        is the last one yielded.
 
-            items: list[dict[str, Any]] = results.get("list", [])
-            pages_completed += 1
-            total_items += len(items)
+        With incremental, only messages newer than the previous incremental run
+        are yielded. The watermark only advances once every page has been
+        consumed without failures.
 
-            # Emit progress after each page via Redis
-            estimated_total = pages_completed + (1 if results.get("hasMore") else 0)
-            await publish_custom_event(
-                {
-                    "event": "scrape_progress",
-                    "job_id": effective_job_id,
-                    "username": self.username,
-                    "user_id": self.id,
-                    "content_type": "Messages",
-                    "status": "progress",
-                    "items_scraped": total_items,
-                    "items_saved": 0,
-                    "total_items": None,  # Messages count unknown with recursive pagination
-                    "page": pages_completed,
-                    "total_pages": estimated_total,
-                    "has_more": results.get("hasMore", False),
-                }
-            )
-            # Also call external callback if provided
-            if on_progress:
-                await on_progress(pages_completed, estimated_total, total_items)
+        Yields:
+            list[message_model.MessageModel]: Messages of the next page.
+        """
+        from ultima_scraper_api.managers.redis import publish_custom_event
 
-            if cutoff_id:
-                for item in items:
-                    if item["id"] == cutoff_id:
-                        return items
-            if results.get("hasMore"):
-                results2 = await recursive(limit=limit, offset_id=items[-1]["id"])
-                items.extend(results2)
-            return items
+        # Use provided job_id or fall back to "api" for standalone usage
+        effective_job_id = job_id or "api"
 
-        results = await recursive()
+        if self.is_authed_user() or self.is_deleted:
+            return
 
-        final_results = [message_model.MessageModel(x, self) for x in results]
-        if final_results:
-            self.cache.messages.activate()
-        return final_results
+        authed = self.get_authed()
+        watermark_store = self.get_api().get_watermark_store() if incremental else None
+        since_id = None
+        if watermark_store:
+            watermark = await watermark_store.get(authed.id, self.id, "Messages")
+            since_id = watermark.content_id if watermark else None
+        newest = Watermark()
+        report = ScrapeReport()
+
+        paginator = CursorPaginator(
+            self.get_requester().json_request,
+            lambda cursor: endpoint_links().list_messages(
+                self.id, global_limit=limit, global_offset=cursor
+            ),
+            lambda _response, items: items[-1]["id"],
+            cursor=offset_id,
+        )
+        items_so_far = 0
+        async with aclosing(paginator.pages()) as pages:
+            async for page in pages:
+                if page.error is not None:
+                    report.failures.append(
+                        ScrapeFailure(
+                            url=page.url or "",
+                            status=None,
+                            attempts=1,
+                            error=str(page.error),
+                        )
+                    )
+                items = page.items
+                reached_watermark = False
+                if since_id is not None:
+                    reached_watermark = any(x["id"] <= since_id for x in items)
+                    items = [x for x in items if x["id"] > since_id]
+                if items:
+                    newest = newest.merge(
+                        Watermark(content_id=max(x["id"] for x in items))
+                    )
+                items_so_far += len(items)
+
+                # Emit progress after each page via Redis
+                estimated_total = page.number + (1 if page.has_more else 0)
+                await publish_custom_event(
+                    {
+                        "event": "scrape_progress",
+                        "job_id": effective_job_id,
+                        "username": self.username,
+                        "user_id": self.id,
+                        "content_type": "Messages",
+                        "status": "progress",
+                        "items_scraped": items_so_far,
+                        "items_saved": 0,
+                        "total_items": None,  # Messages count unknown with cursor pagination
+                        "page": page.number,
+                        "total_pages": estimated_total,
+                        "has_more": page.has_more,
+                    }
+                )
+                # Also call external callback if provided
+                if on_progress:
+                    await on_progress(page.number, estimated_total, items_so_far)
+
+                yield [message_model.MessageModel(x, self) for x in items]
+                if reached_watermark:
+                    break
+                if cutoff_id and any(item["id"] == cutoff_id for item in page.items):
+                    break
+        if watermark_store and not report.failures:
+            await watermark_store.advance(authed.id, self.id, "Messages", newest)
 
     async def get_mass_messages(self, message_cutoff_id: int | None = None):
         messages = await self.get_messages(cutoff_id=message_cutoff_id)
@@ -745,19 +1042,15 @@ class UserModel(StreamlinedUser["OnlyFansAuthModel", "OnlyFansAPI"]):
         final_results: list[StoryModel] = []
         if self.is_authed_user() and self.is_performer():
 
-            async def recursive(limit: int = limit, offset: int = offset):
-                link = endpoint_links().list_archived_stories(
-                    limit=limit, marker_offset=offset
-                )
-                results = await self.get_requester().json_request(link)
-
-                items: list[dict[str, Any]] = results.get("list", [])
-                if results["hasMore"]:
-                    results2 = await recursive(limit=limit, offset=results["marker"])
-                    items.extend(results2)
-                return items
-
-            results = await recursive()
+            paginator = CursorPaginator(
+                self.get_requester().json_request,
+                lambda cursor: endpoint_links().list_archived_stories(
+                    limit=limit, marker_offset=cursor
+                ),
+                lambda response, _items: response.get("marker"),
+                cursor=offset,
+            )
+            results = await collect_items(paginator)
             final_results = [StoryModel(x, self) for x in results]
         return final_results
 
@@ -2,8 +2,6 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-import httpx
-
 from ultima_scraper_api.apis.api_streamliner import StreamlinedAPI
 from ultima_scraper_api.apis.onlyfans.classes.chat_model import ChatModel
 from ultima_scraper_api.apis.onlyfans.classes.extras import (
@@ -17,8 +15,14 @@ from ultima_scraper_api.apis.onlyfans.classes.message_model import MessageModel
 from ultima_scraper_api.apis.onlyfans.classes.post_model import PostModel
 from ultima_scraper_api.apis.onlyfans.classes.story_model import StoryModel
 from ultima_scraper_api.apis.onlyfans.classes.user_model import UserModel
-from ultima_scraper_api.config import UltimaScraperAPIConfig
+from ultima_scraper_api.config import Registry, UltimaScraperAPIConfig
 from ultima_scraper_api.helpers.main_helper import is_pascal_case
+from ultima_scraper_api.managers.dynamic_rules_manager import DynamicRulesCache
+from ultima_scraper_api.managers.registry_manager import (
+    BoundedRegistry,
+    create_registry,
+)
+from ultima_scraper_api.managers.user_index_manager import UserIndex
 from ultima_scraper_api.managers.websocket_manager import WebSocketManager
 
 if TYPE_CHECKING:
@@ -27,6 +31,8 @@ if TYPE_CHECKING:
 
 class DynamicRulesModel:
     def __init__(self, data: dict[str, Any]) -> None:
+        # Bumped whenever the rules change, so cached signers know to rebuild
+        self.version = 0
         self.static_param: str = data["static_param"]
         self.format: str = data["format"]
         self.checksum_indexes: list[int] = data["checksum_indexes"]
@@ -43,6 +49,7 @@ class DynamicRulesModel:
         self.checksum_constant = data["checksum_constant"]
         self.app_token = data["app_token"]
         self.remove_headers = data["remove_headers"]
+        self.version += 1
 
 
 class OnlyFansAPI(StreamlinedAPI):
@@ -53,16 +60,19 @@ class OnlyFansAPI(StreamlinedAPI):
     ) -> None:
         self.site_name: Literal["OnlyFans"] = "OnlyFans"
         site_settings = config.site_apis.get_settings(self.site_name)
-        dynamic_rules_url = getattr(site_settings, "dynamic_rules_url")
-        while True:
-            try:
-                dynamic_rules = httpx.get(dynamic_rules_url, timeout=300).json()
-                self.dynamic_rules = DynamicRulesModel(dynamic_rules)
-                break
-            except httpx.RequestError:
-                continue
+        self.dynamic_rules_cache = DynamicRulesCache(
+            site_settings.dynamic_rules_url,
+            site_settings.dynamic_rules_cache_path,
+            self._update_dynamic_rules,
+            max_age=site_settings.dynamic_rules_max_age,
+            validate=DynamicRulesModel,
+        )
+        self.dynamic_rules = DynamicRulesModel(self.dynamic_rules_cache.load())
         StreamlinedAPI.__init__(self, self, config)
         self.auths: dict[int, "OnlyFansAuthModel"] = {}
+        # Usernames/aliases of users known to any auth, and the auths that know them
+        self.user_index = UserIndex()
+        self.user_auths: dict[int, list["OnlyFansAuthModel"]] = {}
         self.endpoint_links = endpoint_links
 
         # Store WebSocket manager (passed from UltimaScraperAPI)
@@ -84,6 +94,11 @@ class OnlyFansAPI(StreamlinedAPI):
 
         self.authenticator = OnlyFansAuthenticator
 
+    def _update_dynamic_rules(self, data: dict[str, Any]) -> None:
+        # Not set yet while the rules are first loaded
+        if hasattr(self, "dynamic_rules"):
+            self.dynamic_rules.load_from_dict(data)
+
     def _setup_redis(self) -> None:
         """Initialize Redis manager if enabled in config."""
         try:
@@ -111,9 +126,19 @@ class OnlyFansAPI(StreamlinedAPI):
         return self.auths.get(identifier)
 
     def find_user(self, identifier: int | str):
+        user_id = (
+            identifier
+            if isinstance(identifier, int)
+            else self.user_index.get(identifier)
+        )
+        if user_id is None:
+            return []
         users: list[UserModel] = []
-        for auth in self.auths.values():
-            user = auth.find_user(identifier)
+        for auth in self.user_auths.get(user_id, ()):
+            # Only auths registered on this API, in case one was removed
+            if self.auths.get(auth.id) is not auth:
+                continue
+            user = auth.find_user(user_id)
             if user:
                 users.append(user)
         return users
@@ -129,6 +154,7 @@ class OnlyFansAPI(StreamlinedAPI):
             extract_auth_details_from_curl,
         )
 
+        self.dynamic_rules_cache.start()
         authed = None
         if auth_json:
             authed = self.find_auth(auth_json["id"])
@@ -165,6 +191,7 @@ class OnlyFansAPI(StreamlinedAPI):
             extract_auth_details_from_curl,
         )
 
+        self.dynamic_rules_cache.start()
         authed = None
         if auth_json:
             authed = self.find_auth(auth_json["id"])
@@ -185,14 +212,32 @@ class OnlyFansAPI(StreamlinedAPI):
         else:
             yield authed
 
+    async def close_pools(self):
+        await self.dynamic_rules_cache.stop()
+        await StreamlinedAPI.close_pools(self)
+
     async def remove_invalid_auths(self):
         for _, auth in self.auths.copy().items():
             if not auth.is_authed():
                 await self.remove_auth(auth)
 
     async def remove_auth(self, auth: "OnlyFansAuthModel"):
-        await auth.get_requester().active_session.close()
+        await auth.get_requester().close()
         del self.auths[auth.id]
+        for user_id, auths in list(self.user_auths.items()):
+            if auth in auths:
+                self.forget_user(user_id, auth)
+
+    def forget_user(self, user_id: int, auth: "OnlyFansAuthModel"):
+        """Stop routing lookups of a user to an auth, and drop users no auth holds."""
+        auths = self.user_auths.get(user_id)
+        if auths is None:
+            return
+        if auth in auths:
+            auths.remove(auth)
+        if not auths:
+            del self.user_auths[user_id]
+            self.user_index.remove(user_id)
 
     def create_auth_details(self, auth_json: dict[str, Any] = {}):
         """If you've got a auth.json file, you can load it into python and pass it through here.
@@ -227,13 +272,25 @@ class OnlyFansAPI(StreamlinedAPI):
         return final_value
 
     class CategorizedContent:
-        def __init__(self) -> None:
-            self.MassMessages: dict[int, MassMessageModel] = {}
-            self.Stories: dict[int, StoryModel] = {}
-            self.Chats: dict[int, ChatModel] = {}
-            self.Messages: dict[int, MessageModel] = {}
-            self.Highlights: dict[int, HighlightModel] = {}
-            self.Posts: dict[int, PostModel] = {}
+        def __init__(self, settings: Registry = Registry()) -> None:
+            self.MassMessages: BoundedRegistry[int, MassMessageModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Stories: BoundedRegistry[int, StoryModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Chats: BoundedRegistry[int, ChatModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Messages: BoundedRegistry[int, MessageModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Highlights: BoundedRegistry[int, HighlightModel] = create_registry(
+                settings, settings.max_content
+            )
+            self.Posts: BoundedRegistry[int, PostModel] = create_registry(
+                settings, settings.max_content
+            )
 
         def __iter__(self):
             for attr, value in self.__dict__.items():
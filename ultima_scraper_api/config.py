@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel
 
@@ -35,11 +36,74 @@ class Proxy(BaseModel):
     downloads: DownloadSettings = DownloadSettings()
 
 
+class Concurrency(BaseModel):
+    # -1 starts every host at the session manager's max_threads
+    initial_limit: int = -1
+    min_limit: int = 1
+    max_limit: int = 64
+    increase_step: float = 1.0
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    decrease_cooldown: float = 1.0
+
+
+class RateLimit(BaseModel):
+    # Tokens per second for each (site, auth, endpoint class), 0 = only honor 429s
+    requests_per_second: float = 20.0
+    burst: int = 40
+    # Per endpoint class rates, e.g. {"users/posts": 5.0}
+    endpoint_overrides: dict[str, float] = {}
+    default_retry_after: float = 5.0
+    max_retry_after: float = 300.0
+
+
+class ResponseCache(BaseModel):
+    enabled: bool = False
+    path: Path = Path.home() / ".ultima_scraper_api" / "response_cache.sqlite3"
+    # Seconds a response is served without revalidation, per endpoint class
+    ttls: dict[str, float] = {
+        "users": 3600,
+        "users/stories": 600,
+        "stories/highlights": 3600,
+    }
+    # Other endpoints are only stored when the site sends ETag/Last-Modified
+    default_ttl: float = 0
+    max_entries: int = 100_000
+
+
+class Metrics(BaseModel):
+    # Per phase timings (DNS, connect, TTFB) and byte counts from aiohttp tracing
+    trace: bool = True
+    # Serve Prometheus metrics on http://server_host:server_port/metrics
+    server_host: str = "127.0.0.1"
+    server_port: int | None = None
+    # Publish a snapshot to this Redis channel every publish_interval seconds
+    redis_channel: str | None = None
+    publish_interval: float = 60
+
+
+class ProxyPool(BaseModel):
+    # Keep each auth on the same proxy while it's healthy (IP-locked CDN links)
+    sticky: bool = True
+    # Requested through every proxy by ProxyManager.test_proxies
+    check_url: str = "https://checkip.amazonaws.com"
+    check_timeout: float = 10
+    # Consecutive failures (errors or 429s) before a proxy is benched
+    max_failures: int = 3
+    # Seconds a benched proxy is skipped
+    cooldown: float = 60
+
+
 class Network(BaseModel):
     max_connections: int = -1
     proxies: list[Proxy] = []
     proxy_fallback: bool = False
+    proxy_pool: ProxyPool = ProxyPool()
     downloads: DownloadSettings = DownloadSettings()
+    concurrency: Concurrency = Concurrency()
+    rate_limit: RateLimit = RateLimit()
+    response_cache: ResponseCache = ResponseCache()
+    metrics: Metrics = Metrics()
 
 
 class Server(BaseModel):
@@ -60,6 +124,38 @@ class GlobalCache(BaseModel):
     pass
 
 
+class Watermarks(BaseModel):
+    # Where incremental scrapes remember the newest item seen
+    backend: Literal["sqlite", "redis"] = "sqlite"
+    path: Path = Path.home() / ".ultima_scraper_api" / "watermarks.sqlite3"
+
+
+class Registry(BaseModel):
+    # Bounds for objects kept in memory by long-running workers, None means
+    # unbounded. max_users applies per auth, max_content per content type per
+    # user, max_bytes per registry.
+    max_users: int | None = None
+    max_content: int | None = None
+    max_bytes: int | None = None
+    # Drop entries unused for this many seconds
+    ttl: float | None = None
+    # Keep evicted objects reachable while something else still holds them
+    weak_references: bool = True
+    # Messages and events kept per websocket connection
+    websocket_history: int | None = 10_000
+
+
+class WebSocketBuffer(BaseModel):
+    # Messages received but not yet dispatched, per websocket connection
+    capacity: int = 10_000
+    # When full: drop the oldest message, make the reader wait, or spill the
+    # overflow to spill_dir and replay it once the consumers catch up
+    overflow: Literal["drop_oldest", "block", "spill"] = "drop_oldest"
+    spill_dir: Path = Path.home() / ".ultima_scraper_api" / "websocket_spill"
+    # Messages stored in Redis and passed to callbacks per batch
+    batch_size: int = 100
+
+
 class DRM(BaseModel):
     device_client_blob_filepath: Path | None = None
     device_private_key_filepath: Path | None = None
@@ -72,6 +168,9 @@ class Settings(BaseModel):
     drm: DRM = DRM()
     server: Server = Server()
     redis: Redis = Redis()
+    watermarks: Watermarks = Watermarks()
+    registry: Registry = Registry()
+    websocket_buffer: WebSocketBuffer = WebSocketBuffer()
 
 
 class GlobalAPI(BaseModel):
@@ -86,6 +185,12 @@ class OnlyFansAPIConfig(GlobalAPI):
     dynamic_rules_url: str = (
         "https://raw.githubusercontent.com/DATAHOARDERS/dynamic-rules/main/onlyfans.json"
     )
+    # Shared by every process on the host, so startup doesn't need the URL
+    dynamic_rules_cache_path: Path = (
+        Path.home() / ".ultima_scraper_api" / "onlyfans_dynamic_rules.json"
+    )
+    # Seconds before the cached rules are refreshed in the background
+    dynamic_rules_max_age: float = 3600
     cache: OnlyFansCache = OnlyFansCache()
 
 
@@ -0,0 +1,49 @@
+"""Single-decode JSON reading for aiohttp responses.
+
+``ClientResponse.json()`` decodes the body with the stdlib ``json`` module on
+every call, and a response is usually decoded twice: once when
+``AuthedSession.request`` validates it and again when the caller reads it.
+``read_json`` decodes the body once with orjson and hands every later caller
+the same value.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+import orjson
+from aiohttp import ClientResponse
+
+_decoded: weakref.WeakKeyDictionary[ClientResponse, Any] = weakref.WeakKeyDictionary()
+
+
+def is_json_content_type(content_type: str) -> bool:
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
+def loads(body: bytes | str) -> Any:
+    """Decode a JSON body, an empty body decodes to None like aiohttp does."""
+    if not body.strip():
+        return None
+    return orjson.loads(body)
+
+
+async def read_json(response: ClientResponse) -> Any:
+    """Drop-in replacement for ``await response.json()``.
+
+    Raises:
+        ContentTypeError: The response isn't JSON
+        orjson.JSONDecodeError: The body is invalid JSON, a subclass of
+            ``json.JSONDecodeError``
+    """
+    try:
+        return _decoded[response]
+    except KeyError:
+        pass
+    if not is_json_content_type(response.content_type):
+        # Let aiohttp raise its usual ContentTypeError
+        return await response.json()
+    value = loads(await response.read())
+    _decoded[response] = value
+    return value
@@ -0,0 +1,117 @@
+"""Descriptors for lazy content models.
+
+Content models keep the raw API dict in ``__raw__`` and declare their fields
+as descriptors, so building a model doesn't copy every field or construct
+nested models up front. A field is read (and converted) the first time it's
+accessed and cached in the instance's ``__values__`` dict, assignments go to
+the same dict.
+
+Classes using these descriptors define ``__raw__`` and ``__values__`` (usually
+as ``__slots__``) and call ``init_lazy`` from ``__init__``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Generic, Self, TypeVar, overload
+
+T = TypeVar("T")
+_MISSING: Any = object()
+
+
+def init_lazy(instance: Any, option: dict[str, Any]) -> None:
+    instance.__raw__ = option
+    instance.__values__ = {}
+
+
+class RawField(Generic[T]):
+    """Field read from the raw dict on first access."""
+
+    __slots__ = ("key", "default", "factory", "convert", "name")
+
+    def __init__(
+        self,
+        key: str | None = None,
+        default: T = _MISSING,
+        factory: Callable[[], T] | None = None,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """
+        Args:
+            key: Key in the raw dict, defaults to the attribute name
+            default: Value when the key is missing, a missing key raises
+                KeyError when neither default nor factory is given
+            factory: Creates the value when the key is missing, for mutable
+                defaults
+            convert: Applied to the raw value
+        """
+        self.key = key
+        self.default = default
+        self.factory = factory
+        self.convert = convert
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        if self.key is None:
+            self.key = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Self: ...
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        values: dict[str, Any] = instance.__values__
+        value = values.get(self.name, _MISSING)
+        if value is not _MISSING:
+            return value
+        raw: dict[str, Any] = instance.__raw__
+        if self.key in raw:
+            value = raw[self.key]
+        elif self.factory is not None:
+            value = self.factory()
+        elif self.default is not _MISSING:
+            value = self.default
+        else:
+            raise KeyError(self.key)
+        if self.convert is not None:
+            value = self.convert(value)
+        values[self.name] = value
+        return value
+
+    def __set__(self, instance: Any, value: T) -> None:
+        instance.__values__[self.name] = value
+
+
+class lazy_attribute(Generic[T]):
+    """Like ``functools.cached_property``, but cached in ``__values__``.
+
+    Used for attributes built from the raw dict, e.g. nested models.
+    """
+
+    __slots__ = ("func", "name")
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Self: ...
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        values: dict[str, Any] = instance.__values__
+        value = values.get(self.name, _MISSING)
+        if value is _MISSING:
+            value = values[self.name] = self.func(instance)
+        return value
+
+    def __set__(self, instance: Any, value: T) -> None:
+        instance.__values__[self.name] = value
@@ -0,0 +1,70 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same idempotent request while it is already
+in flight, only the first one (the leader) hits the network. The others await
+the leader's result and receive their own copy of it, so callers that mutate
+the decoded JSON can't affect each other.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import orjson
+
+
+def _copy_json(value: Any) -> Any:
+    try:
+        return orjson.loads(orjson.dumps(value))
+    except TypeError:
+        # Not plain JSON, share it as is
+        return value
+
+
+class CoalescingManager:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self.in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory`` unless a call with the same key is already in flight.
+
+        The call runs in its own task, so a cancelled caller doesn't cancel the
+        request for everyone else waiting on it.
+
+        Args:
+            key: Identity of the request, e.g. (method, normalized URL)
+            factory: Creates the awaitable performing the request
+
+        Returns:
+            The leader's result, copied for every caller but the leader
+        """
+        self.requests += 1
+        task = self.in_flight.get(key)
+        if task:
+            self.coalesced += 1
+            return _copy_json(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(factory())
+        self.in_flight[key] = task
+        task.add_done_callback(lambda task: self._forget(key, task))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, waiters may all have been cancelled
+            task.exception()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": len(self.in_flight),
+        }
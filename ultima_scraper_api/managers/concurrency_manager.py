@@ -0,0 +1,231 @@
+"""Adaptive per-host concurrency control for UltimaScraperAPI.
+
+Every request sent through ``AuthedSession.request`` holds a slot from the
+limiter of the host it targets. Limits follow an AIMD policy (additive
+increase, multiplicative decrease): a host's limit grows while responses
+come back successfully without latency degrading, and is cut whenever the
+host answers with 429/5xx or times out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from ultima_scraper_api.config import Concurrency
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestOutcome(str, Enum):
+    SUCCESS = "success"
+    # 429, 5xx and timeouts, the upstream is telling us to back off
+    OVERLOAD = "overload"
+    # Anything else (4xx, connection resets, ...), says nothing about capacity
+    NEUTRAL = "neutral"
+
+
+class HostLimiter:
+    """AIMD concurrency limiter for a single host."""
+
+    # Weight given to a new sample when the latency baseline drifts upwards
+    BASELINE_DRIFT = 0.05
+
+    def __init__(
+        self,
+        host: str,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        decrease_cooldown: float = 1.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            host: Host (netloc) this limiter guards
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            increase_step: Slots added per fully used window of successes
+            decrease_factor: Multiplier applied to the limit on overload
+            latency_tolerance: Growth stops once latency exceeds baseline * tolerance
+            decrease_cooldown: Seconds between two decreases, so a single burst of
+                429s only shrinks the limit once
+        """
+        self.host = host
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown = decrease_cooldown
+        self.in_flight = 0
+        self.baseline_latency: float | None = None
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.successes = 0
+        self.overloads = 0
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        if not self._waiters and self.in_flight < self.current_limit:
+            self.in_flight += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed to us right before we got cancelled
+                self.in_flight -= 1
+                self._wake_waiters()
+            raise
+
+    def release(self, outcome: RequestOutcome, latency: float) -> None:
+        """Give a slot back and feed its outcome into the AIMD controller.
+
+        Args:
+            outcome: How the request went
+            latency: Seconds the slot was held
+        """
+        self.in_flight -= 1
+        self._adjust(outcome, latency)
+        self._wake_waiters()
+
+    def _adjust(self, outcome: RequestOutcome, latency: float) -> None:
+        match outcome:
+            case RequestOutcome.SUCCESS:
+                self.successes += 1
+                baseline = self.baseline_latency
+                if baseline is None or latency < baseline:
+                    self.baseline_latency = latency
+                else:
+                    self.baseline_latency = baseline + (
+                        (latency - baseline) * self.BASELINE_DRIFT
+                    )
+                    if latency > baseline * self.latency_tolerance:
+                        return
+                # Only grow while the current limit is actually being used
+                if self.in_flight + 1 >= self.current_limit:
+                    self.limit = min(
+                        self.max_limit, self.limit + self.increase_step / self.limit
+                    )
+            case RequestOutcome.OVERLOAD:
+                self.overloads += 1
+                now = time.monotonic()
+                if now - self._last_decrease < self.decrease_cooldown:
+                    return
+                self._last_decrease = now
+                previous_limit = self.current_limit
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                logger.debug(
+                    "Concurrency limit for %s reduced %d -> %d",
+                    self.host,
+                    previous_limit,
+                    self.current_limit,
+                )
+            case RequestOutcome.NEUTRAL:
+                pass
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.current_limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "waiting": sum(1 for x in self._waiters if not x.done()),
+            "baseline_latency": self.baseline_latency,
+            "successes": self.successes,
+            "overloads": self.overloads,
+        }
+
+
+class ConcurrencySlot:
+    """A slot held for the duration of one request attempt."""
+
+    def __init__(self, limiter: HostLimiter) -> None:
+        self.limiter = limiter
+        self.started_at = time.monotonic()
+        self.released = False
+
+    def release(self, outcome: RequestOutcome = RequestOutcome.NEUTRAL) -> None:
+        # Safe to call more than once, only the first call counts
+        if self.released:
+            return
+        self.released = True
+        self.limiter.release(outcome, time.monotonic() - self.started_at)
+
+
+class ConcurrencyManager:
+    """Keeps one ``HostLimiter`` per host."""
+
+    def __init__(self, settings: Concurrency, default_limit: int) -> None:
+        """Initialize the manager.
+
+        Args:
+            settings: Concurrency configuration
+            default_limit: Initial limit used when ``settings.initial_limit`` < 1
+        """
+        self.settings = settings
+        self.default_limit = default_limit
+        self.limiters: dict[str, HostLimiter] = {}
+
+    def get_limiter(self, url: str) -> HostLimiter:
+        host = urlparse(url).netloc.lower()
+        limiter = self.limiters.get(host)
+        if not limiter:
+            settings = self.settings
+            initial_limit = (
+                settings.initial_limit
+                if settings.initial_limit > 0
+                else self.default_limit
+            )
+            limiter = HostLimiter(
+                host,
+                initial_limit,
+                min_limit=settings.min_limit,
+                max_limit=settings.max_limit,
+                increase_step=settings.increase_step,
+                decrease_factor=settings.decrease_factor,
+                latency_tolerance=settings.latency_tolerance,
+                decrease_cooldown=settings.decrease_cooldown,
+            )
+            self.limiters[host] = limiter
+        return limiter
+
+    async def acquire(self, url: str) -> ConcurrencySlot:
+        """Wait for a free slot on the host of ``url``.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            ConcurrencySlot that must be released once the attempt is over
+        """
+        limiter = self.get_limiter(url)
+        await limiter.acquire()
+        return ConcurrencySlot(limiter)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {host: limiter.snapshot() for host, limiter in self.limiters.items()}
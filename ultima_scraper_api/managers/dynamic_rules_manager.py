@@ -0,0 +1,253 @@
+"""Dynamic rules cached on disk and refreshed in the background.
+
+Signing OnlyFans requests needs the site's dynamic rules, which used to be
+downloaded synchronously (retrying forever) every time an API was built.
+``DynamicRulesCache`` keeps the last rules in a JSON file stamped with the URL
+and the time they were fetched:
+
+- Startup uses the cached rules, whatever their age, and only downloads them
+  (with a bounded number of attempts) when there's no cache yet
+- Once started, a background task re-downloads them when they're older than
+  ``max_age``, backing off on failures, and hot-swaps them in
+- The file is shared by every process on the host: writes are atomic, a lock
+  file makes sure only one process downloads at a time and the others pick up
+  what it wrote
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import random
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows, every process refreshes on its own
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicRulesCache:
+    def __init__(
+        self,
+        url: str,
+        path: Path,
+        on_update: Callable[[dict[str, Any]], None],
+        max_age: float = 3600,
+        validate: Callable[[dict[str, Any]], Any] | None = None,
+        timeout: float = 30,
+        min_backoff: float = 5,
+        max_backoff: float = 600,
+    ) -> None:
+        """
+        Args:
+            url: Where the rules are downloaded from
+            path: Cache file, shared by every process using the same path
+            on_update: Called with the rules whenever they change
+            max_age: Seconds before cached rules are refreshed
+            validate: Raises if downloaded rules are unusable, they're then
+                neither cached nor applied
+            timeout: Download timeout in seconds
+            min_backoff: First retry delay after a failed refresh
+            max_backoff: Longest retry delay
+        """
+        self.url = url
+        self.path = path
+        self.on_update = on_update
+        self.max_age = max_age
+        self.validate = validate
+        self.timeout = timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.rules: dict[str, Any] | None = None
+        self.fetched_at: float | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def read(self) -> dict[str, Any] | None:
+        """Return the cache entry (url, fetched_at, rules), None if unusable."""
+        try:
+            entry = orjson.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("rules"), dict):
+            return None
+        return entry  # type: ignore[no-any-return]
+
+    def write(self, rules: dict[str, Any]) -> dict[str, Any]:
+        entry = {"url": self.url, "fetched_at": time.time(), "rules": rules}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so other processes never read a partial file
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(orjson.dumps(entry))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+        return entry
+
+    def is_current(self, entry: dict[str, Any]) -> bool:
+        """Whether the entry holds the rules of our URL, not of a previous one."""
+        return entry.get("url") == self.url
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        return self.is_current(entry) and self.age(entry) < self.max_age
+
+    @staticmethod
+    def age(entry: dict[str, Any]) -> float:
+        return time.time() - float(entry.get("fetched_at") or 0)
+
+    def _apply(self, entry: dict[str, Any]) -> None:
+        self.fetched_at = entry.get("fetched_at")
+        rules: dict[str, Any] = entry["rules"]
+        if rules == self.rules:
+            return
+        self.rules = rules
+        self.on_update(rules)
+
+    def _check(self, rules: Any) -> dict[str, Any]:
+        if not isinstance(rules, dict):
+            raise ValueError(f"Dynamic rules from {self.url} aren't an object")
+        if self.validate:
+            self.validate(rules)
+        return rules  # type: ignore[return-value]
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[bool]:
+        """Hold the host-wide refresh lock, yields False if another process has it."""
+        if fcntl is None:
+            yield True
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(f"{self.path.name}.lock"), "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self, attempts: int = 5) -> dict[str, Any]:
+        """Load the rules at startup without waiting on the network if possible.
+
+        Cached rules are used even when stale, the background refresh replaces
+        them. Without a cache, or with one holding the rules of another URL, the
+        rules are downloaded synchronously.
+
+        Raises:
+            RuntimeError: There's no cache and every download attempt failed
+        """
+        entry = self.read()
+        if entry is not None and not self.is_current(entry):
+            entry = None
+        if entry is None:
+            last_error: Exception | None = None
+            for attempt in range(attempts):
+                if attempt:
+                    time.sleep(self._backoff(attempt))
+                try:
+                    response = httpx.get(self.url, timeout=self.timeout)
+                    response.raise_for_status()
+                    rules = self._check(response.json())
+                except (httpx.HTTPError, ValueError, KeyError) as e:
+                    last_error = e
+                    logger.warning("Failed to download dynamic rules: %r", e)
+                    continue
+                try:
+                    entry = self.write(rules)
+                except OSError as e:
+                    logger.warning("Failed to cache dynamic rules: %r", e)
+                    entry = {"url": self.url, "fetched_at": time.time(), "rules": rules}
+                break
+            else:
+                raise RuntimeError(
+                    f"Couldn't download dynamic rules from {self.url} and there's "
+                    f"no cached copy at {self.path}"
+                ) from last_error
+        self._apply(entry)
+        assert self.rules is not None
+        return self.rules
+
+    async def refresh(self) -> bool:
+        """Refresh the rules if the cache is stale, returns True if downloaded."""
+        entry = self.read()
+        if entry is not None and self.is_fresh(entry):
+            # Possibly written by another process
+            self._apply(entry)
+            return False
+        with self._lock() as acquired:
+            if not acquired:
+                # Another process is downloading, use what we have for now
+                if entry is not None and self.is_current(entry):
+                    self._apply(entry)
+                return False
+            entry = self.read()
+            if entry is not None and self.is_fresh(entry):
+                self._apply(entry)
+                return False
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.url)
+                response.raise_for_status()
+            rules = self._check(response.json())
+            self._apply(self.write(rules))
+        return True
+
+    def _backoff(self, failures: int) -> float:
+        delay = min(self.max_backoff, self.min_backoff * 2 ** (failures - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _next_refresh(self) -> float:
+        entry = self.read()
+        if entry is None or not self.is_current(entry):
+            return self.min_backoff
+        remaining = self.max_age - self.age(entry)
+        # Stale means another process is refreshing it, check back soon
+        return max(self.min_backoff, remaining)
+
+    async def _run(self) -> None:
+        failures = 0
+        while True:
+            try:
+                await self.refresh()
+                failures = 0
+                delay = self._next_refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                delay = self._backoff(failures)
+                logger.warning(
+                    "Failed to refresh dynamic rules, retrying in %.0fs: %r", delay, e
+                )
+            await asyncio.sleep(delay)
+
+    def start(self) -> None:
+        """Start the background refresh, needs a running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
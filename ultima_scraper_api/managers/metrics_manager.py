@@ -0,0 +1,439 @@
+"""HTTP client metrics for ``AuthedSession``.
+
+Every session manager owns a ``RequestMetrics`` that records, per endpoint
+family (see ``endpoint_class``):
+
+- latency histograms for each phase of a request: ``queued`` (waiting for a
+  concurrency slot), ``dns``, ``connect``, ``ttfb`` (until the response
+  headers) and ``total`` (the whole ``AuthedSession.request`` call, retries and
+  rate-limit waits included)
+- response statuses, transport errors, retries and the time spent backing off
+- bytes sent and received, and whether connections were created or reused
+
+429s and the time spent waiting on the rate limiter are recorded per auth.
+
+The phase timings and byte counts come from an aiohttp ``TraceConfig`` attached
+to every client session, the rest is reported by ``AuthedSession.request``.
+Metrics can be read as a dict (``snapshot``), rendered in the Prometheus text
+format (``render_prometheus``, optionally served over HTTP) or published
+periodically through ``RedisManager``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+import weakref
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from aiohttp import web
+
+from ultima_scraper_api.managers.rate_limit_manager import endpoint_class
+
+if TYPE_CHECKING:
+    from ultima_scraper_api.config import Metrics
+
+logger = logging.getLogger(__name__)
+
+# Seconds, the Prometheus client defaults plus longer tails for slow pages
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_instances: weakref.WeakSet[RequestMetrics] = weakref.WeakSet()
+_server: web.AppRunner | None = None
+_server_lock: asyncio.Lock | None = None
+# Metrics serving /metrics, the server is stopped with the last of them
+_server_owners: weakref.WeakSet[RequestMetrics] = weakref.WeakSet()
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        # One count per bucket plus +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return (upper bound, count) pairs like Prometheus ``le`` buckets."""
+        total = 0
+        pairs: list[tuple[str, int]] = []
+        for bound, count in zip((*map(str, self.buckets), "+Inf"), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class RequestMetrics:
+    """Request metrics of one session manager."""
+
+    def __init__(self, site_name: str, settings: Metrics) -> None:
+        self.site_name = site_name
+        self.settings = settings
+        self.latency: defaultdict[tuple[str, str], Histogram] = defaultdict(Histogram)
+        self.statuses: Counter[tuple[str, int]] = Counter()
+        self.errors: Counter[tuple[str, str]] = Counter()
+        self.retries: Counter[str] = Counter()
+        self.backoff_seconds: defaultdict[str, float] = defaultdict(float)
+        self.throttled: Counter[str] = Counter()
+        self.rate_limit_wait_seconds: defaultdict[str, float] = defaultdict(float)
+        self.bytes_sent: Counter[str] = Counter()
+        self.bytes_received: Counter[str] = Counter()
+        self.connections_created = 0
+        self.connections_reused = 0
+        self._trace_config: aiohttp.TraceConfig | None = None
+        self._started = False
+        self._publisher: asyncio.Task[None] | None = None
+        self._server_task: asyncio.Task[None] | None = None
+        _instances.add(self)
+
+    # Recorded by AuthedSession.request
+
+    def observe(self, url: str, phase: str, seconds: float) -> None:
+        self.latency[endpoint_class(url), phase].observe(seconds)
+
+    def record_retry(self, url: str, backoff_seconds: float) -> None:
+        family = endpoint_class(url)
+        self.retries[family] += 1
+        self.backoff_seconds[family] += backoff_seconds
+
+    def record_throttle(self, auth_id: str) -> None:
+        self.throttled[auth_id] += 1
+
+    def record_rate_limit_wait(self, auth_id: str, seconds: float) -> None:
+        self.rate_limit_wait_seconds[auth_id] += seconds
+
+    # aiohttp tracing
+
+    def trace_config(self) -> aiohttp.TraceConfig | None:
+        """TraceConfig for client sessions, None when tracing is disabled."""
+        if not self.settings.trace:
+            return None
+        if self._trace_config is None:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_request_end.append(self._on_request_end)
+            trace_config.on_request_exception.append(self._on_request_exception)
+            trace_config.on_dns_resolvehost_start.append(self._on_dns_start)
+            trace_config.on_dns_resolvehost_end.append(self._on_dns_end)
+            trace_config.on_connection_create_start.append(self._on_connect_start)
+            trace_config.on_connection_create_end.append(self._on_connect_end)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+            trace_config.on_request_chunk_sent.append(self._on_chunk_sent)
+            trace_config.on_response_chunk_received.append(self._on_chunk_received)
+            self._trace_config = trace_config
+        return self._trace_config
+
+    async def _on_request_start(
+        self, _session: Any, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        ctx.family = endpoint_class(str(params.url))
+        ctx.started_at = time.monotonic()
+
+    async def _on_request_end(
+        self, _session: Any, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.latency[ctx.family, "ttfb"].observe(time.monotonic() - ctx.started_at)
+        self.statuses[ctx.family, params.response.status] += 1
+
+    async def _on_request_exception(
+        self, _session: Any, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        family = getattr(ctx, "family", None) or endpoint_class(str(params.url))
+        self.errors[family, type(params.exception).__name__] += 1
+
+    async def _on_dns_start(
+        self, _session: Any, ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        ctx.dns_started_at = time.monotonic()
+
+    async def _on_dns_end(
+        self, _session: Any, ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        if hasattr(ctx, "family"):
+            elapsed = time.monotonic() - ctx.dns_started_at
+            self.latency[ctx.family, "dns"].observe(elapsed)
+
+    async def _on_connect_start(
+        self, _session: Any, ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        ctx.connect_started_at = time.monotonic()
+
+    async def _on_connect_end(
+        self, _session: Any, ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_created += 1
+        if hasattr(ctx, "family"):
+            elapsed = time.monotonic() - ctx.connect_started_at
+            self.latency[ctx.family, "connect"].observe(elapsed)
+
+    async def _on_connection_reuse(
+        self, _session: Any, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _on_chunk_sent(
+        self, _session: Any, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        family = getattr(ctx, "family", None) or endpoint_class(str(params.url))
+        self.bytes_sent[family] += len(params.chunk)
+
+    async def _on_chunk_received(
+        self, _session: Any, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        family = getattr(ctx, "family", None) or endpoint_class(str(params.url))
+        self.bytes_received[family] += len(params.chunk)
+
+    # Export
+
+    def snapshot(self) -> dict[str, Any]:
+        latency: dict[str, dict[str, Any]] = defaultdict(dict)
+        for (family, phase), histogram in self.latency.items():
+            latency[family][phase] = histogram.snapshot()
+        statuses: dict[str, dict[str, int]] = defaultdict(dict)
+        for (family, status), count in self.statuses.items():
+            statuses[family][str(status)] = count
+        errors: dict[str, dict[str, int]] = defaultdict(dict)
+        for (family, error), count in self.errors.items():
+            errors[family][error] = count
+        return {
+            "site": self.site_name,
+            "latency": dict(latency),
+            "statuses": dict(statuses),
+            "errors": dict(errors),
+            "retries": dict(self.retries),
+            "backoff_seconds": dict(self.backoff_seconds),
+            "throttled": dict(self.throttled),
+            "rate_limit_wait_seconds": dict(self.rate_limit_wait_seconds),
+            "bytes_sent": dict(self.bytes_sent),
+            "bytes_received": dict(self.bytes_received),
+            "connections": {
+                "created": self.connections_created,
+                "reused": self.connections_reused,
+            },
+        }
+
+    def _samples(self) -> list[tuple[str, str, str, dict[str, Any], float]]:
+        """(metric, type, help, labels, value) for every sample."""
+        site = self.site_name
+        samples: list[tuple[str, str, str, dict[str, Any], float]] = []
+
+        def add(
+            metric: str, kind: str, help_: str, labels: dict[str, Any], value: float
+        ) -> None:
+            samples.append((metric, kind, help_, {"site": site, **labels}, value))
+
+        duration = "ultima_http_request_duration_seconds"
+        duration_help = "HTTP request latency by phase"
+        for (family, phase), histogram in self.latency.items():
+            labels = {"family": family, "phase": phase}
+            for bound, count in histogram.cumulative():
+                add(
+                    f"{duration}_bucket",
+                    "histogram",
+                    duration_help,
+                    {**labels, "le": bound},
+                    count,
+                )
+            add(f"{duration}_sum", "histogram", duration_help, labels, histogram.sum)
+            add(
+                f"{duration}_count", "histogram", duration_help, labels, histogram.count
+            )
+        for (family, status), count in self.statuses.items():
+            labels = {"family": family, "status": status}
+            add("ultima_http_responses_total", "counter", "Responses", labels, count)
+        for (family, error), count in self.errors.items():
+            labels = {"family": family, "error": error}
+            add(
+                "ultima_http_errors_total", "counter", "Transport errors", labels, count
+            )
+        for family, count in self.retries.items():
+            add(
+                "ultima_http_retries_total",
+                "counter",
+                "Retried attempts",
+                {"family": family},
+                count,
+            )
+        for family, seconds in self.backoff_seconds.items():
+            add(
+                "ultima_http_backoff_seconds_total",
+                "counter",
+                "Time spent backing off before retries",
+                {"family": family},
+                seconds,
+            )
+        for auth_id, count in self.throttled.items():
+            add(
+                "ultima_http_throttled_total",
+                "counter",
+                "HTTP 429 responses",
+                {"auth": auth_id},
+                count,
+            )
+        for auth_id, seconds in self.rate_limit_wait_seconds.items():
+            add(
+                "ultima_http_rate_limit_wait_seconds_total",
+                "counter",
+                "Time spent waiting on the rate limiter",
+                {"auth": auth_id},
+                seconds,
+            )
+        for family, count in self.bytes_sent.items():
+            add(
+                "ultima_http_sent_bytes_total",
+                "counter",
+                "Request bytes sent",
+                {"family": family},
+                count,
+            )
+        for family, count in self.bytes_received.items():
+            add(
+                "ultima_http_received_bytes_total",
+                "counter",
+                "Response bytes received",
+                {"family": family},
+                count,
+            )
+        for state, count in (
+            ("created", self.connections_created),
+            ("reused", self.connections_reused),
+        ):
+            add(
+                "ultima_http_connections_total",
+                "counter",
+                "Connections used by requests",
+                {"state": state},
+                count,
+            )
+        return samples
+
+    # Background export
+
+    def start(self) -> None:
+        """Start the configured exporters, called from a running event loop."""
+        if self._started:
+            return
+        self._started = True
+        _instances.add(self)
+        if self.settings.server_port is not None:
+            self._server_task = asyncio.get_running_loop().create_task(self._serve())
+        if self.settings.redis_channel:
+            self._publisher = asyncio.get_running_loop().create_task(
+                self._publish_loop(self.settings.redis_channel)
+            )
+
+    async def _serve(self) -> None:
+        assert self.settings.server_port is not None
+        try:
+            await start_metrics_server(
+                self.settings.server_host, self.settings.server_port
+            )
+        except OSError:
+            # Already logged, requests carry on without the endpoint
+            return
+        _server_owners.add(self)
+
+    async def _publish_loop(self, channel: str) -> None:
+        from ultima_scraper_api.managers.redis import get_redis
+
+        while True:
+            await asyncio.sleep(self.settings.publish_interval)
+            redis = get_redis()
+            if redis:
+                await redis.publish_json(channel, self.snapshot())
+
+    async def stop(self) -> None:
+        """Stop exporting and leave ``render_prometheus``.
+
+        The ``/metrics`` server is stopped once no other metrics use it.
+        """
+        for task in (self._publisher, self._server_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._publisher = self._server_task = None
+        self._started = False
+        _instances.discard(self)
+        if self in _server_owners:
+            _server_owners.discard(self)
+            if not _server_owners:
+                await stop_metrics_server()
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus() -> str:
+    """Render the metrics of every session manager in the Prometheus text format."""
+    families: dict[str, tuple[str, str, list[str]]] = {}
+    for metrics in list(_instances):
+        for metric, kind, help_, labels, value in metrics._samples():
+            # Histogram series are declared under their base name
+            base = metric
+            if kind == "histogram":
+                base = metric.rsplit("_", 1)[0]
+            family = families.setdefault(base, (kind, help_, []))
+            label_text = ",".join(f'{key}="{_escape(v)}"' for key, v in labels.items())
+            family[2].append(f"{metric}{{{label_text}}} {value}")
+    lines: list[str] = []
+    for base, (kind, help_, samples) in families.items():
+        lines.append(f"# HELP {base} {help_}")
+        lines.append(f"# TYPE {base} {kind}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+async def _metrics_handler(_request: web.Request) -> web.Response:
+    return web.Response(
+        text=render_prometheus(), content_type="text/plain", charset="utf-8"
+    )
+
+
+async def start_metrics_server(host: str, port: int) -> web.AppRunner:
+    """Serve ``/metrics`` for every session manager, once per process."""
+    global _server, _server_lock
+    if _server_lock is None:
+        _server_lock = asyncio.Lock()
+    async with _server_lock:
+        if _server is None:
+            app = web.Application()
+            app.router.add_get("/metrics", _metrics_handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            try:
+                await web.TCPSite(runner, host, port).start()
+            except OSError as e:
+                await runner.cleanup()
+                logger.warning(f"Failed to start metrics server on {host}:{port}: {e}")
+                raise
+            _server = runner
+        return _server
+
+
+async def stop_metrics_server() -> None:
+    global _server
+    if _server is not None:
+        await _server.cleanup()
+        _server = None
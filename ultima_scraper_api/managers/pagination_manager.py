@@ -0,0 +1,239 @@
+"""Iterative pagination for list endpoints.
+
+Paginators walk an endpoint page by page and yield each page from an async
+generator, so callers can start processing before the last page has arrived.
+The next page is always requested before the current one is handed to the
+caller, which overlaps network time with parsing.
+
+Two strategies cover the APIs we scrape:
+
+- ``OffsetPaginator``: ``offset``/``limit`` endpoints. Page URLs are known up
+  front, so several pages can be kept in flight at once (``workers``).
+- ``CursorPaginator``: endpoints whose next page depends on the current one,
+  e.g. OnlyFans ``tailMarker``/``marker`` fields or the id of the last item.
+
+A page that comes back as an error (or without a list) ends the walk. It is
+still yielded, with ``Page.error`` set, so callers can tell an incomplete walk
+from the end of the list.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from typing import Any, TypeAlias
+
+# Returns the decoded JSON body of a URL, usually AuthedSession.json_request
+PageFetcher: TypeAlias = Callable[[str], Awaitable[Any]]
+
+
+class Page:
+    def __init__(
+        self,
+        number: int,
+        items: list[dict[str, Any]],
+        response: Any,
+        has_more: bool,
+        url: str | None = None,
+        error: Any = None,
+    ) -> None:
+        self.number = number
+        self.items = items
+        self.response = response
+        self.has_more = has_more
+        self.url = url
+        # Why the page failed, None for a page that returned a list
+        self.error = error
+
+    def raise_for_error(self) -> None:
+        if self.error is not None:
+            raise PaginationError(self)
+
+
+class PaginationError(Exception):
+    """A page failed, so the items collected so far are incomplete."""
+
+    def __init__(self, page: Page) -> None:
+        super().__init__(f"Page {page.number} ({page.url}) failed: {page.error}")
+        self.page = page
+
+
+def _extract_items(response: Any, items_key: str) -> tuple[list[dict[str, Any]], Any]:
+    """Return the items of a page and, if it failed, why."""
+    if isinstance(response, list):
+        return response, None  # type: ignore
+    if isinstance(response, dict):
+        if "error" in response:
+            return [], response["error"] or "error"
+        items = response.get(items_key)
+        if isinstance(items, list):
+            return items, None  # type: ignore
+    return [], f"Response has no {items_key!r} list"
+
+
+class OffsetPaginator:
+    """Walks an ``offset``/``limit`` endpoint."""
+
+    def __init__(
+        self,
+        fetch: PageFetcher,
+        link_factory: Callable[[int], str],
+        limit: int,
+        offset: int = 0,
+        max_items: int | None = None,
+        workers: int = 1,
+        items_key: str = "list",
+    ) -> None:
+        """Initialize the paginator.
+
+        Args:
+            fetch: Coroutine returning the decoded JSON for a URL
+            link_factory: Builds the URL of the page starting at an offset
+            limit: Items per page, the offset step
+            offset: First offset to fetch
+            max_items: Stop after this many items (None = no limit)
+            workers: Pages kept in flight at once. Pages past the end are
+                requested speculatively and discarded.
+            items_key: Response key holding the items of a page
+        """
+        self.fetch = fetch
+        self.link_factory = link_factory
+        self.limit = limit
+        self.offset = offset
+        self.max_items = sys.maxsize if max_items is None else max_items
+        self.workers = max(1, workers)
+        self.items_key = items_key
+
+    def _has_more(self, response: Any, items: list[dict[str, Any]]) -> bool:
+        if not items:
+            return False
+        if isinstance(response, dict) and "hasMore" in response:
+            return bool(response["hasMore"])
+        # Plain list responses don't say, a full page means there may be more
+        return len(items) >= self.limit
+
+    async def pages(self) -> AsyncIterator[Page]:
+        end_offset = self.offset + self.max_items
+        next_offset = self.offset
+        window: deque[tuple[str, asyncio.Task[Any]]] = deque()
+
+        def fill_window() -> None:
+            nonlocal next_offset
+            while len(window) < self.workers and next_offset < end_offset:
+                link = self.link_factory(next_offset)
+                window.append((link, asyncio.create_task(self.fetch(link))))
+                next_offset += self.limit
+
+        item_count = 0
+        number = 0
+        fill_window()
+        try:
+            while window:
+                link, task = window.popleft()
+                response = await task
+                items, error = _extract_items(response, self.items_key)
+                has_more = error is None and self._has_more(response, items)
+                remaining = self.max_items - item_count
+                if len(items) >= remaining:
+                    items = items[:remaining]
+                    has_more = False
+                item_count += len(items)
+                number += 1
+                if has_more:
+                    fill_window()
+                else:
+                    for _link, pending in window:
+                        pending.cancel()
+                    window.clear()
+                yield Page(number, items, response, has_more, link, error)
+        finally:
+            for _link, task in window:
+                task.cancel()
+
+
+class CursorPaginator:
+    """Walks an endpoint whose next page is addressed by the current page."""
+
+    def __init__(
+        self,
+        fetch: PageFetcher,
+        link_factory: Callable[[Any], str],
+        next_cursor: Callable[[Any, list[dict[str, Any]]], Any],
+        cursor: Any = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        items_key: str = "list",
+    ) -> None:
+        """Initialize the paginator.
+
+        Args:
+            fetch: Coroutine returning the decoded JSON for a URL
+            link_factory: Builds the URL of the page addressed by a cursor
+            next_cursor: Returns the cursor of the following page from
+                (response, items), or None when there is none
+            cursor: Cursor of the first page
+            max_items: Stop after this many items (None = no limit)
+            prefetch: Request the next page before yielding the current one
+            items_key: Response key holding the items of a page
+        """
+        self.fetch = fetch
+        self.link_factory = link_factory
+        self.next_cursor = next_cursor
+        self.cursor = cursor
+        self.max_items = sys.maxsize if max_items is None else max_items
+        self.prefetch = prefetch
+        self.items_key = items_key
+
+    async def pages(self) -> AsyncIterator[Page]:
+        item_count = 0
+        number = 0
+        link = self.link_factory(self.cursor)
+        pending: asyncio.Task[Any] | None = asyncio.create_task(self.fetch(link))
+        try:
+            while pending:
+                response = await pending
+                pending = None
+                items, error = _extract_items(response, self.items_key)
+                has_more = bool(
+                    items and isinstance(response, dict) and response.get("hasMore")
+                )
+                remaining = self.max_items - item_count
+                if len(items) >= remaining:
+                    items = items[:remaining]
+                    has_more = False
+                item_count += len(items)
+                number += 1
+                next_link = None
+                if has_more:
+                    cursor = self.next_cursor(response, items)
+                    if cursor is None:
+                        has_more = False
+                    else:
+                        next_link = self.link_factory(cursor)
+                        if self.prefetch:
+                            pending = asyncio.create_task(self.fetch(next_link))
+                yield Page(number, items, response, has_more, link, error)
+                if next_link:
+                    link = next_link
+                    if not pending:
+                        pending = asyncio.create_task(self.fetch(next_link))
+        finally:
+            if pending:
+                pending.cancel()
+
+
+async def collect_items(paginator: OffsetPaginator | CursorPaginator):
+    """Drain a paginator into a single list of items.
+
+    Raises:
+        PaginationError: A page failed before the end of the list
+    """
+    items: list[dict[str, Any]] = []
+    async with aclosing(paginator.pages()) as pages:
+        async for page in pages:
+            page.raise_for_error()
+            items.extend(page.items)
+    return items
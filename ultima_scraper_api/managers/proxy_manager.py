@@ -0,0 +1,242 @@
+"""Proxy pool with health scoring and sticky assignment.
+
+Every configured proxy gets a ``ProxyEndpoint`` holding one pooled connector,
+shared by the client sessions of every auth routed through it. Switching an
+auth to another proxy therefore keeps the warm (TLS) connections of both.
+
+Endpoints are scored from what the requests going through them report:
+
+- latency, as an exponentially weighted moving average of successful requests
+- error rate, the same average over failures (1) and successes (0)
+- 429s, which count as failures and bench the proxy like an error streak
+
+A proxy failing ``max_failures`` times in a row is benched for ``cooldown``
+seconds. Auths are assigned the best scoring proxy and keep it (``sticky``)
+until it's benched, because CDN links are often locked to the IP that
+requested them (see ``CloudFrontPolicy.is_ip_locked``). When every proxy is
+benched, auths wait on the one back soonest, or go direct if ``fallback``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+import time
+import weakref
+from typing import Any
+
+import python_socks
+from aiohttp import ClientSession, ClientTimeout
+from aiohttp_socks import ProxyConnector, ProxyInfo
+
+from ultima_scraper_api.config import Proxy, ProxyPool
+
+logger = logging.getLogger(__name__)
+
+# Weight of a new sample in the moving averages
+SMOOTHING = 0.2
+
+
+def create_ssl_context() -> ssl.SSLContext:
+    ssl_context = ssl.create_default_context()
+    ssl_context.post_handshake_auth = True
+    return ssl_context
+
+
+def parse_proxy(proxy: Proxy) -> ProxyInfo:
+    info = ProxyInfo(*python_socks.parse_proxy_url(proxy.url))
+    # Credentials can be given in the URL or separately
+    return info._replace(
+        username=info.username or proxy.username,
+        password=info.password or proxy.password,
+    )
+
+
+class ProxyEndpoint:
+    """A proxy, its pooled connector and its health."""
+
+    def __init__(self, proxy: Proxy, settings: ProxyPool) -> None:
+        self.proxy = proxy
+        self.url = proxy.url
+        self.info = parse_proxy(proxy)
+        self.settings = settings
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.successes = 0
+        self.failures = 0
+        self.throttled = 0
+        self.consecutive_failures = 0
+        self.benched_until = 0.0
+        self._connector: ProxyConnector | None = None
+
+    def get_connector(self) -> ProxyConnector:
+        if self._connector is None or self._connector.closed:
+            self._connector = ProxyConnector(
+                **self.info._asdict(),
+                ssl=create_ssl_context(),
+                limit=max(0, self.proxy.max_connections),
+            )
+        return self._connector
+
+    def is_available(self) -> bool:
+        return time.monotonic() >= self.benched_until
+
+    def score(self) -> float:
+        """Lower is better."""
+        latency = self.latency if self.latency is not None else 1.0
+        return latency * (1 + 4 * self.error_rate)
+
+    def record_success(self, latency: float) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.error_rate *= 1 - SMOOTHING
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += (latency - self.latency) * SMOOTHING
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate += (1 - self.error_rate) * SMOOTHING
+        if self.consecutive_failures >= self.settings.max_failures:
+            self.bench()
+
+    def record_throttle(self) -> None:
+        self.throttled += 1
+        self.record_failure()
+
+    def bench(self) -> None:
+        self.benched_until = time.monotonic() + self.settings.cooldown
+        self.consecutive_failures = 0
+        logger.warning(
+            "Proxy %s:%s benched for %.0fs",
+            self.info.host,
+            self.info.port,
+            self.settings.cooldown,
+        )
+
+    async def close(self) -> None:
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "successes": self.successes,
+            "failures": self.failures,
+            "throttled": self.throttled,
+            "benched_for": max(0.0, self.benched_until - time.monotonic()),
+            "score": self.score(),
+        }
+
+
+class ProxyManager:
+    def __init__(
+        self, settings: ProxyPool = ProxyPool(), fallback: bool = False
+    ) -> None:
+        self.settings = settings
+        self.fallback = fallback
+        self.proxies: list[ProxyEndpoint] = []
+        # Owner (usually an AuthedSession) -> proxy it sticks to
+        self._assignments: weakref.WeakKeyDictionary[Any, ProxyEndpoint] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def add_proxies(self, proxies: list[Proxy] = []):
+        for proxy in proxies:
+            self._add_proxy(proxy)
+
+    def _add_proxy(self, proxy: Proxy):
+        self.proxies.append(ProxyEndpoint(proxy, self.settings))
+
+    def create_connection(self, proxy: ProxyInfo, ssl: ssl.SSLContext):
+        return ProxyConnector(**proxy._asdict(), ssl=ssl)  # type: ignore
+
+    def best(self, exclude: ProxyEndpoint | None = None) -> ProxyEndpoint | None:
+        """Return the healthiest proxy.
+
+        If all are benched, returns the one back soonest, or None (direct
+        connection) with ``fallback``.
+        """
+        candidates = [x for x in self.proxies if x is not exclude] or self.proxies
+        if not candidates:
+            return None
+        available = [x for x in candidates if x.is_available()]
+        if available:
+            return min(available, key=ProxyEndpoint.score)
+        if self.fallback:
+            return None
+        return min(candidates, key=lambda x: x.benched_until)
+
+    def assign(self, owner: Any) -> ProxyEndpoint | None:
+        """Return the proxy ``owner`` should use, sticking to its last one while healthy."""
+        current = self._assignments.get(owner)
+        if current and current.is_available() and self.settings.sticky:
+            return current
+        return self._assign(owner, self.best())
+
+    def reassign(self, owner: Any) -> ProxyEndpoint | None:
+        """Move ``owner`` to the healthiest other proxy."""
+        return self._assign(owner, self.best(exclude=self._assignments.get(owner)))
+
+    def _assign(self, owner: Any, proxy: ProxyEndpoint | None) -> ProxyEndpoint | None:
+        if proxy:
+            self._assignments[owner] = proxy
+        else:
+            self._assignments.pop(owner, None)
+        return proxy
+
+    async def test_proxies(
+        self, url: str | None = None, timeout: float | None = None
+    ) -> list[ProxyEndpoint]:
+        """Request ``url`` through every proxy concurrently.
+
+        Latency and failures are recorded like regular requests, proxies that
+        fail are benched.
+
+        Returns:
+            Proxies that answered
+        """
+        url = url or self.settings.check_url
+        client_timeout = ClientTimeout(total=timeout or self.settings.check_timeout)
+
+        async def check(proxy: ProxyEndpoint) -> bool:
+            started_at = time.monotonic()
+            try:
+                async with ClientSession(
+                    connector=proxy.get_connector(),
+                    connector_owner=False,
+                    timeout=client_timeout,
+                ) as session:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        await response.read()
+            except Exception as e:
+                logger.warning(
+                    "Proxy %s:%s failed its check: %r",
+                    proxy.info.host,
+                    proxy.info.port,
+                    e,
+                )
+                proxy.record_failure()
+                proxy.bench()
+                return False
+            proxy.record_success(time.monotonic() - started_at)
+            return True
+
+        results = await asyncio.gather(*map(check, self.proxies))
+        return [proxy for proxy, ok in zip(self.proxies, results) if ok]
+
+    async def close(self) -> None:
+        for proxy in self.proxies:
+            await proxy.close()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {
+            f"{proxy.info.host}:{proxy.info.port}": proxy.snapshot()
+            for proxy in self.proxies
+        }
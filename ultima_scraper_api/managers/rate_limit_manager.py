@@ -0,0 +1,277 @@
+"""Async token-bucket rate limiting for UltimaScraperAPI.
+
+Requests are metered per (site, auth, endpoint class) bucket. A 429 only pauses
+the bucket that received it, for as long as the server asked via
+``Retry-After`` (or rate-limit headers), instead of stalling every request in
+the process. Waiters sleep on an ``asyncio.Condition`` until the next token is
+due, nothing polls and nothing blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, TypeAlias
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from ultima_scraper_api.config import RateLimit
+
+
+logger = logging.getLogger(__name__)
+
+RateLimitKey: TypeAlias = tuple[str, str, str]
+
+# Path segments naming an endpoint. Anything else (ids, usernames, hashes, API
+# version prefixes) is an identifier, which would give every user or post its
+# own bucket and metric label
+_ENDPOINT_NAMES = frozenset(
+    """
+    account album albums all archive archived auth block bookmark buttons chats
+    check comments content count drm favorites following group groups
+    highlights issues like lists login me media mediastoriesnew message
+    messages messaging orders otp paid pay payments post posts profile purchase
+    queue react replies report search settings social sort spotify star stats
+    stories subscribe subscribes subscriptions timeline transactions user users
+    uservault vault
+    """.split()
+)
+# Timestamps above this are treated as epoch seconds rather than deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def endpoint_class(url: str) -> str:
+    """Group a URL into an endpoint family.
+
+    Only known endpoint names are kept, so ``/api2/v2/users/123/posts`` and
+    ``/api2/v2/users/someone/posts`` share the ``users/posts`` family and
+    ``/api2/v2/users/someone`` falls in ``users``. URLs without any (e.g. CDN
+    files) are grouped by host.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Endpoint family name
+    """
+    parsed = urlparse(url)
+    segments = [
+        segment
+        for segment in parsed.path.lower().split("/")
+        if segment in _ENDPOINT_NAMES
+    ]
+    return "/".join(segments[:2]) or parsed.netloc.lower()
+
+
+def _parse_delay(value: str | None) -> float | None:
+    """Parse a header value expressed as seconds, an epoch or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    if number > _EPOCH_THRESHOLD:
+        return number - time.time()
+    return number
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Extract how long the server wants us to wait.
+
+    Honors ``Retry-After`` first, then ``X-RateLimit-*``/``RateLimit-*`` headers
+    when the remaining quota is exhausted.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Seconds to wait, or None when the headers don't say
+    """
+    delay = _parse_delay(headers.get("Retry-After"))
+    if delay is not None:
+        return max(0.0, delay)
+    for prefix in ("X-RateLimit-", "RateLimit-"):
+        remaining = headers.get(f"{prefix}Remaining")
+        if remaining is None:
+            continue
+        try:
+            exhausted = float(remaining) <= 0
+        except ValueError:
+            continue
+        if exhausted:
+            delay = _parse_delay(headers.get(f"{prefix}Reset"))
+            if delay is not None:
+                return max(0.0, delay)
+    return None
+
+
+class TokenBucket:
+    """Token bucket for one (site, auth, endpoint class) key."""
+
+    def __init__(
+        self,
+        key: RateLimitKey,
+        rate: float,
+        capacity: float,
+        default_retry_after: float = 5.0,
+        max_retry_after: float = 300.0,
+    ) -> None:
+        """Initialize the bucket.
+
+        Args:
+            key: (site, auth, endpoint class) this bucket meters
+            rate: Tokens added per second, 0 disables metering (pauses still apply)
+            capacity: Maximum tokens that can be banked for bursts
+            default_retry_after: Pause used for a 429 without usable headers,
+                doubled for every consecutive 429
+            max_retry_after: Upper bound for any pause
+        """
+        self.key = key
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.consecutive_throttles = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+        self._condition = asyncio.Condition()
+
+    def _reserve(self, now: float) -> float:
+        """Take a token if one is available, otherwise return the delay until one is."""
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started_at = time.monotonic()
+        async with self._condition:
+            while True:
+                delay = self._reserve(time.monotonic())
+                if delay <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        waited = time.monotonic() - started_at
+        self.waited_seconds += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        # Tokens only start accumulating again once the pause is over
+        self.tokens = 0.0
+        self.updated_at = self.paused_until
+
+    def penalize(self, headers: Mapping[str, str]) -> float:
+        """Pause the bucket after a 429.
+
+        Args:
+            headers: Headers of the 429 response
+
+        Returns:
+            Seconds the bucket is paused for
+        """
+        self.throttled += 1
+        self.consecutive_throttles += 1
+        delay = parse_retry_after(headers)
+        if delay is None:
+            delay = self.default_retry_after * 2 ** (self.consecutive_throttles - 1)
+        delay = min(delay, self.max_retry_after)
+        self.pause(delay)
+        return delay
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Honor rate-limit headers on a successful response."""
+        self.consecutive_throttles = 0
+        delay = parse_retry_after(headers)
+        if delay:
+            self.pause(min(delay, self.max_retry_after))
+
+    async def update_rate(self, rate: float) -> None:
+        """Change the refill rate and wake waiters so they re-evaluate their delay."""
+        async with self._condition:
+            self.rate = rate
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "tokens": self.tokens,
+            "paused_for": max(0.0, self.paused_until - time.monotonic()),
+            "throttled": self.throttled,
+            "waited_seconds": self.waited_seconds,
+        }
+
+
+class RateLimitManager:
+    """Keeps one ``TokenBucket`` per (site, auth, endpoint class)."""
+
+    def __init__(self, settings: RateLimit) -> None:
+        self.settings = settings
+        self.buckets: dict[RateLimitKey, TokenBucket] = {}
+
+    def get_bucket(self, site_name: str, auth_id: str, url: str) -> TokenBucket:
+        family = endpoint_class(url)
+        key = (site_name, auth_id, family)
+        bucket = self.buckets.get(key)
+        if not bucket:
+            settings = self.settings
+            rate = settings.endpoint_overrides.get(family, settings.requests_per_second)
+            bucket = TokenBucket(
+                key,
+                rate,
+                settings.burst,
+                default_retry_after=settings.default_retry_after,
+                max_retry_after=settings.max_retry_after,
+            )
+            self.buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, site_name: str, auth_id: str, url: str) -> TokenBucket:
+        """Wait for a token from the bucket ``url`` belongs to.
+
+        Args:
+            site_name: Site the request is for
+            auth_id: Identity of the auth making the request
+            url: Request URL
+
+        Returns:
+            TokenBucket the token was taken from, so the response can be reported
+        """
+        bucket = self.get_bucket(site_name, auth_id, url)
+        waited = await bucket.acquire()
+        if waited >= 1:
+            logger.debug("Rate limiter held %s for %.1fs", bucket.key, waited)
+        return bucket
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {
+            "|".join(key): bucket.snapshot() for key, bucket in self.buckets.items()
+        }
@@ -14,6 +14,8 @@ from .connection import (
     shutdown_redis,
 )
 from .hooks import (
+    HookPublisher,
+    hook_publisher,
     publish_custom_event,
     with_hooks,
     with_hooks_class,
@@ -38,6 +40,8 @@ __all__ = [
     "with_hooks",
     "with_hooks_class",
     "publish_custom_event",
+    "HookPublisher",
+    "hook_publisher",
     # Logging
     "RedisLogHandler",
     "AsyncRedisLogHandler",
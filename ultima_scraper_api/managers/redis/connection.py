@@ -189,6 +189,31 @@ class RedisManager:
             logger.debug("Failed to serialize/publish JSON to Redis: %s", exc)
             return False
 
+    async def publish_many(self, channel: str, messages: list[str]) -> bool:
+        """Publish several messages to a channel in one pipeline.
+
+        Args:
+            channel: Channel name
+            messages: Messages to publish, in order
+
+        Returns:
+            bool: True if published successfully
+        """
+        if not self.is_connected:
+            return False
+        if not messages:
+            return True
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for message in messages:
+                    pipe.publish(channel, message)  # type: ignore
+                await pipe.execute()
+            return True
+        except Exception as exc:
+            logger.debug("Failed to publish batch to Redis: %s", exc)
+            return False
+
     async def subscribe(self, *channels: str) -> PubSub | None:
         """Subscribe to Redis channels.
 
@@ -390,7 +415,11 @@ def get_redis() -> RedisManager | None:
 
 async def shutdown_redis() -> None:
     """Shutdown global Redis manager."""
+    from ultima_scraper_api.managers.redis.hooks import hook_publisher
+
     global _redis_manager
     if _redis_manager:
+        # Send queued hook events before the connection goes away
+        await hook_publisher.close()
         await _redis_manager.disconnect()
         _redis_manager = None
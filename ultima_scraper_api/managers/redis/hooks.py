@@ -1,9 +1,17 @@
-"""Hooks system for monitoring and logging API operations via Redis."""
+"""Hooks system for monitoring and logging API operations via Redis.
+
+Hook events are never published inline. They are put on a bounded in-memory
+queue and a single background task drains it, publishing batches through a
+Redis pipeline, so instrumenting a call costs microseconds rather than a Redis
+round-trip. When the queue is full new events are dropped and counted.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import inspect
+import json
 import logging
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional, TypeVar
@@ -26,8 +34,8 @@ def _serialize_value(value: Any) -> Any:
         JSON-serializable value
     """
     # Handle common non-serializable types
-    if hasattr(value, "__dict__"):
-        # Object with __dict__ - try to get class name and relevant attributes
+    if hasattr(value, "__dict__") or hasattr(value, "__slots__"):
+        # Object with __dict__ or __slots__ - try to get class name and relevant attributes
         class_name = value.__class__.__name__
         # Return simplified representation
         return f"<{class_name}>"
@@ -40,6 +48,12 @@ def _serialize_value(value: Any) -> Any:
         return value
 
 
+@functools.lru_cache(maxsize=None)
+def _get_param_names(func: Callable[..., Any]) -> tuple[str, ...]:
+    """Parameter names of a function, inspected once per function."""
+    return tuple(inspect.signature(func).parameters)
+
+
 def _get_hook_metadata(
     func: Callable[..., Any],
     args: tuple[Any, ...],
@@ -61,9 +75,7 @@ def _get_hook_metadata(
     Returns:
         Dictionary with hook metadata
     """
-    # Get function signature
-    sig = inspect.signature(func)
-    param_names = list(sig.parameters.keys())
+    param_names = _get_param_names(func)
 
     # Build arguments dict (skip 'self' for methods)
     func_args: dict[str, Any] = {}
@@ -104,43 +116,134 @@ def _get_hook_metadata(
     return metadata
 
 
+class HookPublisher:
+    """Publishes hook events from a bounded queue in the background."""
+
+    def __init__(self, max_queue_size: int = 10_000, batch_size: int = 256) -> None:
+        """Initialize the publisher.
+
+        Args:
+            max_queue_size: Events buffered before new ones are dropped
+            batch_size: Maximum events sent in one pipeline
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.published = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_worker(self) -> asyncio.Queue[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # Queues and tasks belong to one event loop
+            self._loop = loop
+            self._queue = asyncio.Queue(self.max_queue_size)
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._drain(self._queue))
+        return self._queue
+
+    def publish(self, metadata: dict[str, Any]) -> bool:
+        """Queue an event without waiting for Redis.
+
+        Args:
+            metadata: Event to publish
+
+        Returns:
+            bool: False if the event was dropped
+        """
+        redis_conn = get_redis()
+        if not redis_conn or not redis_conn.is_connected:
+            logger.debug("Cannot publish hook event - Redis not connected")
+            return False
+        try:
+            self._ensure_worker().put_nowait(metadata)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("Hook queue full, %d events dropped", self.dropped)
+            return False
+        return True
+
+    async def _drain(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._send(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _send(self, batch: list[dict[str, Any]]) -> None:
+        redis_conn = get_redis()
+        if not redis_conn or not redis_conn.is_connected:
+            self.failed += len(batch)
+            return
+        messages: list[str] = []
+        for metadata in batch:
+            try:
+                messages.append(json.dumps(metadata, default=str))
+            except Exception as exc:
+                self.failed += 1
+                logger.debug("Failed to serialize hook event: %s", exc)
+        if await redis_conn.publish_many(RedisManager.HOOKS_CHANNEL, messages):
+            self.published += len(messages)
+            logger.debug("Published %d hook events", len(messages))
+        else:
+            self.failed += len(messages)
+
+    async def flush(self, timeout: float | None = 5.0) -> None:
+        """Wait until every queued event has been sent.
+
+        Args:
+            timeout: Give up after this many seconds (None = wait forever)
+        """
+        queue = self._queue
+        if queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out flushing %d hook events", queue.qsize())
+
+    async def close(self, timeout: float | None = 5.0) -> None:
+        """Flush pending events and stop the background task."""
+        await self.flush(timeout)
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._task = None
+        self._queue = None
+        self._loop = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "published": self.published,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+# Global hook publisher instance
+hook_publisher = HookPublisher()
+
+
 async def _publish_hook_event(metadata: dict[str, Any]) -> None:
-    """Publish hook event to Redis.
+    """Queue hook event for publishing to Redis.
 
     Args:
         metadata: Event metadata to publish
     """
-    redis_conn = get_redis()
-    if not redis_conn or not redis_conn.is_connected:
-        logger.warning(
-            f"Cannot publish hook event - Redis not connected (redis_conn={redis_conn}, "
-            f"is_connected={redis_conn.is_connected if redis_conn else 'N/A'})"
-        )
-        return
-
-    try:
-        await redis_conn.publish_hook(metadata)
-
-        # Log based on what fields are available
-        if "module" in metadata and "function" in metadata and "event_type" in metadata:
-            # Standard hook event from @with_hooks decorator
-            logger.info(
-                "✓ Published hook event: %s.%s [%s]",
-                metadata["module"],
-                metadata["function"],
-                metadata["event_type"],
-            )
-        elif "event" in metadata:
-            # Custom event (like scrape_progress, scrape_finished)
-            logger.info(
-                "✓ Published custom event: %s",
-                metadata["event"],
-            )
-        else:
-            # Generic event
-            logger.info("✓ Published event to %s", RedisManager.HOOKS_CHANNEL)
-    except Exception as exc:
-        logger.error("Failed to publish hook event: %s", exc, exc_info=True)
+    hook_publisher.publish(metadata)
 
 
 def with_hooks(func: F) -> F:
@@ -166,26 +269,28 @@ def with_hooks(func: F) -> F:
 
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Publish started event
-            started_metadata = _get_hook_metadata(func, args, kwargs, "started")
-            await _publish_hook_event(started_metadata)
+            redis_conn = get_redis()
+            if not redis_conn or not redis_conn.is_connected:
+                # Nothing would be published, skip building metadata
+                return await func(*args, **kwargs)
+
+            # Queue started event
+            hook_publisher.publish(_get_hook_metadata(func, args, kwargs, "started"))
 
             try:
                 result = await func(*args, **kwargs)
 
-                # Publish finished event
-                finished_metadata = _get_hook_metadata(
-                    func, args, kwargs, "finished", result=result
+                # Queue finished event
+                hook_publisher.publish(
+                    _get_hook_metadata(func, args, kwargs, "finished", result=result)
                 )
-                await _publish_hook_event(finished_metadata)
 
                 return result
             except Exception as exc:
-                # Publish error event
-                error_metadata = _get_hook_metadata(
-                    func, args, kwargs, "error", error=exc
+                # Queue error event
+                hook_publisher.publish(
+                    _get_hook_metadata(func, args, kwargs, "error", error=exc)
                 )
-                await _publish_hook_event(error_metadata)
                 raise
 
         return async_wrapper  # type: ignore
@@ -211,6 +316,9 @@ def with_hooks(func: F) -> F:
 async def publish_custom_event(event_data: dict[str, Any]) -> None:
     """Publish a custom event to the ultima:hooks channel.
 
+    The event is queued and sent by the background publisher, this doesn't
+    wait for Redis.
+
     This allows manual publishing of custom events (like scrape_progress, scrape_finished)
     that don't fit the standard function hook pattern.
 
@@ -236,7 +344,7 @@ async def publish_custom_event(event_data: dict[str, Any]) -> None:
     if "timestamp" not in event_data:
         event_data["timestamp"] = datetime.now(timezone.utc).isoformat()
 
-    await _publish_hook_event(event_data)
+    hook_publisher.publish(event_data)
 
 
 def with_hooks_class(cls: type) -> type:
@@ -1,7 +1,9 @@
 """WebSocket message storage in Redis with deduplication.
 
 This module provides Redis-based storage for WebSocket messages with
-built-in deduplication to handle multiple API instances.
+built-in deduplication to handle multiple API instances. Messages are
+deduplicated with an atomic ``SET NX`` and written in pipelined batches, see
+``WebSocketStorage.store_messages``.
 """
 
 from __future__ import annotations
@@ -97,56 +99,103 @@ class WebSocketStorage:
             - was_stored: True if message was new, False if duplicate
             - message_id: Unique ID of the message
         """
-        if not self.redis.is_connected:
-            logger.warning("Redis not connected, cannot store WebSocket message")
-            return False, ""
+        results = await self.store_messages([message], source_id=source_id)
+        return results[0]
 
-        try:
-            # Generate message ID
-            message_id = self._generate_message_id(message)
-            dedup_key = f"{self._dedup_key_prefix}:{message_id}"
-
-            # Check if this message was already processed
-            exists = await self.redis.exists(dedup_key)
-            if exists:
-                logger.debug(f"Duplicate message detected: {message_id}")
-                return False, message_id
-
-            # Mark as processed (with TTL)
-            await self.redis.set(dedup_key, "1", ex=self.dedup_ttl)
-
-            # Enrich message with metadata
-            enriched_message: dict[str, Any] = {
-                **message,
-                "id": message_id,
-                "stored_at": datetime.now(timezone.utc).isoformat(),
-                "source_id": source_id,
-            }
-
-            # Store the full message
-            message_key = f"{self._message_key_prefix}:{message_id}"
-            await self.redis.set(
-                message_key,
-                json.dumps(enriched_message),
-                ex=self.storage_ttl,
-            )
+    async def store_messages(
+        self,
+        messages: list[dict[str, Any]],
+        source_id: Optional[str] = None,
+    ) -> list[tuple[bool, str]]:
+        """
+        Store a batch of WebSocket messages with deduplication.
 
-            # Add to index (sorted set by timestamp)
-            timestamp = message.get("timestamp", datetime.now(timezone.utc).timestamp())
-            if self.redis.client:
-                await self.redis.client.zadd(self._index_key, {message_id: timestamp})
-                if self.storage_ttl:
-                    await self.redis.expire(self._index_key, self.storage_ttl)
+        The batch costs two round-trips regardless of its size. The first
+        pipeline claims every dedup key with ``SET NX``, which is atomic, so
+        two API instances receiving the same event can't both store it. The
+        second pipeline stores the claimed messages, indexes and publishes them.
 
-            # Publish to stream for real-time subscribers
-            await self.redis.publish_json(self._channel, enriched_message)
+        Args:
+            messages: Message dictionaries to store, in arrival order
+            source_id: Optional identifier for the API instance
+
+        Returns:
+            One (was_stored, message_id) tuple per message, in input order
+        """
+        if not messages:
+            return []
+        if not self.redis.is_connected or not self.redis.client:
+            logger.warning("Redis not connected, cannot store WebSocket messages")
+            return [(False, "") for _ in messages]
 
-            logger.debug(f"Stored WebSocket message: {message_id}")
-            return True, message_id
+        try:
+            message_ids = [self._generate_message_id(message) for message in messages]
+            dedup_keys = [
+                f"{self._dedup_key_prefix}:{message_id}" for message_id in message_ids
+            ]
+
+            # Claim the dedup keys, duplicates within the batch lose to the first
+            async with self.redis.client.pipeline(transaction=False) as pipe:
+                for dedup_key in dedup_keys:
+                    pipe.set(dedup_key, "1", ex=self.dedup_ttl, nx=True)
+                claimed = await pipe.execute()
+
+            results: list[tuple[bool, str]] = []
+            stored: list[tuple[str, dict[str, Any], float]] = []
+            stored_at = datetime.now(timezone.utc)
+            for message, message_id, was_claimed in zip(messages, message_ids, claimed):
+                results.append((bool(was_claimed), message_id))
+                if not was_claimed:
+                    logger.debug(f"Duplicate message detected: {message_id}")
+                    continue
+                # Enrich message with metadata
+                enriched_message: dict[str, Any] = {
+                    **message,
+                    "id": message_id,
+                    "stored_at": stored_at.isoformat(),
+                    "source_id": source_id,
+                }
+                timestamp = message.get("timestamp", stored_at.timestamp())
+                stored.append((message_id, enriched_message, timestamp))
+
+            if not stored:
+                return results
+
+            try:
+                async with self.redis.client.pipeline(transaction=False) as pipe:
+                    for message_id, enriched_message, _ in stored:
+                        pipe.set(
+                            f"{self._message_key_prefix}:{message_id}",
+                            json.dumps(enriched_message),
+                            ex=self.storage_ttl,
+                        )
+                    # Add to index (sorted set by timestamp)
+                    pipe.zadd(
+                        self._index_key,
+                        {message_id: timestamp for message_id, _, timestamp in stored},
+                    )
+                    if self.storage_ttl:
+                        pipe.expire(self._index_key, self.storage_ttl)
+                    # Publish to stream for real-time subscribers
+                    for _, enriched_message, _ in stored:
+                        pipe.publish(self._channel, json.dumps(enriched_message))
+                    await pipe.execute()
+            except Exception:
+                # Release the claims so the messages can be stored on redelivery
+                await self.redis.client.unlink(
+                    *(
+                        f"{self._dedup_key_prefix}:{message_id}"
+                        for message_id, *_ in stored
+                    )
+                )
+                raise
+
+            logger.debug(f"Stored {len(stored)} WebSocket message(s)")
+            return results
 
         except Exception as e:
-            logger.error(f"Failed to store WebSocket message: {e}", exc_info=True)
-            return False, ""
+            logger.error(f"Failed to store WebSocket messages: {e}", exc_info=True)
+            return [(False, "") for _ in messages]
 
     async def get_message(self, message_id: str) -> Optional[dict[str, Any]]:
         """
@@ -206,14 +255,14 @@ class WebSocketStorage:
                 num=count,
             )
 
-            # Retrieve full messages
-            messages: list[dict[str, Any]] = []
-            for msg_id in message_ids:
-                message = await self.get_message(msg_id)
-                if message:
-                    messages.append(message)
+            if not message_ids:
+                return []
 
-            return messages
+            # Retrieve full messages in one round-trip, skipping expired ones
+            values = await self.redis.client.mget(
+                [f"{self._message_key_prefix}:{msg_id}" for msg_id in message_ids]
+            )
+            return [json.loads(value) for value in values if value]
 
         except Exception as e:
             logger.error(f"Failed to retrieve recent messages: {e}")
@@ -276,17 +325,14 @@ class WebSocketStorage:
             if not message_ids:
                 return 0
 
-            # Delete message data
-            for msg_id in message_ids:
-                message_key = f"{self._message_key_prefix}:{msg_id}"
-                await self.redis.delete(message_key)
-
-            # Remove from index
-            removed = await self.redis.client.zremrangebyscore(
-                self._index_key,
-                "-inf",
-                before_timestamp,
-            )
+            # Delete message data and remove from index in one round-trip,
+            # UNLINK frees the values in the background
+            async with self.redis.client.pipeline(transaction=False) as pipe:
+                pipe.unlink(
+                    *(f"{self._message_key_prefix}:{msg_id}" for msg_id in message_ids)
+                )
+                pipe.zremrangebyscore(self._index_key, "-inf", before_timestamp)
+                _, removed = await pipe.execute()
 
             logger.info(f"Cleared {removed} old WebSocket messages")
             return removed
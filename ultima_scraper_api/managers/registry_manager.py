@@ -0,0 +1,249 @@
+"""Bounded in-memory registries for users and scraped content.
+
+Auth models keep every user they resolve and scrape managers keep every piece
+of content they build, which makes long-running workers grow forever.
+``BoundedRegistry`` is a dict-like store with optional limits:
+
+- ``max_entries``/``max_bytes``: least recently used entries are evicted
+- ``ttl``: entries not read or written for this many seconds are dropped
+- ``weak``: evicted objects stay reachable through a weak reference for as long
+  as something else still holds them, so a user referenced by a subscription
+  isn't duplicated when it's resolved again
+- ``on_discard``: called with the key of an entry once it's gone for good
+  (expired, evicted and no longer referenced, deleted), so indexes built on
+  top of a registry can follow it
+
+Sizes are rough (shallow ``sys.getsizeof`` of the object and its raw dict),
+good enough to compare registries and bound growth, not to measure memory.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from ultima_scraper_api.config import Registry
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def approximate_size(value: Any) -> int:
+    size = sys.getsizeof(value)
+    raw = getattr(value, "__raw__", None)
+    if isinstance(raw, dict):
+        size += sys.getsizeof(raw)
+    elif hasattr(value, "__dict__"):
+        size += sys.getsizeof(value.__dict__)
+    return size
+
+
+class BoundedRegistry(MutableMapping[K, V], Generic[K, V]):
+    """Dict-like store with LRU/TTL eviction and weak references."""
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        weak: bool = False,
+        sizeof: Callable[[Any], int] = approximate_size,
+        on_discard: Callable[[K], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of strongly held entries, None is unbounded
+            max_bytes: Maximum approximate size of strongly held entries
+            ttl: Seconds an entry may go unused before it's dropped
+            weak: Keep evicted objects reachable while they're referenced elsewhere
+            sizeof: Estimates the size of a value in bytes
+            on_discard: Called with the key of an entry that left the registry
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.on_discard = on_discard
+        # key -> (value, last used, size), least recently used first
+        self._entries: OrderedDict[K, tuple[V, float, int]] = OrderedDict()
+        self._weak: weakref.WeakValueDictionary[K, Any] | None = (
+            weakref.WeakValueDictionary() if weak else None
+        )
+        # Weakly held key -> callback discarding it once its value is collected
+        self._finalizers: dict[K, weakref.finalize] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        deadline = time.monotonic() - self.ttl
+        while self._entries:
+            key, (_, used_at, size) = next(iter(self._entries.items()))
+            if used_at > deadline:
+                break
+            del self._entries[key]
+            self.bytes -= size
+            self.expirations += 1
+            self._discard(key)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            key, (value, _, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+            if self._weak is not None:
+                try:
+                    self._weak[key] = value
+                except TypeError:
+                    # Not weak-referenceable, e.g. a plain dict
+                    pass
+                else:
+                    if self.on_discard is not None:
+                        finalizer = weakref.finalize(value, self._collected, key)
+                        finalizer.atexit = False
+                        self._finalizers[key] = finalizer
+                    continue
+            self._discard(key)
+
+    def _detach(self, key: K) -> None:
+        finalizer = self._finalizers.pop(key, None)
+        if finalizer is not None:
+            finalizer.detach()
+
+    def _discard(self, key: K) -> None:
+        self._detach(key)
+        if self.on_discard is not None:
+            self.on_discard(key)
+
+    def _collected(self, key: K) -> None:
+        self._finalizers.pop(key, None)
+        # The key may have been stored again with another value since
+        if key not in self._entries and self.on_discard is not None:
+            self.on_discard(key)
+
+    def _store(self, key: K, value: V) -> None:
+        old = self._entries.pop(key, None)
+        if old:
+            self.bytes -= old[2]
+        size = self.sizeof(value)
+        self._entries[key] = (value, time.monotonic(), size)
+        self.bytes += size
+        self._evict()
+
+    def __getitem__(self, key: K) -> V:
+        self._expire()
+        entry = self._entries.get(key)
+        if entry:
+            value, _, size = entry
+            self._entries[key] = (value, time.monotonic(), size)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        if self._weak is not None:
+            value = self._weak.get(key)
+            if value is not None:
+                # Evicted but still in use, hold it again
+                del self._weak[key]
+                self._detach(key)
+                self._store(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        raise KeyError(key)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._expire()
+        if self._weak is not None:
+            self._weak.pop(key, None)
+            self._detach(key)
+        self._store(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry:
+            self.bytes -= entry[2]
+        weak_value = self._weak.pop(key, None) if self._weak is not None else None
+        if entry is None and weak_value is None:
+            raise KeyError(key)
+        self._discard(key)
+
+    def _snapshot(self) -> list[tuple[K, V]]:
+        self._expire()
+        items = [(key, entry[0]) for key, entry in self._entries.items()]
+        if self._weak is not None:
+            items.extend(self._weak.items())
+        return items
+
+    def __iter__(self) -> Iterator[K]:
+        return iter([key for key, _ in self._snapshot()])
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._entries) + (len(self._weak) if self._weak is not None else 0)
+
+    def __contains__(self, key: object) -> bool:
+        self._expire()
+        return key in self._entries or (self._weak is not None and key in self._weak)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._snapshot())!r})"
+
+    # Snapshots, so entries evicted while iterating don't break the loop
+    def keys(self) -> list[K]:  # type: ignore[override]
+        return [key for key, _ in self._snapshot()]
+
+    def values(self) -> list[V]:  # type: ignore[override]
+        return [value for _, value in self._snapshot()]
+
+    def items(self) -> list[tuple[K, V]]:  # type: ignore[override]
+        return self._snapshot()
+
+    def clear(self) -> None:
+        keys = self.keys()
+        self._entries.clear()
+        if self._weak is not None:
+            self._weak.clear()
+        self.bytes = 0
+        for key in keys:
+            self._discard(key)
+
+    def snapshot(self) -> dict[str, Any]:
+        self._expire()
+        return {
+            "entries": len(self._entries),
+            "weak_entries": len(self._weak) if self._weak is not None else 0,
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def create_registry(
+    settings: Registry,
+    max_entries: int | None,
+    on_discard: Callable[[Any], None] | None = None,
+) -> BoundedRegistry[Any, Any]:
+    """Create a registry bounded by the shared registry settings."""
+    return BoundedRegistry(
+        max_entries=max_entries,
+        max_bytes=settings.max_bytes,
+        ttl=settings.ttl,
+        weak=settings.weak_references,
+        on_discard=on_discard,
+    )
@@ -0,0 +1,221 @@
+"""Persistent response cache for JSON GET requests.
+
+Responses are stored in a local SQLite database keyed by the normalized URL
+and the auth that fetched them. Each endpoint family (see
+``rate_limit_manager.endpoint_class``) has its own TTL: a fresh entry is served
+without touching the network, a stale one is revalidated with
+``If-None-Match``/``If-Modified-Since`` when the site sent validators, so an
+unchanged page costs a 304 instead of a full body.
+
+SQLite calls run in a worker thread to keep the event loop free.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import orjson
+
+from ultima_scraper_api.managers.rate_limit_manager import endpoint_class
+
+if TYPE_CHECKING:
+    from ultima_scraper_api.config import ResponseCache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    family TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+# Prune the oldest entries once every this many writes
+_PRUNE_INTERVAL = 1000
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase the host and sort the query so equivalent URLs share an entry."""
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return parsed._replace(
+        scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), query=query
+    ).geturl()
+
+
+class CachedResponse:
+    def __init__(
+        self,
+        key: str,
+        body: Any,
+        etag: str | None,
+        last_modified: str | None,
+        expires_at: float,
+    ) -> None:
+        self.key = key
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validator_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCacheManager:
+    """SQLite-backed cache of decoded JSON responses."""
+
+    def __init__(self, settings: ResponseCache) -> None:
+        self.settings = settings
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stores = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        settings.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(settings.path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(_SCHEMA)
+            self._connection.commit()
+
+    def get_ttl(self, url: str) -> float:
+        family = endpoint_class(url)
+        return self.settings.ttls.get(family, self.settings.default_ttl)
+
+    def create_key(self, url: str, auth_id: str) -> str:
+        return f"{auth_id}|{normalize_url(url)}"
+
+    def _get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses"
+                " WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        body, etag, last_modified, expires_at = row
+        return CachedResponse(key, orjson.loads(body), etag, last_modified, expires_at)
+
+    async def get(self, url: str, auth_id: str) -> CachedResponse | None:
+        """Look up a cached response.
+
+        Args:
+            url: Request URL
+            auth_id: Identity of the auth making the request
+
+        Returns:
+            The cached response, fresh or stale, or None
+        """
+        entry = await asyncio.to_thread(self._get, self.create_key(url, auth_id))
+        if entry and entry.is_fresh():
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def _put(
+        self,
+        key: str,
+        family: str,
+        body: bytes,
+        etag: str | None,
+        last_modified: str | None,
+        expires_at: float,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, family, body, etag, last_modified, time.time(), expires_at),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_INTERVAL == 0:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key NOT IN"
+                    " (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                    (self.settings.max_entries,),
+                )
+            self._connection.commit()
+
+    async def put(
+        self, url: str, auth_id: str, body: Any, headers: Mapping[str, str]
+    ) -> None:
+        """Store a response if its family is cached or the site sent validators.
+
+        Args:
+            url: Request URL
+            auth_id: Identity of the auth making the request
+            body: Decoded JSON body
+            headers: Response headers, used for ETag/Last-Modified
+        """
+        ttl = self.get_ttl(url)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        # Without a TTL an entry is only useful for revalidation
+        if ttl <= 0 and not (etag or last_modified):
+            return
+        await asyncio.to_thread(
+            self._put,
+            self.create_key(url, auth_id),
+            endpoint_class(url),
+            orjson.dumps(body),
+            etag,
+            last_modified,
+            time.time() + max(0.0, ttl),
+        )
+        self.stores += 1
+
+    def _refresh(self, key: str, expires_at: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, stored_at = ? WHERE key = ?",
+                (expires_at, time.time(), key),
+            )
+            self._connection.commit()
+
+    async def refresh(self, url: str, entry: CachedResponse) -> None:
+        """Extend a stale entry after the site answered 304 Not Modified."""
+        self.revalidated += 1
+        expires_at = time.time() + max(0.0, self.get_ttl(url))
+        entry.expires_at = expires_at
+        await asyncio.to_thread(self._refresh, entry.key, expires_at)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stores": self.stores,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,30 +1,69 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from ultima_scraper_api.apis.api_helper import handle_error_details
+from ultima_scraper_api.helpers.json_helper import read_json
 
 if TYPE_CHECKING:
     from ultima_scraper_api.managers.session_manager import AuthedSession
 
 
+logger = logging.getLogger(__name__)
+
 TAPI = TypeVar("TAPI")
 TCC = TypeVar("TCC")
 
+# Seconds before retrying a page, doubled per attempt (as in AuthedSession._request)
+RETRY_BACKOFF = 1.0
+MAX_RETRY_BACKOFF = 30.0
+
 # Progress callback type: (completed_pages, total_pages, items_so_far) -> Awaitable[None]
 type ScrapeProgressCallback = Callable[[int, int, int], Awaitable[None]]
 
 
+@dataclass
+class ScrapeFailure:
+    """A page that could not be scraped."""
+
+    url: str
+    status: int | None
+    attempts: int
+    error: str
+
+
+@dataclass
+class ScrapeReport:
+    """Outcome of a bulk scrape, failed pages can be retried with failed_urls."""
+
+    pages: int = 0
+    items: int = 0
+    failures: list[ScrapeFailure] = field(default_factory=list)
+
+    @property
+    def failed_urls(self) -> list[str]:
+        return [failure.url for failure in self.failures]
+
+
 class ScrapeManager(Generic[TAPI, TCC]):
     def __init__(self, authed: TAPI) -> None:
         self.auth_session: AuthedSession = authed.auth_session  # type: ignore
-        self.scraped: TCC = authed.api.CategorizedContent()  # type: ignore
+        self.scraped: TCC = authed.api.CategorizedContent(  # type: ignore
+            authed.api.config.settings.registry  # type: ignore
+        )
         self.handle_errors = True
 
     async def bulk_scrape(
         self,
         urls: list[str],
         on_progress: ScrapeProgressCallback | None = None,
+        window: int | None = None,
+        retries: int = 0,
+        report: ScrapeReport | None = None,
     ) -> list[Any]:
         """Scrape multiple URLs in parallel with optional progress callback.
 
@@ -32,56 +71,132 @@ class ScrapeManager(Generic[TAPI, TCC]):
             urls: List of URLs to scrape.
             on_progress: Optional async callback called after each page completes.
                          Signature: (completed_pages, total_pages, items_so_far) -> Awaitable[None]
+            window: Maximum pages in flight (defaults to the session's max_threads).
+            retries: Extra attempts for a page whose scrape raised, with
+                exponential backoff.
+            report: Optional report filled with page/item counts and failed pages.
 
         Returns:
-            Flattened list of all scraped items.
+            Flattened list of all scraped items, in page order.
         """
         total = len(urls)
-        if total == 0:
-            return []
-
-        # Create tasks for all URLs
-        tasks = [asyncio.create_task(self.scrape(url)) for url in urls]
-
+        report = report if report is not None else ScrapeReport()
         results: list[Any] = []
-        completed = 0
-        items_count = 0
-
-        # Process as each task completes (maintains parallelism)
-        for coro in asyncio.as_completed(tasks):
-            try:
-                page_result = await coro
-                if page_result and not isinstance(page_result, BaseException):
+        async with aclosing(
+            self.iter_scrape(urls, window=window, retries=retries, report=report)
+        ) as pages:
+            async for _url, page_result in pages:
+                if page_result:
                     if isinstance(page_result, list):
                         results.extend(page_result)
-                        items_count += len(page_result)
                     else:
                         results.append(page_result)
-                        items_count += 1
-            except Exception:
-                # Silently skip failed requests (matches original behavior)
-                pass
 
-            completed += 1
+                # Call progress callback if provided (caller handles event publishing)
+                if on_progress:
+                    await on_progress(report.pages, total, report.items)
+        if report.failures:
+            logger.warning("%d/%d pages failed to scrape", len(report.failures), total)
+        return results
 
-            # Call progress callback if provided (caller handles event publishing)
-            if on_progress:
-                await on_progress(completed, total, items_count)
+    async def iter_scrape(
+        self,
+        urls: list[str],
+        window: int | None = None,
+        retries: int = 0,
+        report: ScrapeReport | None = None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Scrape URLs with a bounded number of pages in flight.
 
-        return results
+        Pages are yielded in the order of ``urls`` as (url, result). A failed
+        page, one that raised or that the site answered with an error, is
+        recorded in ``report`` and yielded with a None result so the caller can
+        keep count.
 
-    async def scrape(self, url: str):
+        Args:
+            urls: List of URLs to scrape.
+            window: Maximum pages in flight (defaults to the session's max_threads).
+            retries: Extra attempts for a page whose scrape raised, with
+                exponential backoff. Error responses aren't retried.
+            report: Optional report filled with page/item counts and failed pages.
+        """
+        if window is None:
+            window = self.auth_session.get_session_manager().max_threads
+        window = max(1, window)
+        report = report if report is not None else ScrapeReport()
+        pending = iter(urls)
+        in_flight: deque[tuple[str, asyncio.Task[Any]]] = deque()
+
+        def fill_window() -> None:
+            while len(in_flight) < window:
+                url = next(pending, None)
+                if url is None:
+                    return
+                task = asyncio.create_task(self._scrape_page(url, retries, report))
+                in_flight.append((url, task))
+
+        fill_window()
+        try:
+            while in_flight:
+                url, task = in_flight.popleft()
+                page_result = await task
+                fill_window()
+                report.pages += 1
+                if isinstance(page_result, list):
+                    report.items += len(page_result)
+                elif page_result:
+                    report.items += 1
+                yield url, page_result
+        finally:
+            for _url, task in in_flight:
+                task.cancel()
+
+    async def _scrape_page(self, url: str, retries: int, report: ScrapeReport):
+        attempts = 0
+        backoff_seconds = RETRY_BACKOFF
+        while True:
+            attempts += 1
+            try:
+                status, json_res = await self._fetch(url)
+            except Exception as exc:
+                if attempts <= retries:
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, MAX_RETRY_BACKOFF)
+                    continue
+                failure = ScrapeFailure(
+                    url=url,
+                    status=getattr(exc, "status", None),
+                    attempts=attempts,
+                    error=str(exc) or type(exc).__name__,
+                )
+            else:
+                if not (isinstance(json_res, dict) and "error" in json_res):
+                    return json_res
+                # The session already retried transient statuses, this is the
+                # site's answer
+                error = json_res["error"]
+                if isinstance(error, dict):
+                    error = error.get("message") or error
+                failure = ScrapeFailure(
+                    url=url, status=status, attempts=attempts, error=str(error)
+                )
+            report.failures.append(failure)
+            return None
+
+    async def _fetch(self, url: str) -> tuple[int, Any]:
+        """Return the status and decoded JSON of a page, a 404 is an empty page."""
         auth_session = self.auth_session
-        async with auth_session.semaphore:
-            result = await auth_session.request(url)
-            assert result
-            async with result as response:
-                if result.status != 404:
-                    json_res = await response.json()
-                    final_result = await self.handle_error(url, json_res)
-                else:
-                    final_result = []
-                return final_result
+        # Concurrency is bounded per host inside AuthedSession.request
+        result = await auth_session.request(url)
+        assert result
+        async with result as response:
+            if result.status == 404:
+                return result.status, []
+            return result.status, await read_json(response)
+
+    async def scrape(self, url: str):
+        _status, json_res = await self._fetch(url)
+        return await self.handle_error(url, json_res)
 
     async def handle_error(self, url: str, json_res: dict[str, Any]):
         import ultima_scraper_api.apis.fansly.classes as fansly_classes
@@ -14,9 +14,7 @@ from urllib.parse import urlparse
 logger = logging.getLogger(__name__)
 
 import aiohttp
-import python_socks
-import requests
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import BaseConnector, ClientResponse, ClientSession
 from aiohttp.client_exceptions import (
     ClientOSError,
     ClientPayloadError,
@@ -25,11 +23,31 @@ from aiohttp.client_exceptions import (
     ServerDisconnectedError,
     ServerTimeoutError,
 )
-from aiohttp_socks import ProxyConnectionError, ProxyConnector, ProxyInfo
+from aiohttp_socks import ProxyConnectionError, ProxyInfo
 
 import ultima_scraper_api
 import ultima_scraper_api.apis.api_helper as api_helper
-from ultima_scraper_api.config import Proxy
+from ultima_scraper_api.config import (
+    Concurrency,
+    Metrics,
+    Proxy,
+    ProxyPool,
+    RateLimit,
+    ResponseCache,
+)
+from ultima_scraper_api.helpers.json_helper import read_json
+from ultima_scraper_api.managers.coalescing_manager import CoalescingManager
+from ultima_scraper_api.managers.concurrency_manager import (
+    ConcurrencyManager,
+    RequestOutcome,
+)
+from ultima_scraper_api.managers.metrics_manager import RequestMetrics
+from ultima_scraper_api.managers.proxy_manager import ProxyEndpoint, ProxyManager
+from ultima_scraper_api.managers.rate_limit_manager import RateLimitManager
+from ultima_scraper_api.managers.response_cache_manager import (
+    ResponseCacheManager,
+    normalize_url,
+)
 
 if TYPE_CHECKING:
     auth_types = ultima_scraper_api.auth_types
@@ -44,6 +62,12 @@ EXCEPTION_TEMPLATE = (
 )
 
 
+def _classify_exception(error: BaseException) -> RequestOutcome:
+    if isinstance(error, (ServerTimeoutError, asyncio.TimeoutError)):
+        return RequestOutcome.OVERLOAD
+    return RequestOutcome.NEUTRAL
+
+
 def _format_exception_message(error: BaseException) -> str:
     detail = str(error).strip()
     if detail:
@@ -51,43 +75,6 @@ def _format_exception_message(error: BaseException) -> str:
     return type(error).__name__
 
 
-class ProxyManager:
-    def __init__(self) -> None:
-        self.proxies: list[ProxyInfo] = []
-        self.current_proxy_index = 0
-
-    def test_proxies(self, proxies: list[Proxy] = []):
-        final_proxies: list[Proxy] = []
-
-        session = requests.Session()
-        for proxy in proxies:
-            url = "https://checkip.amazonaws.com"
-            temp_proxies = {"https": proxy.url}
-            try:
-                final_proxies.append(proxy)
-                return final_proxies
-                resp = session.get(url, proxies=temp_proxies)
-                ip = resp.text
-                ip = ip.strip()
-                final_proxies.append(proxy)
-            except Exception as _e:
-                continue
-        return final_proxies
-
-    def create_connection(self, proxy: ProxyInfo, ssl: ssl.SSLContext):
-        return ProxyConnector(**proxy._asdict(), ssl=ssl)  # type: ignore
-
-    def get_current_proxy(self):
-        return self.proxies[self.current_proxy_index]
-
-    def add_proxies(self, proxies: list[Proxy] = []):
-        for proxy in proxies:
-            self._add_proxy(proxy)
-
-    def _add_proxy(self, proxy: Proxy):
-        self.proxies.append(ProxyInfo(*python_socks.parse_proxy_url(proxy.url)))  # type: ignore
-
-
 class AuthedSession:
     def __init__(
         self,
@@ -99,7 +86,12 @@ class AuthedSession:
         self.semaphore = session_manager.semaphore
         self.auth = auth
         self.headers = headers
-        self.active_session = self.create_client_session()
+        self.coalescing_manager = CoalescingManager()
+        # One client session per pool proxy ("" is direct), reused when switching
+        self.client_sessions: dict[str, ClientSession] = {}
+        self.proxy_pinned = False
+        self.proxy = self.get_proxy_manager().assign(self)
+        self.active_session = self.get_client_session(self.proxy)
 
     def get_session_manager(self):
         return self.session_manager
@@ -123,44 +115,131 @@ class AuthedSession:
         return final_cookies
 
     def create_client_session(
-        self, test_proxies: bool = False, proxy: ProxyInfo | None = None
+        self,
+        proxy: ProxyInfo | None = None,
+        connector: BaseConnector | None = None,
     ) -> ClientSession:
-        limit = 0
+        """Create a client session.
+
+        Args:
+            proxy: Proxy the session gets its own connector for
+            connector: Shared connector, left open when the session closes
+        """
         session_manager = self.get_session_manager()
-        proxy_manager = self.get_proxy_manager()
-        raw_proxies = session_manager.proxies
-        if test_proxies and raw_proxies:
-            proxies = proxy_manager.test_proxies(raw_proxies)
-            if not proxies:
-                raise Exception("Unable to create session due to invalid proxies")
-            proxy_manager.add_proxies(proxies)
-            proxy = proxy_manager.get_current_proxy()
-        ssl_context = ssl.create_default_context()
-        ssl_context.post_handshake_auth = True
-        connector = (
-            self.session_manager.proxy_manager.create_connection(proxy, ssl=ssl_context)
-            if proxy
-            else aiohttp.TCPConnector(limit=limit, ssl=ssl_context)
-        )
+        connector_owner = connector is None
+        if connector is None:
+            ssl_context = ssl.create_default_context()
+            ssl_context.post_handshake_auth = True
+            connector = (
+                session_manager.proxy_manager.create_connection(proxy, ssl=ssl_context)
+                if proxy
+                else aiohttp.TCPConnector(limit=0, ssl=ssl_context)
+            )
         final_cookies = self.get_cookies()
         timeout = aiohttp.ClientTimeout(
             total=None, connect=10, sock_connect=10, sock_read=60
         )
+        trace_config = session_manager.metrics.trace_config()
         client_session = ClientSession(
-            connector=connector, cookies=final_cookies, timeout=timeout
+            connector=connector,
+            connector_owner=connector_owner,
+            cookies=final_cookies,
+            timeout=timeout,
+            trace_configs=[trace_config] if trace_config else None,
         )
         return client_session
 
-    async def proxy_switcher(self):
-        proxy_manager = self.get_proxy_manager()
-        if proxy_manager.proxies:
-            proxy_manager.current_proxy_index = (
-                proxy_manager.current_proxy_index + 1
-            ) % len(proxy_manager.proxies)
-            await self.active_session.close()
-            self.active_session = self.create_client_session(
-                False, proxy_manager.get_current_proxy()
+    def get_client_session(self, proxy: ProxyEndpoint | None) -> ClientSession:
+        key = proxy.url if proxy else ""
+        client_session = self.client_sessions.get(key)
+        if client_session is None or client_session.closed:
+            client_session = self.create_client_session(
+                connector=proxy.get_connector() if proxy else None
             )
+            self.client_sessions[key] = client_session
+        return client_session
+
+    def use_proxy(self, proxy: ProxyInfo) -> None:
+        """Send every request through ``proxy`` instead of the proxy pool."""
+        self.proxy_pinned = True
+        self.proxy = None
+        self.active_session = self.create_client_session(proxy)
+
+    def select_proxy(self) -> ProxyEndpoint | None:
+        """Point ``active_session`` at the proxy the pool assigns to this auth."""
+        if self.proxy_pinned:
+            return None
+        proxy = self.get_proxy_manager().assign(self)
+        if proxy is not self.proxy:
+            self.proxy = proxy
+            self.active_session = self.get_client_session(proxy)
+        return proxy
+
+    async def proxy_switcher(self):
+        """Move to the healthiest other proxy of the pool.
+
+        The previous proxy's session stays open for requests still using it.
+        """
+        if self.proxy_pinned:
+            return
+        self.proxy = self.get_proxy_manager().reassign(self)
+        self.active_session = self.get_client_session(self.proxy)
+
+    async def close(self) -> None:
+        for client_session in {self.active_session, *self.client_sessions.values()}:
+            await client_session.close()
+        self.client_sessions.clear()
+
+    def get_rate_limit_scope(self) -> tuple[str, str]:
+        auth_details = getattr(self.auth, "auth_details", None)
+        auth_id = getattr(auth_details, "id", None)
+        return self.auth.api.site_name, str(auth_id) if auth_id else f"{id(self):x}"
+
+    async def _send_request(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, Any],
+        data: Any = {},
+        json: Any = {},
+    ) -> ClientResponse:
+        match method.upper():
+            case "HEAD":
+                result = await self.active_session.head(url, headers=headers)
+            case "GET":
+                result = await self.active_session.get(url, headers=headers)
+            case "POST":
+                if data:
+                    result = await self.active_session.post(
+                        url, headers=headers, data=data
+                    )
+                else:
+                    result = await self.active_session.post(
+                        url, headers=headers, json=json
+                    )
+            case "PATCH":
+                if data:
+                    result = await self.active_session.patch(
+                        url, headers=headers, data=data
+                    )
+                else:
+                    result = await self.active_session.patch(
+                        url, headers=headers, json=json
+                    )
+            case "DELETE":
+                result = await self.active_session.delete(url, headers=headers)
+            case "PUT":
+                if data:
+                    result = await self.active_session.put(
+                        url, headers=headers, data=data
+                    )
+                else:
+                    result = await self.active_session.put(
+                        url, headers=headers, json=json
+                    )
+            case _:
+                raise Exception("Method not found")
+        return result
 
     async def request(
         self,
@@ -178,20 +257,55 @@ class AuthedSession:
 
         Performs an HTTP request with support for rate limiting, proxy rotation, and
         comprehensive error recovery. The method retries transient failures up to
-        ``session_manager.max_attempts`` and handles rate limiting by pausing
-        subsequent requests.
+        ``session_manager.max_attempts`` and handles rate limiting by pausing the
+        token bucket of this (site, auth, endpoint class) for as long as the
+        server asks via ``Retry-After``.
+
+        Every attempt holds a slot from the per-host adaptive concurrency limiter
+        (``session_manager.concurrency_manager``), so bulk helpers and direct
+        callers alike are bounded by what the upstream host currently tolerates.
         """
+        metrics = self.get_session_manager().metrics
+        metrics.start()
+        started_at = time.monotonic()
+        try:
+            return await self._request(
+                url,
+                method,
+                data=data,
+                json=json,
+                premade_settings=premade_settings,
+                custom_cookies=custom_cookies,
+                custom_headers=custom_headers,
+                range_header=range_header,
+            )
+        finally:
+            metrics.observe(url, "total", time.monotonic() - started_at)
+
+    async def _request(
+        self,
+        url: str,
+        method: Literal["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"] = "GET",
+        data: Any = {},
+        json: Any = {},
+        premade_settings: str = "json",
+        custom_cookies: str = "",
+        custom_headers: dict[str, Any] = {},
+        range_header: dict[str, Any] | None = None,
+    ) -> ClientResponse | None:
         session_manager = self.get_session_manager()
         retries = 0
         max_attempts = max(1, int(getattr(session_manager, "max_attempts", 10) or 1))
         backoff_seconds = 1.0
         max_backoff_seconds = 30.0
+        metrics = session_manager.metrics
+        site_name, auth_id = self.get_rate_limit_scope()
         while True:
-            if session_manager.rate_limit_check:
-                if retries == 0:
-                    logger.debug("Request paused by rate limiter: %s %s", method, url)
-                await asyncio.sleep(5)
-                continue
+            waiting_since = time.monotonic()
+            bucket = await session_manager.rate_limit_manager.acquire(
+                site_name, auth_id, url
+            )
+            metrics.record_rate_limit_wait(auth_id, time.monotonic() - waiting_since)
             headers = {}
             if premade_settings == "json":
                 headers = self.auth.create_request_headers(
@@ -210,218 +324,226 @@ class AuthedSession:
             if custom_headers:
                 headers.update(custom_headers)
 
-            result = None
+            waiting_since = time.monotonic()
+            slot = await session_manager.concurrency_manager.acquire(url)
+            metrics.observe(url, "queued", time.monotonic() - waiting_since)
             try:
-                match method.upper():
-                    case "HEAD":
-                        result = await self.active_session.head(url, headers=headers)
-                    case "GET":
-                        result = await self.active_session.get(url, headers=headers)
-                    case "POST":
-                        if data:
-                            result = await self.active_session.post(
-                                url, headers=headers, data=data
-                            )
-                        else:
-                            result = await self.active_session.post(
-                                url, headers=headers, json=json
-                            )
-                    case "PATCH":
-                        if data:
-                            result = await self.active_session.patch(
-                                url, headers=headers, data=data
-                            )
-                        else:
-                            result = await self.active_session.patch(
-                                url, headers=headers, json=json
-                            )
-                    case "DELETE":
-                        result = await self.active_session.delete(url, headers=headers)
-                    case "PUT":
-                        if data:
-                            result = await self.active_session.put(
-                                url, headers=headers, data=data
-                            )
-                        else:
-                            result = await self.active_session.put(
-                                url, headers=headers, json=json
-                            )
-                    case _:
-                        raise Exception("Method not found")
-            except ServerTimeoutError as _e:
-                retries += 1
-                if retries >= max_attempts:
-                    logger.error(
-                        "Request timeout after %d/%d attempts: %s %s — %s",
+                result = None
+                proxy = self.select_proxy()
+                try:
+                    result = await self._send_request(
+                        url, method, headers, data=data, json=json
+                    )
+                except ServerTimeoutError as _e:
+                    slot.release(RequestOutcome.OVERLOAD)
+                    if proxy:
+                        proxy.record_failure()
+                    retries += 1
+                    if retries >= max_attempts:
+                        logger.error(
+                            "Request timeout after %d/%d attempts: %s %s — %s",
+                            retries,
+                            max_attempts,
+                            method,
+                            url,
+                            _format_exception_message(_e),
+                        )
+                        raise
+                    logger.warning(
+                        "Request timeout (attempt %d/%d): %s %s — %s; retrying in %.1fs",
                         retries,
                         max_attempts,
                         method,
                         url,
                         _format_exception_message(_e),
+                        backoff_seconds,
                     )
-                    raise
-                logger.warning(
-                    "Request timeout (attempt %d/%d): %s %s — %s; retrying in %.1fs",
-                    retries,
-                    max_attempts,
-                    method,
-                    url,
-                    _format_exception_message(_e),
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
-                continue
-            except EXCEPTION_TEMPLATE as _e:
-                retries += 1
-                if retries >= max_attempts:
-                    logger.error(
-                        "Transient error after %d/%d attempts: %s %s — %s",
+                    metrics.record_retry(url, backoff_seconds)
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
+                    continue
+                except EXCEPTION_TEMPLATE as _e:
+                    slot.release(_classify_exception(_e))
+                    if proxy:
+                        proxy.record_failure()
+                    retries += 1
+                    if retries >= max_attempts:
+                        logger.error(
+                            "Transient error after %d/%d attempts: %s %s — %s",
+                            retries,
+                            max_attempts,
+                            method,
+                            url,
+                            _format_exception_message(_e),
+                        )
+                        raise
+                    logger.warning(
+                        "Transient error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
                         retries,
                         max_attempts,
                         method,
                         url,
                         _format_exception_message(_e),
+                        backoff_seconds,
                     )
-                    raise
-                logger.warning(
-                    "Transient error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
-                    retries,
-                    max_attempts,
-                    method,
-                    url,
-                    _format_exception_message(_e),
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
-                continue
-            except Exception as _e:
-                retries += 1
-                if retries >= max_attempts:
-                    logger.error(
-                        "Unexpected error after %d/%d attempts: %s %s — %s",
+                    metrics.record_retry(url, backoff_seconds)
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
+                    continue
+                except Exception as _e:
+                    slot.release()
+                    retries += 1
+                    if retries >= max_attempts:
+                        logger.error(
+                            "Unexpected error after %d/%d attempts: %s %s — %s",
+                            retries,
+                            max_attempts,
+                            method,
+                            url,
+                            _format_exception_message(_e),
+                        )
+                        raise
+                    logger.warning(
+                        "Unexpected error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
                         retries,
                         max_attempts,
                         method,
                         url,
                         _format_exception_message(_e),
+                        backoff_seconds,
                     )
-                    raise
-                logger.warning(
-                    "Unexpected error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
-                    retries,
-                    max_attempts,
-                    method,
-                    url,
-                    _format_exception_message(_e),
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
-                continue
-            try:
-                assert result
-                if (
-                    result.content
-                    and result.content_type
-                    and "application/json" in result.content_type
-                ):
-                    await result.json()
-                result.raise_for_status()
-                return result
-            except EXCEPTION_TEMPLATE as _e:
-                retries += 1
-                if retries >= max_attempts:
-                    logger.error(
-                        "Response processing error after %d/%d attempts: %s %s — %s",
+                    metrics.record_retry(url, backoff_seconds)
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
+                    continue
+                try:
+                    assert result
+                    if (
+                        result.content
+                        and result.content_type
+                        and "application/json" in result.content_type
+                    ):
+                        # Decoded once here, json_request reuses the value
+                        await read_json(result)
+                    result.raise_for_status()
+                    if proxy:
+                        proxy.record_success(time.monotonic() - slot.started_at)
+                    slot.release(RequestOutcome.SUCCESS)
+                    bucket.observe(result.headers)
+                    return result
+                except EXCEPTION_TEMPLATE as _e:
+                    slot.release(_classify_exception(_e))
+                    if proxy:
+                        proxy.record_failure()
+                    retries += 1
+                    if retries >= max_attempts:
+                        logger.error(
+                            "Response processing error after %d/%d attempts: %s %s — %s",
+                            retries,
+                            max_attempts,
+                            method,
+                            url,
+                            _format_exception_message(_e),
+                        )
+                        raise
+                    logger.warning(
+                        "Response processing error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
                         retries,
                         max_attempts,
                         method,
                         url,
                         _format_exception_message(_e),
+                        backoff_seconds,
                     )
-                    raise
-                logger.warning(
-                    "Response processing error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
-                    retries,
-                    max_attempts,
-                    method,
-                    url,
-                    _format_exception_message(_e),
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
-                continue
-            except ClientResponseError as _e:
-                match _e.status:
-                    case 400 | 401 | 403 | 404:
-                        assert result
-                        return result
-                    case 416:
-                        return None
-                    case 429:
-                        logger.warning(
-                            "HTTP 429 rate-limited: %s %s",
-                            method,
-                            url,
-                        )
-                        if session_manager.is_rate_limited is None:
-                            session_manager.rate_limit_check = True
-                        continue
-                    case 500 | 502 | 503 | 504:
-                        retries += 1
-                        if retries >= max_attempts:
-                            logger.error(
-                                "Server error %d after %d/%d attempts: %s %s",
+                    metrics.record_retry(url, backoff_seconds)
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
+                    continue
+                except ClientResponseError as _e:
+                    slot.release(
+                        RequestOutcome.OVERLOAD
+                        if _e.status == 429 or _e.status >= 500
+                        else RequestOutcome.NEUTRAL
+                    )
+                    match _e.status:
+                        case 400 | 401 | 403 | 404:
+                            assert result
+                            return result
+                        case 416:
+                            return None
+                        case 429:
+                            assert result
+                            pause_seconds = bucket.penalize(result.headers)
+                            metrics.record_throttle(auth_id)
+                            if proxy:
+                                proxy.record_throttle()
+                            logger.warning(
+                                "HTTP 429 rate-limited: %s %s — pausing %s for %.1fs",
+                                method,
+                                url,
+                                "/".join(bucket.key),
+                                pause_seconds,
+                            )
+                            continue
+                        case 500 | 502 | 503 | 504:
+                            retries += 1
+                            if retries >= max_attempts:
+                                logger.error(
+                                    "Server error %d after %d/%d attempts: %s %s",
+                                    _e.status,
+                                    retries,
+                                    max_attempts,
+                                    method,
+                                    url,
+                                )
+                                raise
+                            logger.warning(
+                                "Server error %d (attempt %d/%d): %s %s — retrying in %.1fs",
                                 _e.status,
                                 retries,
                                 max_attempts,
                                 method,
                                 url,
+                                backoff_seconds,
+                            )
+                            metrics.record_retry(url, backoff_seconds)
+                            await asyncio.sleep(backoff_seconds)
+                            backoff_seconds = min(
+                                backoff_seconds * 2, max_backoff_seconds
                             )
-                            raise
-                        logger.warning(
-                            "Server error %d (attempt %d/%d): %s %s — retrying in %.1fs",
-                            _e.status,
+                            continue
+                        case _:
+                            raise Exception(
+                                f"Infinite Loop Detected for unhandled status error: {_e.status}"
+                            )
+                except Exception as _e:
+                    slot.release()
+                    retries += 1
+                    if retries >= max_attempts:
+                        logger.error(
+                            "Unhandled response error after %d/%d attempts: %s %s — %s",
                             retries,
                             max_attempts,
                             method,
                             url,
-                            backoff_seconds,
-                        )
-                        await asyncio.sleep(backoff_seconds)
-                        backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
-                        continue
-                    case _:
-                        raise Exception(
-                            f"Infinite Loop Detected for unhandled status error: {_e.status}"
+                            _format_exception_message(_e),
                         )
-            except Exception as _e:
-                retries += 1
-                if retries >= max_attempts:
-                    logger.error(
-                        "Unhandled response error after %d/%d attempts: %s %s — %s",
+                        raise
+                    logger.warning(
+                        "Unhandled response error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
                         retries,
                         max_attempts,
                         method,
                         url,
                         _format_exception_message(_e),
+                        backoff_seconds,
                     )
-                    raise
-                logger.warning(
-                    "Unhandled response error (attempt %d/%d): %s %s — %s; retrying in %.1fs",
-                    retries,
-                    max_attempts,
-                    method,
-                    url,
-                    _format_exception_message(_e),
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
-                continue
+                    metrics.record_retry(url, backoff_seconds)
+                    await asyncio.sleep(backoff_seconds)
+                    backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
+                    continue
+            finally:
+                slot.release()
 
     async def bulk_requests(self, urls: list[str]) -> list[ClientResponse | None]:
         return await asyncio.gather(*[self.request(url) for url in urls])
@@ -432,8 +554,36 @@ class AuthedSession:
         method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET",
         payload: dict[str, Any] = {},
     ) -> dict[str, Any]:
+        if method == "GET":
+            # Identical GETs already in flight share a single request
+            return await self.coalescing_manager.run(
+                (method, normalize_url(url)),
+                lambda: self._json_request(url, method, payload),
+            )
+        return await self._json_request(url, method, payload)
+
+    async def _json_request(
+        self,
+        url: str,
+        method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"],
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        response_cache = self.get_session_manager().response_cache
+        cache_scope = "|".join(self.get_rate_limit_scope())
+        cached = None
+        validator_headers: dict[str, str] = {}
+        if response_cache and method == "GET":
+            cached = await response_cache.get(url, cache_scope)
+            if cached:
+                if cached.is_fresh():
+                    return cached.body
+                validator_headers = cached.validator_headers()
+        else:
+            response_cache = None
         try:
-            response = await self.request(url, method, data=payload)
+            response = await self.request(
+                url, method, data=payload, custom_headers=validator_headers
+            )
         except Exception as exc:
             return {
                 "error": {
@@ -444,11 +594,19 @@ class AuthedSession:
         if not response:
             return {}
 
+        if response.status == 304 and response_cache and cached:
+            await response_cache.refresh(url, cached)
+            return cached.body
         if response.status == 200:
             try:
-                return await response.json()
+                json_resp = await read_json(response)
             except EXCEPTION_TEMPLATE:
                 return {}
+            if response_cache and not (
+                isinstance(json_resp, dict) and "error" in json_resp
+            ):
+                await response_cache.put(url, cache_scope, json_resp, response.headers)
+            return json_resp
         return {
             "error": {
                 "code": response.status,
@@ -479,25 +637,34 @@ class SessionManager:
         proxies: list[Proxy] = [],
         max_threads: int = -1,
         use_cookies: bool = True,
+        concurrency: Concurrency = Concurrency(),
+        rate_limit: RateLimit = RateLimit(),
+        response_cache: ResponseCache = ResponseCache(),
+        metrics: Metrics = Metrics(),
+        proxy_pool: ProxyPool = ProxyPool(),
+        proxy_fallback: bool = False,
     ) -> None:
         from ultima_scraper_api.apis.onlyfans.onlyfans import OnlyFansAPI
 
         max_threads = api_helper.calculate_max_threads(max_threads)
         self.semaphore = asyncio.BoundedSemaphore(max_threads)
         self.max_threads = max_threads
+        self.concurrency_manager = ConcurrencyManager(concurrency, max_threads)
+        self.rate_limit_manager = RateLimitManager(rate_limit)
+        self.response_cache = (
+            ResponseCacheManager(response_cache) if response_cache.enabled else None
+        )
+        self.metrics = RequestMetrics(api.site_name, metrics)
         self.max_attempts = 10
         self.kill = False
         self.authed_sessions: list[AuthedSession] = []
-        self.proxy_manager = ProxyManager()
+        self.proxy_manager = ProxyManager(proxy_pool, proxy_fallback)
+        self.proxy_manager.add_proxies(proxies)
 
         self.use_cookies: bool = use_cookies
         self.request_count = 0
         self.proxies = proxies
         self.lock = self.lock = asyncio.Lock()
-        self.rate_limit_check = False
-        self.is_rate_limited = None
-        self.time2sleep = 0
-        self.rate_limit_checker_active = False
 
     def created_authed_session(
         self, authenticator: ultima_scraper_api.authenticator_types
@@ -508,54 +675,3 @@ class SessionManager:
         proxies = self.proxies
         proxy = self.proxies[randint(0, len(proxies) - 1)] if proxies else ""
         return proxy
-
-    async def check_rate_limit(self):
-        if self.rate_limit_checker_active:
-            return
-        self.rate_limit_checker_active = True
-        logger.info("Rate limit checker started")
-        while True:
-            rate_limit_count = 1
-            async with self.lock:
-                while self.rate_limit_check:
-                    import requests
-
-                    try:
-                        url = "https://onlyfans.com/api2/v2/init"
-                        result = requests.get(url)
-                        if result.status_code == 429:
-                            result.raise_for_status()
-                        logger.info(
-                            "Rate limit check passed (status=%d, after %d checks) — resuming requests",
-                            result.status_code,
-                            rate_limit_count,
-                        )
-                        self.rate_limit_check = False
-                        self.is_rate_limited = None
-                        break
-                    except EXCEPTION_TEMPLATE as _e:
-                        logger.warning(
-                            "Rate limit checker transient error (check %d): %s: %s",
-                            rate_limit_count,
-                            type(_e).__name__,
-                            _e,
-                        )
-                        continue
-                    except requests.HTTPError as _e:
-                        if _e.response and _e.response.status_code == 429:
-                            self.is_rate_limited = True
-                            rate_limit_count += 1
-                            logger.warning(
-                                "Rate limit checker: still rate-limited (429), check %d, sleeping %ds",
-                                rate_limit_count,
-                                self.time2sleep,
-                            )
-                    except Exception as _e:
-                        logger.warning(
-                            "Rate limit checker unexpected error (check %d): %s: %s",
-                            rate_limit_count,
-                            type(_e).__name__,
-                            _e,
-                        )
-                    await asyncio.sleep(self.time2sleep)
-                await asyncio.sleep(5)
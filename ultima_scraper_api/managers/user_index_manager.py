@@ -0,0 +1,35 @@
+"""Case-insensitive username and alias lookups.
+
+Auths and APIs resolve users by username for every linked user, subscription
+and identifier they're given. ``UserIndex`` maps lowercased usernames and
+aliases to user ids so those lookups don't scan every known user.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+class UserIndex:
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: dict[int, set[str]] = {}
+
+    def add(self, user_id: int, names: Iterable[str]) -> None:
+        """Index a user under its names, replacing the names it had before."""
+        self.remove(user_id)
+        keys = {name.lower() for name in names if name}
+        for key in keys:
+            self._ids[key] = user_id
+        self._names[user_id] = keys
+
+    def remove(self, user_id: int) -> None:
+        for key in self._names.pop(user_id, ()):
+            if self._ids.get(key) == user_id:
+                del self._ids[key]
+
+    def get(self, name: str) -> int | None:
+        return self._ids.get(name.lower())
+
+    def __len__(self) -> int:
+        return len(self._names)
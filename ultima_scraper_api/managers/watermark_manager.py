@@ -0,0 +1,195 @@
+"""High-water marks for incremental scraping.
+
+A watermark records the newest item seen per (site, auth, user, content type)
+so the next run can stop as soon as it reaches content it already has. Two
+backends are available: a local SQLite database and Redis (through the global
+``RedisManager``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ultima_scraper_api.config import Watermarks
+    from ultima_scraper_api.managers.redis.connection import RedisManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class Watermark:
+    def __init__(
+        self, content_id: int | None = None, timestamp: float | None = None
+    ) -> None:
+        """Newest item seen.
+
+        Args:
+            content_id: Highest content id, for id-ordered content like messages
+            timestamp: Newest publish time (epoch seconds), for date-ordered content
+        """
+        self.content_id = content_id
+        self.timestamp = timestamp
+
+    def merge(self, other: Watermark) -> Watermark:
+        """Return the newer of both marks, field by field."""
+
+        def newest(a: Any, b: Any) -> Any:
+            if a is None:
+                return b
+            if b is None:
+                return a
+            return max(a, b)
+
+        return Watermark(
+            newest(self.content_id, other.content_id),
+            newest(self.timestamp, other.timestamp),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"content_id": self.content_id, "timestamp": self.timestamp}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Watermark:
+        return cls(data.get("content_id"), data.get("timestamp"))
+
+
+class WatermarkStore(ABC):
+    """Persists watermarks for one site."""
+
+    def __init__(self, site_name: str) -> None:
+        self.site_name = site_name
+
+    @abstractmethod
+    async def get(
+        self, auth_id: int | str, user_id: int | str, content_type: str
+    ) -> Watermark | None:
+        """Return the stored watermark, or None on the first run."""
+
+    @abstractmethod
+    async def set(
+        self,
+        auth_id: int | str,
+        user_id: int | str,
+        content_type: str,
+        watermark: Watermark,
+    ) -> None:
+        """Replace the stored watermark."""
+
+    async def advance(
+        self,
+        auth_id: int | str,
+        user_id: int | str,
+        content_type: str,
+        watermark: Watermark,
+    ) -> Watermark:
+        """Move the stored watermark forward, never backwards.
+
+        Returns:
+            The watermark now stored
+        """
+        current = await self.get(auth_id, user_id, content_type)
+        if current:
+            watermark = current.merge(watermark)
+        await self.set(auth_id, user_id, content_type, watermark)
+        return watermark
+
+
+class SQLiteWatermarkStore(WatermarkStore):
+    def __init__(self, site_name: str, path: Path) -> None:
+        super().__init__(site_name)
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                " site TEXT, auth_id TEXT, user_id TEXT, content_type TEXT,"
+                " content_id INTEGER, timestamp REAL,"
+                " PRIMARY KEY (site, auth_id, user_id, content_type))"
+            )
+            self._connection.commit()
+
+    def _get(self, key: tuple[str, str, str, str]) -> Watermark | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content_id, timestamp FROM watermarks WHERE site = ?"
+                " AND auth_id = ? AND user_id = ? AND content_type = ?",
+                key,
+            ).fetchone()
+        return Watermark(*row) if row else None
+
+    def _set(self, key: tuple[str, str, str, str], watermark: Watermark) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, watermark.content_id, watermark.timestamp),
+            )
+            self._connection.commit()
+
+    async def get(
+        self, auth_id: int | str, user_id: int | str, content_type: str
+    ) -> Watermark | None:
+        key = (self.site_name, str(auth_id), str(user_id), content_type)
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(
+        self,
+        auth_id: int | str,
+        user_id: int | str,
+        content_type: str,
+        watermark: Watermark,
+    ) -> None:
+        key = (self.site_name, str(auth_id), str(user_id), content_type)
+        await asyncio.to_thread(self._set, key, watermark)
+
+
+class RedisWatermarkStore(WatermarkStore):
+    def __init__(self, site_name: str, redis_manager: RedisManager) -> None:
+        super().__init__(site_name)
+        self.redis = redis_manager
+
+    def _key(self, auth_id: int | str, user_id: int | str, content_type: str):
+        prefix = self.redis.KEY_PREFIX
+        return (
+            f"{prefix}:watermarks:{self.site_name}:{auth_id}:{user_id}:{content_type}"
+        )
+
+    async def get(
+        self, auth_id: int | str, user_id: int | str, content_type: str
+    ) -> Watermark | None:
+        value = await self.redis.get(self._key(auth_id, user_id, content_type))
+        return Watermark.from_dict(json.loads(value)) if value else None
+
+    async def set(
+        self,
+        auth_id: int | str,
+        user_id: int | str,
+        content_type: str,
+        watermark: Watermark,
+    ) -> None:
+        key = self._key(auth_id, user_id, content_type)
+        await self.redis.set(key, json.dumps(watermark.to_dict()))
+
+
+def create_watermark_store(settings: Watermarks, site_name: str) -> WatermarkStore:
+    """Create the watermark store selected in the settings.
+
+    Falls back to SQLite when the Redis backend is selected but Redis hasn't
+    been initialized.
+    """
+    if settings.backend == "redis":
+        from ultima_scraper_api.managers.redis import get_redis
+
+        redis_manager = get_redis()
+        if redis_manager:
+            return RedisWatermarkStore(site_name, redis_manager)
+        logger.warning("Redis is not initialized, storing watermarks in SQLite")
+    return SQLiteWatermarkStore(site_name, settings.path)
@@ -4,6 +4,7 @@ Provides site-agnostic WebSocket connection management with dependency injection
 for site-specific implementations.
 """
 
+from .buffer import MessageBuffer
 from .connection import WebSocketConnection
 from .manager import WebSocketManager
 from .protocol import WebSocketProtocol
@@ -12,4 +13,5 @@ __all__ = [
     "WebSocketManager",
     "WebSocketConnection",
     "WebSocketProtocol",
+    "MessageBuffer",
 ]
@@ -0,0 +1,186 @@
+"""Bounded buffer between a websocket's reader and its consumers.
+
+The reader appends every received message and goes straight back to reading,
+consumers take them in batches. When consumers fall behind and the buffer is
+full, the overflow policy decides what gives:
+
+- ``drop_oldest``: the oldest buffered message is discarded
+- ``block``: the reader waits for room, pushing back on the socket
+- ``spill``: messages go to an append-only file and are read back, in order,
+  once the consumers catch up. A spill file left by a previous run is replayed
+  first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, BinaryIO, Literal
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_oldest", "block", "spill"]
+
+
+class MessageBuffer:
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        overflow: OverflowPolicy = "drop_oldest",
+        spill_file: Path | None = None,
+    ) -> None:
+        """
+        Args:
+            capacity: Messages held in memory
+            overflow: What happens to messages arriving while the buffer is full
+            spill_file: Where the ``spill`` policy writes overflowing messages
+        """
+        if overflow == "spill" and spill_file is None:
+            raise ValueError("The spill overflow policy needs a spill_file")
+        self.capacity = max(1, capacity)
+        self.overflow = overflow
+        self.spill_file = spill_file
+        # (enqueued at, message), wall clock so spilled messages keep their age
+        self._items: deque[tuple[float, Any]] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._closed = False
+        self.dropped = 0
+        self.spilled = 0
+        self._spill_pending = 0
+        self._spill_offset = 0
+        # Kept open while spilling, a message per open() would stall the loop
+        self._spill_handle: BinaryIO | None = None
+        if spill_file and spill_file.exists():
+            with open(spill_file, "rb") as file:
+                self._spill_pending = sum(1 for _ in file)
+            if self._spill_pending:
+                logger.info(
+                    "Replaying %d spilled websocket messages from %s",
+                    self._spill_pending,
+                    spill_file,
+                )
+                self._readable.set()
+
+    def __len__(self) -> int:
+        return len(self._items) + self._spill_pending
+
+    def _is_full(self) -> bool:
+        return len(self._items) >= self.capacity
+
+    async def put(self, message: Any) -> None:
+        item = (time.time(), message)
+        if self._spill_pending or (self._is_full() and self.overflow == "spill"):
+            # Once spilling, everything goes to disk until it's read back
+            self._spill([item])
+        else:
+            if self._is_full():
+                if self.overflow == "block":
+                    while self._is_full() and not self._closed:
+                        self._writable.clear()
+                        await self._writable.wait()
+                else:
+                    self._items.popleft()
+                    self.dropped += 1
+            self._items.append(item)
+        self._readable.set()
+
+    async def get_batch(self, max_items: int) -> list[tuple[float, Any]]:
+        """Wait for messages and return up to ``max_items`` of them, oldest first.
+
+        Returns an empty list once the buffer is closed and drained, never
+        while it's open.
+        """
+        while not self._items:
+            if self._spill_pending:
+                # May come back empty if the spill file was lost or unreadable
+                self._unspill()
+                continue
+            if self._closed:
+                return []
+            self._readable.clear()
+            await self._readable.wait()
+        batch = [self._items.popleft() for _ in range(min(max_items, len(self._items)))]
+        self._writable.set()
+        return batch
+
+    def open(self) -> None:
+        self._closed = False
+
+    def close(self) -> None:
+        """Wake everyone up, get_batch returns what's left then an empty list."""
+        self._closed = True
+        if self._spill_handle:
+            self._spill_handle.flush()
+        self._readable.set()
+        self._writable.set()
+
+    def _spill(self, items: list[tuple[float, Any]]) -> None:
+        assert self.spill_file
+        if self._spill_handle is None:
+            self.spill_file.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_handle = open(self.spill_file, "ab")
+        for enqueued_at, message in items:
+            self._spill_handle.write(
+                orjson.dumps([enqueued_at, message], default=str) + b"\n"
+            )
+        self._spill_pending += len(items)
+        self.spilled += len(items)
+
+    def _unspill(self) -> None:
+        """Move up to ``capacity`` spilled messages back into memory."""
+        assert self.spill_file
+        if self._spill_handle:
+            self._spill_handle.flush()
+        try:
+            file = open(self.spill_file, "rb")
+        except OSError as e:
+            logger.warning(
+                "Lost %d spilled websocket messages: %s", self._spill_pending, e
+            )
+            self._spill_pending = self._spill_offset = 0
+            self._close_spill_handle()
+            return
+        with file:
+            file.seek(self._spill_offset)
+            while self._spill_pending and not self._is_full():
+                line = file.readline()
+                if not line:
+                    # Truncated behind our back
+                    self._spill_pending = 0
+                    break
+                self._spill_pending -= 1
+                try:
+                    enqueued_at, message = orjson.loads(line)
+                    enqueued_at = float(enqueued_at)
+                except (ValueError, TypeError):
+                    # Not JSON (orjson.JSONDecodeError) or not an [at, message] pair
+                    logger.warning("Skipping unreadable spilled websocket message")
+                    continue
+                self._items.append((enqueued_at, message))
+            self._spill_offset = file.tell()
+        if not self._spill_pending:
+            self._close_spill_handle()
+            self.spill_file.unlink(missing_ok=True)
+            self._spill_offset = 0
+
+    def _close_spill_handle(self) -> None:
+        if self._spill_handle:
+            self._spill_handle.close()
+            self._spill_handle = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "depth": len(self),
+            "capacity": self.capacity,
+            "overflow": self.overflow,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "spill_pending": self._spill_pending,
+        }
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import json
 import logging
+import time
 from collections import deque
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from ultima_scraper_api.config import WebSocketBuffer
+from ultima_scraper_api.managers.metrics_manager import Histogram
+from ultima_scraper_api.managers.websocket_manager.buffer import MessageBuffer
 
 if TYPE_CHECKING:
     from ultima_scraper_api.managers.redis import RedisManager, WebSocketStorage
@@ -26,6 +33,10 @@ class WebSocketConnection:
     - Connection statistics
     - Event callbacks
     - Automatic reconnection
+
+    Reading and dispatching are decoupled: the listen loop only receives
+    messages into a bounded buffer, a dispatch task hands them to subscribers,
+    Redis and callbacks in batches, so a slow consumer never stalls the socket.
     """
 
     def __init__(
@@ -37,6 +48,9 @@ class WebSocketConnection:
         initial_reconnect_delay: float = 1.0,
         max_reconnect_delay: float = 60.0,
         record_all_messages: bool = True,
+        max_history: int | None = 10_000,
+        buffer: WebSocketBuffer | None = None,
+        spill_file: Path | None = None,
     ) -> None:
         """Initialize WebSocket connection.
 
@@ -48,14 +62,19 @@ class WebSocketConnection:
             initial_reconnect_delay: Initial delay before reconnecting (seconds)
             max_reconnect_delay: Maximum reconnection delay (seconds)
             record_all_messages: Whether to record all messages in history
+            max_history: Messages and events kept in history, oldest are
+                dropped first (None = no limit)
+            buffer: Capacity, overflow policy and batch size of the buffer
+                between the reader and the consumers
+            spill_file: File used by the ``spill`` overflow policy
         """
         self.websocket_impl = websocket_impl
         self.redis_manager = redis_manager
         self.redis_channel = redis_channel
 
-        # Message history - NO LIMIT! Record everything
-        self._message_history: list[dict[str, Any]] = []
-        self._event_history: list[dict[str, Any]] = []
+        # Message history, bounded so long-running listeners don't grow forever
+        self._message_history: deque[dict[str, Any]] = deque(maxlen=max_history)
+        self._event_history: deque[dict[str, Any]] = deque(maxlen=max_history)
         self.record_all_messages = record_all_messages
 
         # For backwards compatibility, maintain recent buffer
@@ -100,8 +119,23 @@ class WebSocketConnection:
         self._last_content_event_time: float | None = None
         self.content_stale_threshold: float = 1 * 300  # 5 minutes
 
+        # Received messages waiting for subscribers, Redis and callbacks
+        buffer = buffer or WebSocketBuffer()
+        if buffer.overflow == "spill" and spill_file is None:
+            spill_file = buffer.spill_dir / f"{id(self):x}.jsonl"
+        self._buffer = MessageBuffer(
+            buffer.capacity,
+            buffer.overflow,
+            spill_file if buffer.overflow == "spill" else None,
+        )
+        self.batch_size = max(1, buffer.batch_size)
+        # Seconds spent per stage: waiting in the buffer, storing a batch in
+        # Redis, running the callbacks of a batch
+        self._lag = {stage: Histogram() for stage in ("buffer", "redis", "callbacks")}
+
         # Task management
         self._listen_task: asyncio.Task[None] | None = None
+        self._dispatch_task: asyncio.Task[None] | None = None
         self._health_task: asyncio.Task[None] | None = None
         self._ws_lock = asyncio.Lock()
 
@@ -116,6 +150,9 @@ class WebSocketConnection:
                 return
 
             self._should_stop = False
+            self._buffer.open()
+            if not self._dispatch_task or self._dispatch_task.done():
+                self._dispatch_task = asyncio.create_task(self._dispatch_loop())
             self._listen_task = asyncio.create_task(self._listen_loop())
             self._health_task = asyncio.create_task(self._health_monitor())
             logger.debug("WebSocket connection started")
@@ -152,13 +189,21 @@ class WebSocketConnection:
                 except asyncio.CancelledError:
                     pass
 
+            # Give the dispatcher a moment to deliver what was already received
+            self._buffer.close()
+            if self._dispatch_task:
+                try:
+                    await asyncio.wait_for(self._dispatch_task, timeout=5)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    logger.warning(
+                        f"Stopped with {len(self._buffer)} websocket messages undelivered"
+                    )
+
             await self._publish_event({"type": "stopped"})
             logger.info("WebSocket connection stopped")
 
     async def _listen_loop(self) -> None:
         """Main listening loop with automatic reconnection."""
-        import time
-
         while not self._should_stop:
             try:
                 await self._connect_and_listen()
@@ -208,8 +253,6 @@ class WebSocketConnection:
 
     async def _connect_and_listen(self) -> None:
         """Establish connection and listen for messages."""
-        import time
-
         # Connect using site-specific implementation
         await self.websocket_impl.connect()
 
@@ -236,14 +279,8 @@ class WebSocketConnection:
 
                 self._recent.append(msg)
 
-                # Publish to subscribers
-                await self._publish_to_subscribers(msg)
-
-                # Publish to Redis if available
-                await self._publish_to_redis(msg)
-
-                # Trigger callbacks
-                await self._trigger_callbacks("message", msg)
+                # Subscribers, Redis and callbacks are served by _dispatch_loop
+                await self._buffer.put(msg)
 
                 # Periodic logging
                 if self._messages_received % 100 == 0:
@@ -262,6 +299,41 @@ class WebSocketConnection:
             )
             raise  # Re-raise to trigger reconnection
 
+    async def _dispatch_loop(self) -> None:
+        """Deliver buffered messages in batches until the buffer is closed.
+
+        Each batch goes to subscribers first, then Redis and the callbacks run
+        concurrently. Callbacks still see messages one at a time, in order.
+        """
+        while True:
+            batch = await self._buffer.get_batch(self.batch_size)
+            if not batch:
+                break
+            now = time.time()
+            messages: list[dict[str, Any]] = []
+            for enqueued_at, msg in batch:
+                self._lag["buffer"].observe(max(0.0, now - enqueued_at))
+                messages.append(msg)
+            for msg in messages:
+                await self._publish_to_subscribers(msg)
+            await asyncio.gather(
+                self._timed("redis", self._publish_to_redis(messages)),
+                self._timed("callbacks", self._dispatch_callbacks(messages)),
+            )
+
+    async def _timed(self, stage: str, awaitable: Awaitable[None]) -> None:
+        started_at = time.monotonic()
+        try:
+            await awaitable
+        except Exception as e:
+            logger.error(f"WebSocket {stage} dispatch failed: {e}", exc_info=True)
+        finally:
+            self._lag[stage].observe(time.monotonic() - started_at)
+
+    async def _dispatch_callbacks(self, messages: list[dict[str, Any]]) -> None:
+        for msg in messages:
+            await self._trigger_callbacks("message", msg)
+
     # ------------------------------------------------------------------
     # Content-event staleness tracking
     # ------------------------------------------------------------------
@@ -275,8 +347,6 @@ class WebSocketConnection:
         but healthy connection and a stale one where the auth token has
         expired server-side.
         """
-        import time
-
         self._last_content_event_time = time.time()
 
     async def force_reconnect(self, reason: str = "manual") -> None:
@@ -301,8 +371,6 @@ class WebSocketConnection:
         but stops routing events.  Force-disconnect to trigger a
         reconnect (which will refresh credentials).
         """
-        import time
-
         check_interval = 300  # 5 minutes
         try:
             while not self._should_stop:
@@ -352,8 +420,8 @@ class WebSocketConnection:
         # Remove dead subscribers
         self._subscribers -= dead_queues
 
-    async def _publish_to_redis(self, message: dict[str, Any]) -> None:
-        """Publish message to Redis and store in WebSocketStorage."""
+    async def _publish_to_redis(self, messages: list[dict[str, Any]]) -> None:
+        """Store a batch of messages in WebSocketStorage, or publish them to Redis."""
         if not self.redis_manager:
             logger.warning(
                 f"WebSocketConnection: No redis_manager, cannot store messages"
@@ -386,33 +454,41 @@ class WebSocketConnection:
                     self._storage_initialized = True  # Don't retry every time
                     return
 
-            # Store message in WebSocketStorage
+            # Store messages in WebSocketStorage, two round-trips per batch
             if self._websocket_storage:
-                was_stored, _ = await self._websocket_storage.store_message(
-                    message,
+                results = await self._websocket_storage.store_messages(
+                    messages,
                     source_id=self.redis_channel,
                 )
-                if was_stored:
-                    self._redis_published_count += 1
+                self._redis_published_count += sum(
+                    1 for was_stored, _ in results if was_stored
+                )
             else:
                 # Fallback to simple pub/sub if storage failed
                 if self.redis_channel:
-                    success = await self.redis_manager.publish_json(
+                    timestamp = datetime.now(timezone.utc).isoformat()
+                    success = await self.redis_manager.publish_many(
                         self.redis_channel,
-                        {
-                            "event": "websocket_message",
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "data": message,
-                        },
+                        [
+                            json.dumps(
+                                {
+                                    "event": "websocket_message",
+                                    "timestamp": timestamp,
+                                    "data": message,
+                                },
+                                default=str,
+                            )
+                            for message in messages
+                        ],
                     )
                     if success:
-                        self._redis_published_count += 1
+                        self._redis_published_count += len(messages)
                     else:
-                        self._redis_failed_count += 1
+                        self._redis_failed_count += len(messages)
 
         except Exception as e:
             logger.error(f"Failed to publish to Redis: {e}", exc_info=True)
-            self._redis_failed_count += 1
+            self._redis_failed_count += len(messages)
 
     async def _publish_event(self, event: dict[str, Any]) -> None:
         """Publish event to subscribers and store in history."""
@@ -495,21 +571,21 @@ class WebSocketConnection:
 
     @property
     def message_history(self) -> list[dict[str, Any]]:
-        """Get complete message history.
+        """Get message history.
 
         Returns:
-            List of all received messages
+            List of received messages, up to max_history
         """
-        return self._message_history.copy()
+        return list(self._message_history)
 
     @property
     def event_history(self) -> list[dict[str, Any]]:
-        """Get complete event history.
+        """Get event history.
 
         Returns:
-            List of all events
+            List of events, up to max_history
         """
-        return self._event_history.copy()
+        return list(self._event_history)
 
     @property
     def recent_messages(self) -> list[Any]:
@@ -536,4 +612,6 @@ class WebSocketConnection:
             "last_message_time": self._last_message_time,
             "is_connected": self.is_connected,
             "reconnect_attempts": self._reconnect_attempts,
+            "buffer": self._buffer.snapshot(),
+            "lag": {stage: lag.snapshot() for stage, lag in self._lag.items()},
         }
@@ -104,6 +104,15 @@ class WebSocketManager:
             auth_id = getattr(auth, "id", "unknown")
             kwargs["redis_channel"] = f"{site_name}:ws:{auth_id}"
 
+        if "max_history" not in kwargs and self.config:
+            kwargs["max_history"] = self.config.settings.registry.websocket_history
+
+        if "buffer" not in kwargs and self.config:
+            buffer = self.config.settings.websocket_buffer
+            kwargs["buffer"] = buffer
+            # Stable per connection, so a restart replays what was spilled
+            kwargs.setdefault("spill_file", buffer.spill_dir / f"{connection_id}.jsonl")
+
         # Create connection wrapper
         connection = WebSocketConnection(
             websocket_impl=websocket_impl,